@@ -0,0 +1,67 @@
+import timeit
+from datetime import date
+
+from dateparser_ko.parse import create_full_dates
+from dateparser_ko.rel_closures import months, months_ago, years, years_ago, last_month
+from dateparser_ko.types import DateObject
+
+from stages import TODAY
+
+try:
+    from dateutil.relativedelta import relativedelta
+except ImportError:
+    relativedelta = None
+
+EMPTY = DateObject(y=0, m=0, d=0)
+GIVEN = DateObject(y=2024, m=1, d=31)
+MONTH = DateObject(y=2024, m=2, d=0)
+
+CALLS = {
+    "months": lambda: months(3, EMPTY, TODAY),
+    "months (given)": lambda: months(3, GIVEN, TODAY),
+    "months_ago": lambda: months_ago(3, MONTH, TODAY),
+    "years": lambda: years(2, EMPTY, TODAY),
+    "years (given)": lambda: years(2, GIVEN, TODAY),
+    "years_ago": lambda: years_ago(2, MONTH, TODAY),
+    "last_month": lambda: last_month(None, EMPTY, TODAY),
+    "create_full_dates": lambda: create_full_dates([MONTH], TODAY)
+}
+
+
+def dateutil_calls() -> dict:
+    """The relativedelta arithmetic the closures used before the calendar module."""
+    def month_range(y, m):
+        start = date(y, m, 1)
+        return start, (start + relativedelta(months=1)).replace(day=1) - relativedelta(days=1)
+
+    return {
+        "months": lambda: (TODAY.replace(day=1) - relativedelta(days=1)) - relativedelta(months=3)
+        + relativedelta(months=1),
+        "months (given)": lambda: (date(2024, 1, 31) + relativedelta(months=3)).replace(day=1)
+        - relativedelta(days=1),
+        "months_ago": lambda: date(2024, 2, 1) - relativedelta(months=3) + relativedelta(months=1)
+        - relativedelta(days=1),
+        "years": lambda: TODAY.replace(month=1, day=1) - relativedelta(days=1) - relativedelta(years=2)
+        + relativedelta(years=1),
+        "years (given)": lambda: (date(2024, 1, 31) + relativedelta(years=2)).replace(day=1) - relativedelta(days=1),
+        "years_ago": lambda: date(2024, 2, 1) - relativedelta(years=2) + relativedelta(months=1)
+        - relativedelta(days=1),
+        "last_month": lambda: TODAY - relativedelta(months=1),
+        "create_full_dates": lambda: month_range(2024, 2)
+    }
+
+
+def per_call(func, number: int = 100_000) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+if __name__ == "__main__":
+    before = dateutil_calls() if relativedelta else {}
+    print(f"{'ns/call':>18}  {'integer':>9}" + (f"  {'dateutil':>9}  speed-up" if before else ""))
+    for name, call in CALLS.items():
+        now = per_call(call)
+        line = f"{name:>18}  {now * 1e9:9.0f}"
+        if before:
+            then = per_call(before[name])
+            line += f"  {then * 1e9:9.0f}  x{then / now:.1f}"
+        print(line)
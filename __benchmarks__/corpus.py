@@ -0,0 +1,112 @@
+import random
+from typing import List
+
+from dateparser_ko.keywords import REL_WORDS, NUMB_WORDS, KW_QUARTER, KW_MONTHS, KW_MONTHS_AGO, KW_YEARS, \
+    KW_YEARS_AGO, KW_FIRST_HALF, KW_LAST_HALF
+from dateparser_ko.stopwords import STOPWORDS
+from dateparser_ko.symbols import ALL_SYMBOLS
+
+SUBJECTS = ["매출", "실적", "영업이익", "방문자 수", "주문 건수", "재고 현황", "상위 상품", "고객 문의"]
+TAILS = ["보고", "분석", "요약", "추이", "비교", "현황"]
+DATE_FREE = [
+    "상위 상품 목록", "고객 문의 내역 정리", "신제품 출시 계획", "물류 센터 이전 안내", "주요 거래처 목록",
+    "서울 지점 직원 채용", "반품 처리 절차 개선", "오류 로그 확인", "사용자 의견 모음", "회의실 예약 현황"
+]
+
+# Keywords that only make sense after a count ("3개월", "1분기") or a year ("2024년 상반기").
+COUNTED = {KW_QUARTER: (1, 4), KW_MONTHS: (1, 12), KW_MONTHS_AGO: (1, 12), KW_YEARS: (1, 5), KW_YEARS_AGO: (1, 5)}
+YEARED = {KW_FIRST_HALF, KW_LAST_HALF}
+NUMERAL_MONTHS = NUMB_WORDS[:10]
+
+
+def relative_phrase(rng: random.Random, keyword: str) -> str:
+    if keyword in COUNTED:
+        low, high = COUNTED[keyword]
+        term = f"{rng.randint(low, high)}{_maybe_spaced(rng, keyword)}"
+    elif keyword in YEARED:
+        term = f"{rng.randint(2000, 2030)}년 {_maybe_spaced(rng, keyword)}"
+    else:
+        term = _maybe_spaced(rng, keyword)
+
+    return f"{term} {_subject(rng)}"
+
+
+def absolute_phrase(rng: random.Random, yearless: bool = True) -> str:
+    y, m, d = rng.randint(2000, 2030), rng.randint(1, 12), rng.randint(1, 28)
+    forms = [f"{y}년", f"{y}년 {m}월", f"{y}년 {m}월 {d}일", f"{y}년 {m}월~{min(m + 3, 12)}월"]
+    if yearless:
+        forms += [f"{m}월", f"{m}월 {d}일"]
+    return f"{rng.choice(forms)} {_subject(rng)}"
+
+
+def symbol_phrase(rng: random.Random) -> str:
+    y, m, d = rng.randint(2000, 2030), rng.randint(1, 12), rng.randint(1, 28)
+    sep = rng.choice(ALL_SYMBOLS)
+    return f"{y}{sep}{m:02d}{sep}{d:02d} {_subject(rng)}"
+
+
+def numeral_phrase(rng: random.Random, yearless: bool = True) -> str:
+    year = "" if yearless else f"{rng.randint(2000, 2030)}년 "
+    return f"{year}{rng.choice(NUMERAL_MONTHS)}월 {_subject(rng)}"
+
+
+def date_free_phrase(rng: random.Random) -> str:
+    return rng.choice(DATE_FREE)
+
+
+KINDS = {
+    "relative": lambda rng: relative_phrase(rng, rng.choice(REL_WORDS)),
+    "absolute": absolute_phrase,
+    "symbol": symbol_phrase,
+    "numeral": numeral_phrase,
+    "date_free": date_free_phrase
+}
+
+# Inside one long text a yearless date merges with the next year it meets, so long
+# texts only use dates that carry their own year.
+LONG_KINDS = {
+    **KINDS,
+    "absolute": lambda rng: absolute_phrase(rng, yearless=False),
+    "numeral": lambda rng: numeral_phrase(rng, yearless=False)
+}
+
+
+def generate(size: int, seed: int = 0) -> List[str]:
+    """Seeded corpus of short Korean texts; the first entries use every relative keyword once."""
+    rng = random.Random(seed)
+    texts = [relative_phrase(rng, keyword) for keyword in REL_WORDS][:size]
+    kinds = list(KINDS.values())
+    while len(texts) < size:
+        texts.append(rng.choice(kinds)(rng))
+
+    return texts
+
+
+def long_text(length: int, seed: int = 0) -> str:
+    """Concatenate corpus entries into one text of exactly ``length`` characters."""
+    rng = random.Random(seed)
+    kinds = list(LONG_KINDS.values())
+    parts = []
+    size = 0
+    while size < length:
+        part = rng.choice(kinds)(rng)
+        parts.append(part)
+        size += len(part) + 1
+
+    return " ".join(parts)[:length]
+
+
+def _maybe_spaced(rng: random.Random, keyword: str) -> str:
+    if len(keyword) > 1 and rng.random() < 0.2:
+        i = rng.randint(1, len(keyword) - 1)
+        return f"{keyword[:i]} {keyword[i:]}"
+
+    return keyword
+
+
+def _subject(rng: random.Random) -> str:
+    subject = rng.choice(SUBJECTS)
+    if rng.random() < 0.3:
+        subject += rng.choice(STOPWORDS)
+
+    return f"{subject} {rng.choice(TAILS)}"
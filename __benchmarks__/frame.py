@@ -0,0 +1,28 @@
+import random
+import time
+
+import pandas as pd
+
+from dateparser_ko import parse, parse_series
+
+from corpus import generate
+from stages import TODAY
+
+
+def timed(label: str, run, rows: int) -> float:
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+    print(f"{label:>22}  {rows / seconds:10.0f} rows/s")
+    return seconds
+
+
+if __name__ == "__main__":
+    # 200k rows drawn from 20k distinct titles, like a typical report-title column.
+    rng = random.Random(0)
+    titles = generate(20_000)
+    column = pd.Series([rng.choice(titles) for _ in range(200_000)])
+
+    applied = timed(".apply(parse)", lambda: column.apply(lambda text: parse(text, now=TODAY)), len(column))
+    vectorized = timed("parse_series", lambda: parse_series(column, now=TODAY), len(column))
+    print(f"{applied / vectorized:.1f}x faster")
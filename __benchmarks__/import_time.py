@@ -0,0 +1,50 @@
+import statistics
+import subprocess
+import sys
+
+# Cold-start budget for `import dateparser_ko`, in milliseconds of cumulative import time.
+IMPORT_BUDGET_MS = 60
+# Modules that only the optional entry points need; a plain import must not load them.
+DEFERRED = ("asyncio", "concurrent.futures", "csv", "json", "numpy", "pandas", "dateutil")
+
+
+def run(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *options, "-c", code], capture_output=True, text=True, check=True)
+
+
+def import_ms(runs: int = 7) -> float:
+    """Median cumulative -X importtime of `import dateparser_ko` in fresh interpreters."""
+    samples = []
+    for _ in range(runs):
+        last = run("import dateparser_ko", "-X", "importtime").stderr.strip().splitlines()[-1]
+        samples.append(int(last.split("|")[1]) / 1000)
+
+    return statistics.median(samples)
+
+
+def loaded_modules(code: str) -> list:
+    # Closures are imported through importlib, which -X importtime does not report,
+    # so the loaded modules are read from sys.modules instead.
+    return run(code + "\nimport sys\nprint('\\n'.join(sys.modules))").stdout.split()
+
+
+if __name__ == "__main__":
+    package = import_ms()
+    print(f"import dateparser_ko                  {package:7.1f} ms")
+
+    after_parse = loaded_modules("import dateparser_ko\ndateparser_ko.parse('2024년 3월 지난달 매출')")
+    closures = [module for module in after_parse if module.split(".")[1:2] in (["rel_closures"], ["abs_closures"])
+                and module.count(".") == 2]
+    print(f"closure modules loaded by one parse   {len(closures):7d}")
+
+    loaded = loaded_modules("import dateparser_ko")
+    eager = [name for name in DEFERRED if any(module == name or module.startswith(name + ".") for module in loaded)]
+    failed = False
+    if eager:
+        print(f"imported eagerly: {', '.join(eager)}", file=sys.stderr)
+        failed = True
+    if package > IMPORT_BUDGET_MS:
+        print(f"import takes {package:.1f} ms, budget is {IMPORT_BUDGET_MS} ms", file=sys.stderr)
+        failed = True
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,26 @@
+import gc
+import tracemalloc
+
+from dateparser_ko import parse
+
+from corpus import generate
+from stages import TODAY
+
+
+def retained_bytes(texts: list, debug: bool) -> float:
+    """Average bytes kept alive per result when every result is held in memory."""
+    gc.collect()
+    tracemalloc.start()
+    results = [parse(text, now=TODAY, debug=debug) for text in texts]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size / len(texts)
+
+
+if __name__ == "__main__":
+    texts = generate(20_000)
+    full = retained_bytes(texts, debug=True)
+    lean = retained_bytes(texts, debug=False)
+    print(f"{'debug=True':>12}  {full:8.0f} bytes/result")
+    print(f"{'debug=False':>12}  {lean:8.0f} bytes/result  ({full / lean:.1f}x smaller)")
@@ -0,0 +1,22 @@
+import os
+import time
+
+from dateparser_ko import parse_many, parse_parallel
+
+from corpus import generate
+
+
+def bench(label: str, run, texts: list):
+    start = time.perf_counter()
+    count = sum(1 for _ in run(texts))
+    seconds = time.perf_counter() - start
+    print(f"{label:>12}  {count / seconds:10.0f} texts/s")
+
+
+if __name__ == "__main__":
+    texts = generate(50_000)
+    bench("serial", parse_many, texts)
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        bench(f"{workers} workers", lambda t: parse_parallel(t, workers=workers, chunksize=1000), texts)
+        workers *= 2
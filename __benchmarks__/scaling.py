@@ -0,0 +1,38 @@
+import sys
+
+from dateparser_ko import parse_document
+
+from corpus import long_text
+from stages import STAGES, TODAY, prepare, time_stage
+
+LENGTHS = [1_000, 2_000, 4_000, 8_000, 16_000, 32_000]
+# Allowed growth of the per-character cost between the shortest and longest input.
+MAX_GROWTH = 2.0
+
+CHECKS = {**STAGES, "parse_document": lambda s: parse_document(s["text"], now=TODAY)}
+
+
+def scaling_curves(lengths=LENGTHS, seeds=range(3)) -> dict:
+    curves = {name: [] for name in CHECKS}
+    for length in lengths:
+        inputs = [prepare(long_text(length, seed)) for seed in seeds]
+        for name, stage in CHECKS.items():
+            curves[name].append(time_stage(stage, inputs) / (length * len(inputs)))
+
+    return curves
+
+
+if __name__ == "__main__":
+    curves = scaling_curves()
+    print(f"{'ns/char':>18}" + "".join(f"{length:>9}" for length in LENGTHS) + "   growth")
+
+    failed = []
+    for name, curve in curves.items():
+        growth = curve[-1] / curve[0]
+        print(f"{name:>18}" + "".join(f"{v * 1e9:9.1f}" for v in curve) + f"   x{growth:.2f}")
+        if growth > MAX_GROWTH:
+            failed.append(name)
+
+    if failed:
+        print(f"not linear: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
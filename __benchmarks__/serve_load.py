@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from corpus import generate
+
+NOW = "2024-07-01"
+
+
+async def client(port: int, texts: list, batch: int, latencies: list):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for i in range(0, len(texts), batch):
+        chunk = texts[i:i + batch]
+        payload = {"text": chunk[0]} if batch == 1 else {"texts": chunk}
+        body = json.dumps({**payload, "now": NOW}, ensure_ascii=False).encode("utf-8")
+
+        start = time.perf_counter()
+        writer.write(f"POST /parse HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n"
+                     .encode("latin-1") + body)
+        await writer.drain()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line == b"\r\n":
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+
+    writer.close()
+
+
+async def health(port: int) -> dict:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /health HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return json.loads(response.partition(b"\r\n\r\n")[2])
+
+
+async def load(port: int, texts: list, clients: int, batch: int) -> tuple:
+    latencies = []
+    share = len(texts) // clients
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, texts[i * share:(i + 1) * share], batch, latencies) for i in range(clients)))
+    return time.perf_counter() - start, sorted(latencies), await health(port)
+
+
+def wait_for_port(proc: subprocess.Popen) -> int:
+    line = proc.stderr.readline().decode()
+    if "listening on" not in line:
+        raise SystemExit(f"server did not start: {line}")
+    return int(line.rsplit(":", 1)[1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--texts", type=int, default=20_000)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--batch", type=int, default=1, help="texts per request")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, ["..", os.environ.get("PYTHONPATH")]))}
+    proc = subprocess.Popen([sys.executable, "-m", "dateparser_ko", "serve", "--port", "0",
+                             "--workers", str(args.workers), "--window-ms", str(args.window_ms)],
+                            stderr=subprocess.PIPE, env=env)
+    try:
+        port = wait_for_port(proc)
+        seconds, latencies, metrics = asyncio.run(load(port, generate(args.texts), args.clients, args.batch))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    def ms(q: float) -> float:
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+    texts = args.clients * (args.texts // args.clients)
+    print(f"{args.clients} clients, {args.batch} texts/request, {args.workers} workers, {args.window_ms} ms window")
+    print(f"{len(latencies) / seconds:10.0f} requests/s  {texts / seconds:10.0f} texts/s")
+    print(f"client latency ms  p50 {ms(0.5):.2f}  p90 {ms(0.9):.2f}  p99 {ms(0.99):.2f}  max {ms(1.0):.2f}")
+    print(f"server: {metrics['batches']} batches, mean size {metrics['mean_batch_size']}, "
+          f"latency ms {metrics['latency_ms']}")
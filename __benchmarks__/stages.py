@@ -0,0 +1,53 @@
+import timeit
+from datetime import date
+
+from dateparser_ko.parse import clean_text, remove_stopwords, parse_year, wrap_terms, tag_chars, generate_tokens, \
+    normalize_chars, find_dates, create_full_dates
+
+from corpus import generate
+
+TODAY = date(2024, 7, 1)
+
+
+def prepare(text: str) -> dict:
+    """Run the pipeline once and keep the input of every stage."""
+    collapsed = " ".join(text.split())
+    cleaned = remove_stopwords(collapsed)
+    spans = sorted(parse_year(cleaned) + wrap_terms(cleaned))
+    tags = tag_chars(cleaned, spans)
+    tokens = generate_tokens(tags, cleaned)
+    normal_tokens = normalize_chars(tokens)
+    dates = find_dates(normal_tokens, TODAY)
+    return {
+        "text": text, "collapsed": collapsed, "cleaned": cleaned, "spans": spans, "tags": tags, "tokens": tokens,
+        "normal_tokens": normal_tokens, "dates": dates
+    }
+
+
+STAGES = {
+    "clean_text": lambda s: clean_text(s["text"]),
+    "remove_stopwords": lambda s: remove_stopwords(s["collapsed"]),
+    "parse_year": lambda s: parse_year(s["cleaned"]),
+    "wrap_terms": lambda s: wrap_terms(s["cleaned"]),
+    "tag_chars": lambda s: tag_chars(s["cleaned"], s["spans"]),
+    "generate_tokens": lambda s: generate_tokens(s["tags"], s["cleaned"]),
+    "normalize_chars": lambda s: normalize_chars(s["tokens"]),
+    "find_dates": lambda s: find_dates(s["normal_tokens"], TODAY),
+    "create_full_dates": lambda s: create_full_dates(s["dates"], TODAY)
+}
+
+
+def time_stage(stage, inputs: list, repeat: int = 3) -> float:
+    """Best-of-``repeat`` seconds for running ``stage`` over all ``inputs``."""
+    return min(timeit.repeat(lambda: [stage(s) for s in inputs], number=1, repeat=repeat))
+
+
+if __name__ == "__main__":
+    inputs = [prepare(text) for text in generate(20_000)]
+    chars = sum(len(s["text"]) for s in inputs)
+    total = 0.0
+    for name, stage in STAGES.items():
+        seconds = time_stage(stage, inputs)
+        total += seconds
+        print(f"{name:>18}  {seconds / len(inputs) * 1e6:8.2f} us/text  {seconds / chars * 1e9:8.1f} ns/char")
+    print(f"{'total':>18}  {total / len(inputs) * 1e6:8.2f} us/text")
@@ -0,0 +1,35 @@
+import os
+import sys
+import sysconfig
+import time
+
+from dateparser_ko import parse_many, parse_threaded
+
+from corpus import generate
+
+
+def gil_enabled() -> bool:
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_enabled is None else is_enabled()
+
+
+def bench(label: str, run, texts: list, baseline: float = 0.0) -> float:
+    start = time.perf_counter()
+    count = len(run(texts))
+    rate = count / (time.perf_counter() - start)
+    print(f"{label:>12}  {rate:10.0f} texts/s" + (f"  x{rate / baseline:.2f}" if baseline else ""))
+    return rate
+
+
+if __name__ == "__main__":
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    print(f"Python {sys.version.split()[0]}, {'free-threaded' if free_threaded else 'GIL'} build, "
+          f"GIL {'enabled' if gil_enabled() else 'disabled'}, {os.cpu_count()} CPUs")
+
+    texts = generate(50_000)
+    parse_many(texts[:1000])
+    serial = bench("serial", parse_many, texts)
+    workers = 1
+    while workers <= max(os.cpu_count() or 1, 4):
+        bench(f"{workers} threads", lambda t: parse_threaded(t, workers=workers, chunksize=1000), texts, serial)
+        workers *= 2
@@ -0,0 +1,29 @@
+import random
+import time
+
+from dateparser_ko import parse, parse_many
+
+from corpus import generate, symbol_phrase
+from stages import TODAY
+
+
+def bench(label: str, run, texts: list):
+    start = time.perf_counter()
+    run(texts)
+    seconds = time.perf_counter() - start
+    chars = sum(len(text) for text in texts)
+    print(f"{label:>24}  {len(texts) / seconds:10.0f} texts/s  {chars / seconds / 1e6:6.2f} Mchar/s")
+
+
+if __name__ == "__main__":
+    texts = generate(50_000)
+    repeated = generate(5_000) * 10
+    bench("parse per text", lambda batch: [parse(text, now=TODAY) for text in batch], texts)
+    bench("parse_many", lambda batch: parse_many(batch, now=TODAY), texts)
+    bench("parse_many, 10x repeats", lambda batch: parse_many(batch, now=TODAY), repeated)
+
+    # 2024-06-15 and the like resolve without the pipeline when only dates are asked for.
+    rng = random.Random(0)
+    numeric = [symbol_phrase(rng) for _ in range(50_000)]
+    bench("numeric dates, debug", lambda batch: [parse(text, now=TODAY) for text in batch], numeric)
+    bench("numeric dates, fast path", lambda batch: [parse(text, now=TODAY, debug=False) for text in batch], numeric)
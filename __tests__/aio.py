@@ -0,0 +1,68 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "__benchmarks__"))
+
+from dateparser_ko import parse_many, aparse, aparse_many, AsyncParser
+
+from corpus import generate
+
+LONG_TEXT = " ".join(["2024년 3월부터 6월까지 지난 분기 매출과 올해 상반기 실적 보고"] * 40)
+# Distinct texts, so parse_many cannot fold the batch into a single parse.
+LONG_TEXTS = [" ".join(generate(40, seed)) for seed in range(200)]
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+
+    return worst
+
+
+async def check_loop_latency():
+    stop = asyncio.Event()
+    lag = asyncio.create_task(measure_loop_lag(stop))
+    results = await aparse_many(LONG_TEXTS)
+    stop.set()
+    worst = await lag
+
+    assert len(set(LONG_TEXTS)) == len(LONG_TEXTS)
+    assert results == parse_many(LONG_TEXTS)
+    assert worst < 0.05, f"event loop stalled for {worst * 1000:.1f} ms"
+    print(f"worst event loop lag while parsing: {worst * 1000:.1f} ms")
+
+
+async def check_inline_and_single():
+    result = await aparse("지난달 매출")
+    assert result == parse_many(["지난달 매출"])[0]
+
+
+async def check_timeout_and_cancel():
+    parser = AsyncParser(max_in_flight=1, chunksize=1)
+    try:
+        await parser.parse_many([LONG_TEXT] * 50, timeout=0.001)
+        raise AssertionError("timeout was not raised")
+    except asyncio.TimeoutError:
+        pass
+
+    task = asyncio.create_task(parser.parse_many([LONG_TEXT] * 50))
+    await asyncio.sleep(0)
+    task.cancel()
+    try:
+        await task
+        raise AssertionError("task was not cancelled")
+    except asyncio.CancelledError:
+        pass
+
+    # The in-flight limit must be released after a timeout or cancellation.
+    assert len(await parser.parse_many([LONG_TEXT] * 3, timeout=10)) == 3
+
+
+asyncio.run(check_loop_latency())
+asyncio.run(check_inline_and_single())
+asyncio.run(check_timeout_and_cancel())
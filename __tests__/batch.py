@@ -0,0 +1,35 @@
+from datetime import date
+
+from dateparser_ko import parse_many, parse_stream
+
+TODAY = date(2024, 7, 1)
+TEXTS = ["지난달 매출", "지난달  매출을", "날짜 없는 문장", "지난달 매출"]
+
+
+def check_duplicates_get_their_own_results():
+    for lazy in (False, True):
+        results = list(parse_many(TEXTS, now=TODAY, lazy=lazy))
+        assert results[0] is not results[1] and results[0] is not results[3]
+        assert results[0]["found_dates"][0] is not results[3]["found_dates"][0]
+
+        results[0]["found_dates"].clear()
+        results[1]["found_dates"][0]["y"] = 0
+        assert results[3]["found_dates"] == [{"y": 2024, "m": 6, "d": 1}, {"y": 2024, "m": 6, "d": 30}]
+
+
+def check_lazy_memo_is_not_shared_with_callers():
+    results = parse_many(TEXTS, now=TODAY, lazy=True)
+    first = next(results)
+    first["found_dates"].clear()
+    assert [r["found_dates"] for r in results][-1] == [{"y": 2024, "m": 6, "d": 1}, {"y": 2024, "m": 6, "d": 30}]
+
+
+def check_stream_records_are_independent():
+    records = list(parse_stream(["지난달 매출", "x", "지난달 매출"], now=TODAY))
+    records[0].result["found_dates"].clear()
+    assert records[2].result["found_dates"] == [{"y": 2024, "m": 6, "d": 1}, {"y": 2024, "m": 6, "d": 30}]
+
+
+check_duplicates_get_their_own_results()
+check_lazy_memo_is_not_shared_with_callers()
+check_stream_records_are_independent()
@@ -0,0 +1,42 @@
+from datetime import date
+
+from dateparser_ko import parse, rel_closures
+from dateparser_ko.rel_closures.months import months
+from dateparser_ko.rel_closures.months_ago import months_ago
+from dateparser_ko.rel_closures.years import years
+from dateparser_ko.rel_closures.years_ago import years_ago
+from dateparser_ko.types import Date, DateObject
+
+TODAY = date(2024, 7, 1)
+
+
+def check_counts_outside_the_calendar():
+    # A count that moves past year 1 or 9999 gives no date instead of raising.
+    for text in ["20240615개월전", "199992024년전", "199992024개년", "20240615개월"]:
+        assert parse(text, now=TODAY, debug=False) == (), text
+
+    empty = DateObject(y=0, m=0, d=0)
+    for closure in (months, months_ago, years, years_ago):
+        assert closure(10 ** 9, empty, TODAY) == [], closure
+        assert closure(1, DateObject(y=2023, m=2, d=29), TODAY) == [], closure
+    assert months(12 * 9999, DateObject(y=9999, m=1, d=0), TODAY) == []
+
+    assert parse("3개월전 매출", now=TODAY, debug=False) == (Date(2024, 4, 1), Date(2024, 4, 30))
+    assert parse("2년전 매출", now=TODAY, debug=False) == (Date(2022, 1, 1), Date(2022, 1, 31))
+
+
+def check_package_exports_functions():
+    # The submodules above were imported directly; the package still exports their functions.
+    assert parse("3개월전 매출", now=TODAY, debug=False) == (Date(2024, 4, 1), Date(2024, 4, 30))
+    assert rel_closures.months is months and rel_closures.years_ago is years_ago
+    assert callable(rel_closures.quarter)
+    try:
+        rel_closures.missing
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("rel_closures.missing")
+
+
+check_counts_outside_the_calendar()
+check_package_exports_functions()
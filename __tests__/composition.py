@@ -0,0 +1,27 @@
+from datetime import date
+
+from dateparser_ko import parse
+from dateparser_ko.types import Date
+
+TODAY = date(2024, 7, 1)
+
+
+def check_durations_ignore_spacing():
+    # 1년 2개월 전 is 14 months ago however it is spaced.
+    want = (Date(2023, 5, 1), Date(2023, 5, 31))
+    for text in ["1년 2개월 전", "1 년 2 개월 전", "1 년 2개월 전", "1년 2 개월 전", "1 년 두 달 전"]:
+        assert parse(text, now=TODAY, debug=False) == want, text
+
+    # A spaced unit is only read as the start of a duration.
+    assert parse("1 년 매출", now=TODAY, debug=False) == ()
+
+
+def check_units_without_a_count():
+    # A unit after a separated date has nothing to count and is skipped.
+    assert parse("2024.06.15일 실적", now=TODAY, debug=False) == (Date(2024, 6, 15),)
+    assert parse("1-2월 매출", now=TODAY, debug=False) == ()
+    assert parse("2003-11-2월", now=TODAY, debug=False) == (Date(2003, 11, 2),)
+
+
+check_durations_ignore_spacing()
+check_units_without_a_count()
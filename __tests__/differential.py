@@ -0,0 +1,673 @@
+"""Differential check of the parse engines against the frozen reference pipeline.
+
+    PYTHONPATH=. python __tests__/differential.py [--size N] [--seed S] [--engine NAME ...]
+
+Every engine runs over the same seeded corpus, plus fuzzed variants of it, at
+pinned reference dates. A mismatch is shrunk to a minimal input before it is
+reported; the run fails unless every mismatch is explained by EXPECTED.
+"""
+import argparse
+import calendar
+import os
+import random
+import re
+import sys
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "__benchmarks__"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import reference
+from dateparser_ko import parse, parse_many, ResultCache
+
+from corpus import generate
+
+# Reference dates: mid year, a leap day, a month end in the first quarter and the last day of a year.
+PINNED = [date(2024, 7, 1), date(2024, 2, 29), date(2023, 1, 31), date(2023, 12, 31)]
+
+# Pieces the fuzzer glues together: keywords, numerals, units, separators, stopwords and filler.
+PIECES = list(reference.rel_mapping) + reference.NUMB_WORDS + reference.ABS_WORDS + reference.ALL_SYMBOLS \
+         + reference.STOPWORDS \
+         + ["0", "1", "2", "3", "5", "9", "12", "15", "24", "31", "45", "2024", "1999", "20240615",
+            " ", " ", " ", "매출", "실적", "보고", "지난", "이번", "달", "개", "전"]
+
+Engine = Callable[[List[str], date], List[object]]
+
+
+def _each(func: Callable[[str, date], object]) -> Engine:
+    def run(texts: List[str], today: date) -> List[object]:
+        return [_outcome(func, text, today) for text in texts]
+
+    return run
+
+
+def _outcome(func: Callable, *args) -> object:
+    try:
+        return func(*args)
+    except Exception as e:
+        return type(e).__name__
+
+
+def _many(texts: List[str], today: date) -> List[object]:
+    try:
+        return [[tuple(d) for d in dates] for dates in parse_many(texts, now=today, debug=False)]
+    except Exception:
+        # One failing text fails the whole batch, so fall back to text by text.
+        return _each(lambda text, now: [tuple(d) for d in parse_many([text], now=now, debug=False)[0]])(texts, today)
+
+
+def _cached(texts: List[str], today: date) -> List[object]:
+    cache = ResultCache(maxsize=1024)
+    return _each(lambda text, now: [(d["y"], d["m"], d["d"]) for d in parse(text, now=now, cache=cache)["found_dates"]])(
+        texts, today)
+
+
+ENGINES: Dict[str, Engine] = {
+    "parse": _each(lambda text, today: [(d["y"], d["m"], d["d"]) for d in parse(text, now=today)["found_dates"]]),
+    "lean": _each(lambda text, today: [tuple(d) for d in parse(text, now=today, debug=False)]),
+    "many": _many,
+    "cached": _cached,
+}
+
+# How the candidate reads numbers, restated here so that no respelling runs the code under test.
+SINO_DIGITS = {**{str(i): i for i in range(10)}, "일": 1, "이": 2, "삼": 3, "사": 4, "오": 5, "육": 6, "칠": 7, "팔": 8,
+               "구": 9}
+SINO_UNITS = {"십": 10, "백": 100, "천": 1000}
+NATIVE_TENS = {"열": 10, "스무": 20, "스물": 20}
+NATIVE_ONES = {"한": 1, "두": 2, "세": 3, "석": 3, "네": 4, "넉": 4, "다섯": 5, "여섯": 6, "일곱": 7, "여덟": 8,
+               "아홉": 9}
+NATIVE_RANGES = {"한두": (1, 2), "두세": (2, 3), "서너": (3, 4), "너덧": (4, 5), "네댓": (4, 5), "대여섯": (5, 6),
+                 "예닐곱": (6, 7)}
+CENTURY_PIVOT = 69  # two-digit years from here on are in the 1900s
+
+# Separated numbers and keywords the respellings look at.
+MARKUP = (f"<{reference.YEAR}>", f"</{reference.YEAR}>", f"<{reference.TERM}>", f"</{reference.TERM}>")
+NATIVE_WORDS = sorted(list(NATIVE_RANGES) + list(NATIVE_ONES), key=len, reverse=True)
+RE_NATIVE_COUNT = re.compile(r"(?:(?<![^ ])((?:%s)?(?:%s)|%s)|(?<!\d)(\d{1,3}))( ?)달( ?전)?(?= |$)"
+                             % ("|".join(NATIVE_TENS), "|".join(NATIVE_WORDS), "|".join(NATIVE_TENS)))
+RE_SHORT_DATE = re.compile(r"(\d\d)([./-])\d{1,2}\2\d{1,2}(?!\d)")
+RE_PAIR = re.compile(r"(\d{1,2})-(\d{1,2})")
+COUNTED_KEYWORDS = frozenset(["개월", "개월전", "개년", "년전"])
+DURATION_KEYWORDS = frozenset(["개월", "개월전"])
+HALF_KEYWORDS = frozenset(["상반기", "하반기"])
+RE_SPACED_DURATION = re.compile(r"(?<=[\d%s]) 년(?= ?[\d%s]+ ?개월)" % ("".join(reference.NUMB_WORDS), "".join(reference.NUMB_WORDS)))
+
+
+def is_valid_date(y: int, m: int, d: int) -> bool:
+    return 1 <= y <= 9999 and 1 <= m <= 12 and 1 <= d <= calendar.monthrange(y, m)[1]
+
+
+def short_year(yy: int) -> int:
+    return yy + (1900 if yy >= CENTURY_PIVOT else 2000)
+
+
+def read_sino(text: str, start: int, ends: Optional[Callable[[int], bool]] = None) -> Optional[Tuple[int, int]]:
+    """Longest Sino-Korean numeral at ``start`` as ``(value, end)``, or None.
+
+    Units count what comes before them (이천이십사 is 2024, 십오 is 15, 3천 is 3000),
+    digits without a unit are read one by one (일이삼 is 123). With ``ends``, only
+    numerals whose end it accepts are read.
+    """
+    total = digits = 0
+    count = 0
+    last_unit = 10000
+    found = None
+    i = start
+    while i < len(text):
+        c = text[i]
+        if c in SINO_DIGITS and not (count and last_unit < 10000):
+            digits = digits * 10 + SINO_DIGITS[c]
+            count += 1
+        elif c in SINO_UNITS and SINO_UNITS[c] < last_unit:
+            total += (digits if count else 1) * SINO_UNITS[c]
+            digits = count = 0
+            last_unit = SINO_UNITS[c]
+        else:
+            break
+
+        i += 1
+        if ends is None or ends(i):
+            found = (total + digits, i)
+
+    return found
+
+
+def native_count(word: str) -> Tuple[int, int]:
+    """A native count as ``(value, high)``; ``high`` is the upper end of an approximate one (한두) or 0."""
+    ten = next((t for t in NATIVE_TENS if word.startswith(t)), "")
+    rest = word[len(ten):]
+    base = NATIVE_TENS.get(ten, 0)
+    if rest in NATIVE_RANGES:
+        low, high = NATIVE_RANGES[rest]
+        return base + low, base + high
+    return base + NATIVE_ONES.get(rest, 0), 0
+
+
+def marked(text: str) -> str:
+    """``text`` with the year and keyword markup of the reference."""
+    return reference.wrap_terms(reference.parse_year(text))
+
+
+def reference_tokens(text: str) -> list:
+    text = marked(text)
+    return reference.generate_tokens(reference.tag_chars(text), list(text))
+
+
+def reference_tags(text: str) -> list:
+    """Reference tag of every character of ``text``."""
+    tags = [None] * len(text)
+    for _, t, p in reference_tokens(text):
+        tags[p] = t
+    return tags
+
+
+def span_starts(text: str) -> set:
+    """Positions in ``text`` where a year or a keyword the reference marks up starts."""
+    text = marked(text)
+    starts = set()
+    k = plain = 0
+    while k < len(text):
+        tag = next((tag for tag in MARKUP if text.startswith(tag, k)), None)
+        if tag is None:
+            k += 1
+            plain += 1
+            continue
+        if not tag.startswith("</"):
+            starts.add(plain)
+        k += len(tag)
+
+    return starts
+
+
+def reference_dates(tokens: list, today: date, dropped: list) -> object:
+    """Reference outcome of ``tokens`` with the intended differences of its keywords and dates.
+
+    Months that do not exist (13월) are dropped, counted keywords that leave the
+    calendar ("20240615개월전") or follow a date that does not exist give no date,
+    and a half without a year is in the year of ``today``; each is recorded in
+    ``dropped`` as ``(kind, value)``.
+    """
+    def exists(d) -> bool:
+        return d["m"] == 0 or d["d"] > 0 or is_valid_date(d["y"] or today.year, d["m"], 1)
+
+    def bounded(closure: Callable) -> Callable:
+        def call(context, temp_date):
+            try:
+                return closure(context, temp_date)
+            except ValueError as e:
+                if "out of range" not in str(e) and "month must be" not in str(e):
+                    raise
+            except OverflowError:
+                pass
+            dropped.append(("count", context))
+            return []
+        return call
+
+    def dated(closure: Callable) -> Callable:
+        # The original sets the year of a half without one to now() itself and fails comparing it.
+        def call(context, temp_date):
+            try:
+                given = int(context) > 1000
+            except ValueError:
+                given = False
+            if temp_date["y"] > 0 or given:
+                return closure(context, temp_date)
+            dropped.append(("half", context))
+            return closure(context, {**temp_date, "y": today.year})
+        return call
+
+    def dates() -> list:
+        reference.use_date(today)
+        mapping = reference.rel_mapping
+        reference.rel_mapping = {**mapping, **{k: bounded(mapping[k]) for k in COUNTED_KEYWORDS},
+                                 **{k: dated(mapping[k]) for k in HALF_KEYWORDS}}
+        try:
+            found = reference.find_dates(tokens)
+        finally:
+            reference.rel_mapping = mapping
+        dropped.extend(("month", d) for d in found if not exists(d))
+        return [(d["y"], d["m"], d["d"]) for d in reference.create_full_dates([d for d in found if exists(d)])]
+
+    return _outcome(dates)
+
+
+def _joined(tokens: list, indices) -> str:
+    return "".join(tokens[i][0] for i in indices)
+
+
+def _emits(tokens: list, context: list, idx: int) -> bool:
+    """Whether the reference reads ``context`` as a separated number at the number token ``idx``."""
+    return re.search(reference.RE_HAS_DIGIT_AND_CHAR, _joined(tokens, context)) is not None \
+        and (idx + 1 == len(tokens) or tokens[idx + 1][1] not in (reference.SYMB, reference.NW))
+
+
+def symbol_contexts(tokens: list) -> List[list]:
+    """Indices of the tokens of every separated number the reference reads with ``symbol``."""
+    contexts = []
+    context = []
+    for idx, (_, t, _) in enumerate(tokens):
+        if t == reference.NW or t == reference.SYMB:
+            context.append(idx)
+            if t == reference.NW and _emits(tokens, context, idx):
+                contexts.append(context)
+                context = []
+        elif t == reference.AW or t == reference.RW:
+            context = []
+
+    return contexts
+
+
+def _replaced(tokens: list, indices: list, context: str) -> list:
+    first = indices[0]
+    return [(context, reference.NW, tokens[first][2]) if i == first else token
+            for i, token in enumerate(tokens) if i == first or i not in indices]
+
+
+def _count_range(tokens: list, indices: list) -> Optional[tuple]:
+    """Both ends of a count range right before a keyword ("1-2개월"), or None."""
+    match = RE_PAIR.fullmatch(_joined(tokens, indices))
+    if match is None or not int(match.group(1)) < int(match.group(2)) <= 12:
+        return None
+
+    after = indices[-1] + 1
+    while after < len(tokens) and tokens[after][1] == reference.PAD:
+        after += 1
+    return match.groups() if after < len(tokens) and tokens[after][1] == reference.RW else None
+
+
+def respell_native_counts(text: str) -> str:
+    """Counts before 달 as 개월: 석 달 is 3개월, 한두 달 is 1-2개월."""
+    def respell(match) -> str:
+        if match.group(2) is not None:
+            count = match.group(2)
+        else:
+            value, high = native_count(match.group(1))
+            count = f"{value}-{high}" if high else str(value)
+        return count + match.group(3) + "개월" + (match.group(4) or "")
+
+    return RE_NATIVE_COUNT.sub(respell, text)
+
+
+def respell_touching_keywords(tokens: list) -> list:
+    """A space between keywords read as one unregistered key: 지난 달올해 is 지난 달 올해."""
+    respelled = []
+    idx = 0
+    while idx < len(tokens):
+        end = idx + 1
+        if tokens[idx][1] == reference.RW:
+            while end < len(tokens) and tokens[end][1] == reference.RW:
+                end += 1
+            while end > idx + 1 and _joined(tokens, range(idx, end)).replace(" ", "") not in reference.rel_mapping:
+                end -= 1
+        respelled += tokens[idx:end]
+        if end < len(tokens) and tokens[end][1] == reference.RW and tokens[end - 1][1] == reference.RW:
+            respelled.append((" ", reference.PAD, tokens[end - 1][2]))
+        idx = end
+
+    return respelled
+
+
+def respell_spaced_durations(text: str) -> str:
+    """A year count spaced from its unit when a month count follows: 1 년 2 개월 전 is 1년 2 개월 전."""
+    return RE_SPACED_DURATION.sub("년", text)
+
+
+def respell_end_of_text(text: str) -> str:
+    """The end of the text read like a space: the reference fails on a number there ("매출 12"), does not
+    find a year or keyword there ("매출 작년") and reads "2024.06.15" there as the 1st."""
+    spaced = text + " "
+    return spaced if _outcome(reference_tokens, text) != reference_tokens(spaced)[:-1] else text
+
+
+def respell_numerals_before_units(text: str) -> str:
+    """A numeral read whole before a unit the reference reads a 일 of as the unit: 십일월 is 11월, 삼십일일 is 31일."""
+    tags = reference_tags(text)
+    starts = span_starts(text)
+    for i, c in enumerate(text):
+        if c not in reference.NUMB_WORDS or tags[i] != reference.NW or (i > 0 and tags[i - 1] == reference.NW):
+            continue
+
+        run_end = i + 1
+        while run_end < len(text) and run_end not in starts \
+                and (text[run_end] in reference.NUMB_WORDS or text[run_end].isdecimal()):
+            run_end += 1
+        numeral = read_sino(text, i, ends=lambda end: end <= run_end and end < len(text)
+                            and text[end] in reference.ABS_WORDS and end not in starts)
+        if numeral is not None and any(t != reference.NW for t in tags[i:numeral[1]]):
+            value, end = numeral
+            return respell_numerals_before_units(text[:i] + str(value) + text[end:])
+
+    return text
+
+
+def respell_numerals(tokens: list) -> list:
+    """Numbers with 십, 백 or 천 as the digits of their value: 십오 is 15, 2천 is 2000."""
+    respelled = []
+    idx = 0
+    while idx < len(tokens):
+        end = idx + 1
+        if tokens[idx][1] == reference.NW:
+            while end < len(tokens) and tokens[end][1] == reference.NW and tokens[end][2] == tokens[idx][2] + end - idx:
+                end += 1
+        word = _joined(tokens, range(idx, end))
+        if tokens[idx][1] != reference.NW or not set(SINO_UNITS).intersection(word):
+            respelled += tokens[idx:end]
+            idx = end
+            continue
+
+        i = 0
+        while i < len(word):
+            value, end_i = read_sino(word, i) or (word[i], i + 1)
+            respelled += [(c, reference.NW, tokens[idx][2] + i) for c in str(value)]
+            i = end_i
+        idx = end
+
+    return respelled
+
+
+def respell_durations(tokens: list) -> list:
+    """A year count carried into the month count after it: 1년 2개월 is 14개월."""
+    for k, (c, t, _) in enumerate(tokens):
+        if t != reference.AW or c != "년":
+            continue
+
+        start = k
+        while start > 0 and tokens[start - 1][1] in (reference.NW, reference.PAD):
+            start -= 1
+        while tokens[start][1] == reference.PAD:
+            start += 1
+        after = k + 1
+        while after < len(tokens) and tokens[after][1] == reference.PAD:
+            after += 1
+        end = after
+        while end < len(tokens) and tokens[end][1] == reference.NW:
+            end += 1
+        keyword = end
+        while keyword < len(tokens) and tokens[keyword][1] == reference.PAD:
+            keyword += 1
+        rest = keyword
+        while rest < len(tokens) and tokens[rest][1] == reference.RW:
+            rest += 1
+
+        years = "".join(c for c, t, _ in tokens[start:k] if t == reference.NW)
+        if years and int(years) < 100 and after < end and (start == 0 or tokens[start - 1][1] != reference.SYMB) \
+                and _joined(tokens, range(keyword, rest)).replace(" ", "") in DURATION_KEYWORDS:
+            months = int(years) * 12 + int(_joined(tokens, range(after, end)))
+            return respell_durations(tokens[:start] + [(str(months), reference.NW, tokens[after][2])] + tokens[end:])
+
+    return tokens
+
+
+def respell_two_digit_years(tokens: list) -> list:
+    """YY.MM.DD with the century: 24.06.15 is 2024.06.15."""
+    for indices in reversed(symbol_contexts(tokens)):
+        context = _joined(tokens, indices)
+        match = RE_SHORT_DATE.match(context)
+        if match is None:
+            continue
+        numbers = context.split(match.group(2))
+        y = short_year(int(numbers[0]))
+        if is_valid_date(y, int(numbers[1]), int(numbers[2])):
+            tokens = _replaced(tokens, indices, str(y // 100) + context)
+
+    return tokens
+
+
+def respell_separated_numbers(tokens: list) -> list:
+    """Separated numbers with fewer than three parts as the year and month they hold (2024.06 is 2024.06.00),
+    and as no date without a four-digit year (9/3)."""
+    for indices in reversed(symbol_contexts(tokens)):
+        context = _joined(tokens, indices)
+        numbers = context.split(next(c for c in context if not c.isdigit()))
+        if len(numbers) >= 3 or _count_range(tokens, indices) is not None:
+            continue
+
+        y = m = d = 0
+        year_i = next((i for i, n in enumerate(numbers) if len(n) == 4), None)
+        if year_i is not None:
+            if not all(n.isdigit() for n in numbers):
+                continue
+            others = [i for i in range(len(numbers)) if i != year_i]
+            month_i = next((i for i in others if int(numbers[i]) < 13), None)
+            day_i = next((i for i in others if i != month_i), None)
+            y = int(numbers[year_i])
+            m = 0 if month_i is None else int(numbers[month_i])
+            d = 0 if day_i is None else int(numbers[day_i])
+        tokens = _replaced(tokens, indices, f"{y:04d}.{m:02d}.{d:02d}")
+
+    return tokens
+
+
+def respell_bare_counters(tokens: list) -> list:
+    """개월, 개년 and 년 전 without a number before them, and what is pending before them, dropped."""
+    dropped = set()
+    context = []
+    idx = 0
+    while idx < len(tokens):
+        t = tokens[idx][1]
+        if t == reference.RW:
+            end = idx
+            while end < len(tokens) and tokens[end][1] == reference.RW:
+                end += 1
+            if _joined(tokens, range(idx, end)).replace(" ", "") in COUNTED_KEYWORDS \
+                    and not _joined(tokens, context).isdecimal() and _count_range(tokens, context) is None:
+                dropped.update(context + list(range(idx, end)))
+            context = []
+            idx = end
+            continue
+
+        if t == reference.NW or t == reference.SYMB:
+            context.append(idx)
+            # A count range is read as a separated number, but counts for the keyword after it.
+            if t == reference.NW and _emits(tokens, context, idx) and _count_range(tokens, context) is None:
+                context = []
+        elif t == reference.AW:
+            context = []
+        idx += 1
+
+    return [token for i, token in enumerate(tokens) if i not in dropped]
+
+
+def respell_units_without_a_count(tokens: list) -> list:
+    """A unit right after a separated number read as a space: 2024.06.15일 is 2024.06.15."""
+    units = {indices[-1] + 1 for indices in symbol_contexts(tokens)
+             if indices[-1] + 1 < len(tokens) and tokens[indices[-1] + 1][1] == reference.AW}
+    return [(" ", reference.PAD, p) if i in units else (c, t, p) for i, (c, t, p) in enumerate(tokens)]
+
+
+def respell_words_after_keywords(tokens: list) -> list:
+    """A space after every keyword, since the reference skips the token after one: 개 월2024 loses its 2."""
+    respelled = []
+    for idx, (c, t, p) in enumerate(tokens):
+        respelled.append((c, t, p))
+        if t == reference.RW and idx + 1 < len(tokens) and tokens[idx + 1][1] not in (reference.RW, reference.PAD):
+            respelled.append((" ", reference.PAD, p + 1))
+
+    return respelled
+
+
+def count_range_variants(tokens: list) -> List[list]:
+    """Tokens with a count range ("1-2개월") read as its low and as its high end, or just ``tokens`` without one."""
+    for indices in symbol_contexts(tokens):
+        pair = _count_range(tokens, indices)
+        if pair is not None:
+            return [_replaced(tokens, indices, count) for count in pair]
+
+    return [tokens]
+
+
+def spread(low: object, high: object) -> object:
+    """Outcome of a count range: the one or two dates its keyword gives at either end become one span."""
+    if not isinstance(low, list) or not isinstance(high, list) or len(low) != len(high) or low == high:
+        return low
+
+    first = 0
+    while low[first] == high[first]:
+        first += 1
+    size = 2 if low[first + 2:] == high[first + 2:] else 1
+    dates = low[first:first + size] + high[first:first + size]
+    return low[:first] + [min(dates), max(dates)] + low[first + size:]
+
+
+TEXT, TOKENS, NUMBERS = "text", "tokens", "numbers"
+
+# Known, intended differences from the reference, as (name, input, respelling). Each
+# rewrites the cleaned text, its tagged tokens or its tokens with numerals read
+# into what the reference reads the way the candidate reads the original. A
+# mismatch is expected when the reference reading of the respelled input, with
+# count ranges spread and dates that do not exist dropped, is the candidate outcome.
+EXPECTED: List[tuple] = [
+    ("native counts", TEXT, respell_native_counts),
+    ("spaced durations", TEXT, respell_spaced_durations),
+    ("end of text", TEXT, respell_end_of_text),
+    ("numerals before units", TEXT, respell_numerals_before_units),
+    ("numeral grammar", TOKENS, respell_numerals),
+    ("touching keywords", TOKENS, respell_touching_keywords),
+    ("durations", NUMBERS, respell_durations),
+    ("two-digit years", NUMBERS, respell_two_digit_years),
+    ("short separated numbers", NUMBERS, respell_separated_numbers),
+    ("counter without a count", NUMBERS, respell_bare_counters),
+    ("units without a count", NUMBERS, respell_units_without_a_count),
+    ("words after keywords", NUMBERS, respell_words_after_keywords),
+]
+
+
+def expected_reason(text: str, want: object, got: object, today: date = PINNED[0]) -> Optional[str]:
+    """Names of the intended differences that turn the reference outcome ``want`` into ``got``, or None.
+
+    ``want`` is not looked at: the reference reading of the respelled text has to be ``got`` exactly.
+    """
+    names = []
+    value = reference.remove_stopwords(" ".join(text.split()))
+    for stage in (TEXT, TOKENS, NUMBERS):
+        if stage == TOKENS:
+            value = reference_tokens(value)
+        elif stage == NUMBERS:
+            value = reference.normalize_chars(value)
+        for name, kind, respell in EXPECTED:
+            if kind == stage:
+                respelled = respell(value)
+                if respelled != value:
+                    names.append(name)
+                    value = respelled
+
+    variants = count_range_variants(value)
+    if len(variants) > 1:
+        names.append("count ranges")
+    dropped = []
+    outcomes = [reference_dates(tokens, today, dropped) for tokens in variants]
+    outcome = spread(outcomes[0], outcomes[-1])
+    if isinstance(outcome, list):
+        # A full date that does not exist (2024-06-45, 2023년 2월 29일, 13월) is dropped.
+        valid = [d for d in outcome if 0 in d or is_valid_date(*d)]
+        if any(kind == "count" for kind, _ in dropped):
+            names.append("counts outside the calendar")
+        if any(kind == "half" for kind, _ in dropped):
+            names.append("halves without a year")
+        if valid != outcome or any(kind == "month" for kind, _ in dropped):
+            names.append("invalid dates")
+            outcome = valid
+
+    return " + ".join(names) if names and outcome == got else None
+
+
+def fuzz(rng: random.Random, text: str) -> str:
+    """Drop, double, space out or insert a piece to reach inputs the corpus does not contain."""
+    chars = list(text)
+    for _ in range(rng.randint(1, 3)):
+        i = rng.randrange(len(chars) + 1)
+        op = rng.random()
+        if op < 0.25 and i < len(chars):
+            del chars[i]
+        elif op < 0.45 and i < len(chars):
+            chars.insert(i, chars[i])
+        elif op < 0.6:
+            chars.insert(i, " ")
+        else:
+            chars[i:i] = rng.choice(PIECES)
+
+    return "".join(chars)
+
+
+def random_text(rng: random.Random) -> str:
+    return "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 8)))
+
+
+def build_corpus(size: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    texts = generate(size // 3, seed)
+    texts += [fuzz(rng, text) for text in texts]
+    texts += [random_text(rng) for _ in range(size - len(texts))]
+    return texts
+
+
+def minimize(text: str, differs: Callable[[str], bool]) -> str:
+    """Shrink ``text`` while ``differs`` still holds, removing ever smaller chunks of characters."""
+    size = max(len(text) // 2, 1)
+    while size >= 1:
+        i = 0
+        shrunk = False
+        while i < len(text):
+            candidate = text[:i] + text[i + size:]
+            if candidate != text and differs(candidate):
+                text = candidate
+                shrunk = True
+            else:
+                i += size
+        if not shrunk:
+            size //= 2
+
+    return " ".join(text.split()) if differs(" ".join(text.split())) else text
+
+
+def compare(engine: Engine, texts: List[str], today: date) -> tuple:
+    """Return (unexpected mismatches as (minimized text, reference, candidate), expected mismatch counts)."""
+    want = _each(reference.parse)(texts, today)
+    got = engine(texts, today)
+
+    def unexpected(text: str) -> bool:
+        w = _outcome(reference.parse, text, today)
+        g = engine([text], today)[0]
+        return w != g and expected_reason(text, w, g, today) is None
+
+    mismatches = {}
+    allowed: Dict[str, int] = {}
+    for text, w, g in zip(texts, want, got):
+        if w == g:
+            continue
+        reason = expected_reason(text, w, g, today)
+        if reason is not None:
+            allowed[reason] = allowed.get(reason, 0) + 1
+            continue
+
+        small = minimize(text, unexpected)
+        if small not in mismatches:
+            mismatches[small] = (_outcome(reference.parse, small, today), engine([small], today)[0])
+
+    return [(text, w, g) for text, (w, g) in mismatches.items()], allowed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=20_000, help="texts per pinned date")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES), help="default: all")
+    args = parser.parse_args(argv)
+
+    texts = build_corpus(args.size, args.seed)
+    failed = False
+    for name in args.engine or ENGINES:
+        for today in PINNED:
+            mismatches, allowed = compare(ENGINES[name], texts, today)
+            notes = ", ".join(f"{count} {reason}" for reason, count in allowed.items())
+            print(f"{name:>9} {today}  {len(mismatches)} unexpected" + (f"  (expected: {notes})" if notes else ""))
+            for text, want, got in mismatches[:10]:
+                print(f"    {text!r}\n        reference {want}\n        candidate {got}")
+            failed = failed or bool(mismatches)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
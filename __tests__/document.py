@@ -0,0 +1,23 @@
+from datetime import date
+
+from dateparser_ko import parse_document
+
+TODAY = date(2024, 7, 1)
+DOCUMENT = ("2024년 실적 보고.  3월 매출은 늘었다.\n다음 일정: 2024.06.15 회의,   3개월 전 자료와 이천이십삼년 십이월 자료 검토\n"
+            "\n날짜 없는 줄\n지난달 매출 " + "긴 문장 " * 400 + "2022년 12월 5일 마감")
+
+
+def check_offsets_cover_the_phrase():
+    phrases = [(DOCUMENT[d.start:d.end], (d.y, d.m, d.d)) for d in parse_document(DOCUMENT, now=TODAY)]
+    assert phrases == [
+        ("2024년", (2024, 1, 1)), ("2024년", (2024, 12, 31)),
+        ("3월", (2024, 3, 1)), ("3월", (2024, 3, 31)),
+        ("2024.06.15", (2024, 6, 15)),
+        ("3개월 전", (2024, 4, 1)), ("3개월 전", (2024, 4, 30)),
+        ("이천이십삼년 십이월", (2023, 12, 1)), ("이천이십삼년 십이월", (2023, 12, 31)),
+        ("지난달", (2024, 6, 1)), ("지난달", (2024, 6, 30)),
+        ("2022년 12월 5일", (2022, 12, 5)),
+    ], phrases
+
+
+check_offsets_cover_the_phrase()
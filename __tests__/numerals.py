@@ -0,0 +1,30 @@
+from datetime import date
+
+from dateparser_ko import parse
+from dateparser_ko.types import Date
+
+TODAY = date(2024, 7, 1)
+
+CASES = [
+    # A 일 after a numeral is read as a digit when a unit follows it.
+    ("십일월", (Date(2024, 11, 1), Date(2024, 11, 30))),
+    ("십일일", (Date(2024, 7, 11),)),
+    ("삼십일일", (Date(2024, 7, 31),)),
+    ("이천십일년", (Date(2011, 1, 1), Date(2011, 12, 31))),
+    ("십이월 매출", (Date(2024, 12, 1), Date(2024, 12, 31))),
+    # Without a unit after it, 일 is still the day.
+    ("십일", (Date(2024, 7, 10),)),
+    ("이천이십사년 삼월 십오일", (Date(2024, 3, 15),)),
+    ("일이삼", ()),
+]
+
+
+def check_numerals_before_units():
+    for text, dates in CASES:
+        assert parse(text, now=TODAY, debug=False) == dates, text
+
+    tokens = parse("십일월", now=TODAY)["used_tokens"]
+    assert tokens == [("십", "NW", 0), ("일", "NW", 1), ("월", "AW", 2)], tokens
+
+
+check_numerals_before_units()
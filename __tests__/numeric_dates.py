@@ -0,0 +1,88 @@
+import os
+import random
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "__benchmarks__"))
+
+from dateparser_ko import parse, parse_many, Lexicon
+from dateparser_ko.lexicon import DEFAULT_LEXICON
+from dateparser_ko.numeric_dates import numeric_date
+from dateparser_ko.parse import clean_text, lean_dates, run_pipeline
+from dateparser_ko.types import Date, DateObject
+
+from corpus import generate, SUBJECTS, TAILS
+
+TODAY = date(2024, 7, 1)
+WORDS = SUBJECTS + TAILS + ["회사", "회의일", "이", "오늘", "지난달", "3개월", "보고서에", "-", "/", "2024년"]
+
+
+def full_path(text: str) -> object:
+    try:
+        # The debug pipeline never takes the fast path.
+        return lean_dates(run_pipeline(clean_text(text), TODAY)["found_dates"])
+    except Exception as e:
+        return type(e).__name__
+
+
+def fast_path(text: str) -> object:
+    try:
+        return parse(text, now=TODAY, debug=False)
+    except Exception as e:
+        return type(e).__name__
+
+
+def numeric_form(rng: random.Random) -> str:
+    y, m, d = rng.randint(1990, 2030), rng.randint(0, 13), rng.choice([1, 9, 15, 28, 29, 30, 31, 45])
+    year = f"{y % 100:02d}" if rng.random() < 0.3 else str(y)
+    sep = rng.choice(".-/")
+    return f"{year}{sep}{m:02d}{sep}{d:02d}"
+
+
+def check_matches_full_path():
+    rng = random.Random(0)
+    texts = []
+    for _ in range(20_000):
+        words = [numeric_form(rng)] + rng.sample(WORDS, rng.randint(0, 3))
+        rng.shuffle(words)
+        texts.append(" ".join(words))
+    texts += generate(5000)
+
+    taken = 0
+    for text in texts:
+        taken += numeric_date(clean_text(text), DEFAULT_LEXICON) is not None
+        assert fast_path(text) == full_path(text), f"{text!r}\n    full {full_path(text)}\n    fast {fast_path(text)}"
+
+    assert taken > len(texts) // 4
+    print(f"fast path resolved {taken} of {len(texts)} inputs, all as the full path does")
+
+
+def check_forms():
+    assert numeric_date("2024-06-15 실적", DEFAULT_LEXICON) == (Date(2024, 6, 15),)
+    assert numeric_date("2024.06.15", DEFAULT_LEXICON) == (Date(2024, 6, 15),)
+    assert numeric_date("24/06/15", DEFAULT_LEXICON) == (Date(2024, 6, 15),)
+    assert numeric_date("99.12.31 마감", DEFAULT_LEXICON) == (Date(1999, 12, 31),)
+
+    # Left to the pipeline: invalid dates, mixed separators, other dates and numerals it would read into the date.
+    for text in ["2024-06-45", "2023-02-29", "2024.06-15", "2024-06-15 지난달", "2024-06-15 2024-06-16", "회사 2024-06-15",
+                 "x2024-06-15", "2024-6-15"]:
+        assert numeric_date(text, DEFAULT_LEXICON) is None, text
+
+    lexicon = Lexicon().extend({"15 회의": lambda count, temp_date, today: DateObject(y=0, m=0, d=0)})
+    assert numeric_date("2024-06-15 회의", lexicon) is None
+
+
+def check_impossible_dates():
+    # Dates that do not exist are dropped on every path, not only for separated numbers.
+    for text in ["2023-02-29", "2023.02.29 실적", "2023년 2월 29일", "2024년 6월 31일 보고", "45일", "22천5년",
+                 "13월", "2024년 13월 매출", "15월 매출"]:
+        assert parse(text, now=TODAY, debug=False) == (), text
+        assert parse(text, now=TODAY)["found_dates"] == [], text
+    assert parse("2024년 2월 29일", now=TODAY, debug=False) == (Date(2024, 2, 29),)
+    assert list(parse_many(["3월", "13월", "5월"], now=TODAY, debug=False)) == [
+        (Date(2024, 3, 1), Date(2024, 3, 31)), (), (Date(2024, 5, 1), Date(2024, 5, 31))]
+
+
+check_forms()
+check_impossible_dates()
+check_matches_full_path()
@@ -0,0 +1,60 @@
+import os
+import random
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "__benchmarks__"))
+
+from dateparser_ko.lexicon import DEFAULT_LEXICON
+from dateparser_ko.parse import clean_text, parse_year, wrap_terms, tag_chars, generate_tokens, normalize_chars, \
+    find_dates, create_full_dates, run_pipeline
+
+from corpus import generate
+
+TODAY = date(2024, 7, 1)
+
+
+def full_pipeline(text: str) -> list:
+    spans = sorted(parse_year(text) + wrap_terms(text))
+    tokens = generate_tokens(tag_chars(text, spans), text)
+    return create_full_dates(find_dates(normalize_chars(tokens), TODAY), TODAY)
+
+
+def mangle(rng: random.Random, text: str) -> str:
+    """Drop, double or space out a few characters to reach inputs the corpus does not contain."""
+    chars = list(text)
+    for _ in range(rng.randint(1, 3)):
+        i = rng.randrange(len(chars))
+        op = rng.random()
+        if op < 0.4:
+            del chars[i]
+        elif op < 0.7:
+            chars.insert(i, chars[i])
+        else:
+            chars.insert(i, " ")
+        if not chars:
+            break
+
+    return "".join(chars)
+
+
+def check_never_skips_dated_inputs():
+    rng = random.Random(0)
+    texts = generate(20_000)
+    texts += [mangle(rng, text) for text in texts if text]
+
+    skipped = 0
+    for text in map(clean_text, texts):
+        if DEFAULT_LEXICON.may_contain_dates(text):
+            continue
+
+        skipped += 1
+        assert not full_pipeline(text), f"prefilter skipped a dated input: {text!r}"
+        assert run_pipeline(text, TODAY)["used_tokens"] == generate_tokens(tag_chars(text, []), text)
+
+    assert skipped > 0
+    print(f"prefilter skipped {skipped} of {len(texts)} inputs, none with dates")
+
+
+if __name__ == "__main__":
+    check_never_skips_dated_inputs()
@@ -0,0 +1,819 @@
+"""Frozen copy of the original parse pipeline (commit ea433a3), used as the oracle in differential.py.
+
+Do not change this file to make a diff go away: the behavior here is the
+contract. Intended changes are listed in differential.EXPECTED instead.
+
+The package is kept in one module and changed only where it could not run here:
+
+- ``datetime.now(tz=timezone.utc)`` is ``now()``, the reference date ``parse`` is given;
+- ``relativedelta`` is a stand-in with the semantics of python-dateutil's for the
+  years, months and days used here, since dateutil is not a dependency;
+- the nested quotes of one f-string are changed so it runs before Python 3.12;
+- ``DateObject`` is a plain dict, since the original module used it before defining it.
+"""
+import calendar
+import re
+from datetime import date, timedelta
+from typing import List, Tuple
+
+# tags.py
+AW = "AW"
+NW = "NW"
+RW = "RW"
+SYMB = "SYMB"
+PAD = "<PAD>"
+YEAR = "YEAR"
+TERM = "TERM"
+
+# keywords.py
+KW_YEAR = "년"
+KW_MONTH = "월"
+KW_DAY = "일"
+KW_LAST_YEAR = "작년"
+KW_LAST_YEAR2 = "지난해"
+KW_LAST_LAST_YEAR = "재작년"
+KW_QUARTER = "분기"
+KW_FIRST_HALF = "상반기"
+KW_LAST_HALF = "하반기"
+KW_THIS_YEAR = "올해"
+KW_THIS_YEAR2 = "이번연도"
+KW_THIS_MONTH = "이번달"
+KW_LAST_MONTH = "지난달"
+KW_LAST_QUARTER = "지난분기"
+KW_TODAY = "오늘"
+KW_TODAY2 = "금일"
+KW_TODAY3 = "당일"
+KW_THIS_MONTH2 = "금월"
+KW_THIS_MONTH3 = "당월"
+KW_LAST_MONTH2 = "전월"
+KW_MONTHS_AGO = "개월전"
+KW_MONTHS = "개월"
+KW_YEARS = "개년"
+KW_YEARS_AGO = "년전"
+
+ABS_WORDS = [KW_YEAR, KW_MONTH, KW_DAY]
+
+REL_WORDS = [KW_LAST_YEAR, KW_LAST_LAST_YEAR, KW_QUARTER, KW_FIRST_HALF, KW_LAST_HALF,
+    KW_THIS_YEAR, KW_THIS_YEAR2, KW_THIS_MONTH, KW_LAST_YEAR2, KW_LAST_MONTH, KW_LAST_QUARTER,
+    KW_TODAY, KW_TODAY2, KW_TODAY3, KW_THIS_MONTH2, KW_THIS_MONTH3, KW_LAST_MONTH2, KW_MONTHS, KW_MONTHS_AGO,
+    KW_YEARS, KW_YEARS_AGO]
+
+NUMB_WORDS = ["일", "이", "삼", "사", "오", "육", "칠", "팔", "구", "십", "백", "천"]
+
+# stopwords.py
+STOPWORDS = [
+    "부터", "동안", "까지", "이", "을", "를", "가", "은", "간", "치", "의"
+]
+
+# symbols.py
+DOT = "."
+DASH = "-"
+SLASH = "/"
+
+ALL_SYMBOLS = [
+    DOT, DASH, SLASH
+]
+
+# patterns.py
+RE_IS_DIGIT = r'^-?\d+$'
+RE_HAS_DIGIT_AND_CHAR = r'(?=.*\d)(?=.*\D)'
+
+# Stand-ins for the clock, python-dateutil and types.py.
+
+_today = date(1, 1, 1)
+
+
+def now() -> date:
+    return _today
+
+
+def use_date(today: date):
+    """Make ``now()`` return ``today``."""
+    global _today
+    _today = today
+
+
+class relativedelta:
+    """Whole years, months and days, applied the way ``dateutil.relativedelta`` applies them."""
+
+    def __init__(self, years: int = 0, months: int = 0, days: int = 0):
+        self.years = years
+        self.months = months
+        self.days = days
+
+    def __neg__(self) -> "relativedelta":
+        return relativedelta(years=-self.years, months=-self.months, days=-self.days)
+
+    def __radd__(self, other: date) -> date:
+        year, month = divmod(other.year * 12 + other.month - 1 + self.years * 12 + self.months, 12)
+        month += 1
+        day = min(calendar.monthrange(year, month)[1], other.day)
+        return other.replace(year=year, month=month, day=day) + timedelta(days=self.days)
+
+    def __rsub__(self, other: date) -> date:
+        return (-self).__radd__(other)
+
+
+def DateObject(y: int, m: int, d: int) -> dict:
+    return {"y": y, "m": m, "d": d}
+
+
+# abs_closures
+
+def day(context: str, temp_date: dict) -> dict:
+    return DateObject(y=temp_date["y"], m=temp_date["m"], d=int(context))
+
+
+def month(context: str, temp_date: dict) -> dict:
+    return DateObject(y=temp_date["y"], m=int(context), d=0)
+
+
+def year(context: str, temp_date: dict) -> dict:
+    return DateObject(y=int(context), m=0, d=0)
+
+
+abs_mapping = {
+    KW_YEAR: year,
+    KW_MONTH: month,
+    KW_DAY: day
+}
+
+
+# misc_closures
+
+def symbol(context: str) -> dict:
+    custom_date = DateObject(y=0, m=0, d=0)
+
+    sep = next((c for c in context if not c.isdigit()), None)
+    numbers = context.split(sep)
+    max_len = 3
+
+    year_i = 0
+    while year_i < max_len:
+        if len(numbers[year_i]) == 4:
+            custom_date["y"] = int(numbers[year_i])
+            break
+
+        year_i += 1
+
+    month_i = 0
+    while month_i < max_len:
+        if month_i == year_i:
+            month_i += 1
+            continue
+
+        temp = int(numbers[month_i])
+        if temp < 13:
+            custom_date["m"] = temp
+            break
+
+        month_i += 1
+
+    day_i = 0
+    while day_i < max_len:
+        if day_i == year_i or day_i == month_i:
+            day_i += 1
+            continue
+
+        custom_date["d"] = int(numbers[day_i])
+        break
+
+    return custom_date
+
+
+misc_mapping = {
+    SYMB: symbol
+}
+
+
+# rel_closures
+
+def first_half(context: str, temp_date: dict) -> List[dict]:
+    year = temp_date["y"] if temp_date["y"] > 0 else now()
+    try:
+        int_context = int(context)
+        if int_context > 1000:
+            year = int_context
+    except Exception as _:
+        pass
+
+    start_date = DateObject(y=year, m=1, d=1)
+    end_date = DateObject(y=year, m=5, d=31)
+
+    return [start_date, end_date]
+
+
+def last_half(context: str, temp_date: dict) -> List[dict]:
+    year = temp_date["y"] if temp_date["y"] > 0 else now()
+    try:
+        int_context = int(context)
+        if int_context > 1000:
+            year = int_context
+    except Exception as _:
+        pass
+
+    start_date = DateObject(y=year, m=6, d=1)
+    end_date = DateObject(y=year, m=12, d=31)
+
+    return [start_date, end_date]
+
+
+def last_last_year(context: str, temp_date: dict) -> dict:
+    year = now().year - 2
+    date_obj = DateObject(y=year, m=0, d=0)
+    return date_obj
+
+
+def last_month(context: str, temp_date: dict) -> dict:
+    temp = (now() - relativedelta(months=1))
+
+    date_obj = DateObject(y=temp.year, m=temp.month, d=0)
+    return date_obj
+
+
+def last_quarter(context: str, temp_date: dict) -> List[dict]:
+    current_date = now()
+    current_quarter = (current_date.month - 1) // 3 + 1
+    if current_quarter == 1:
+        start_date = DateObject(y=current_date.year-1, m=1, d=1)
+        end_date = DateObject(y=current_date.year-1, m=3, d=31)
+    elif current_quarter == 2:
+        start_date = DateObject(y=current_date.year, m=1, d=1)
+        end_date = DateObject(y=current_date.year, m=3, d=31)
+    elif current_quarter == 3:
+        start_date = DateObject(y=current_date.year, m=2, d=1)
+        end_date = DateObject(y=current_date.year, m=5, d=31)
+    else:
+        start_date = DateObject(y=current_date.year, m=6, d=1)
+        end_date = DateObject(y=current_date.year, m=9, d=30)
+
+    return [start_date, end_date]
+
+
+def last_year(context: str, temp_date: dict) -> dict:
+    return DateObject(y=now().year - 1, m=0, d=0)
+
+
+def months(context: str, temp_date: dict) -> List[dict]:
+    today = now()
+
+    if temp_date["y"] == 0 and temp_date["m"] == 0 and temp_date["d"] == 0:
+        _end_date = today.replace(day=1) - relativedelta(days=1)
+        end_date = DateObject(y=_end_date.year, m=_end_date.month, d=_end_date.day)
+        relative_date = _end_date - relativedelta(months=int(context)) + relativedelta(months=1)
+        start_date = DateObject(y=relative_date.year, m=relative_date.month, d=1)
+        return [start_date, end_date]
+
+    else:
+        given_date = date(
+            temp_date["y"] if temp_date["y"] > 0 else today.year,
+            temp_date["m"] if temp_date["m"] > 0 else today.month,
+            temp_date["d"] if temp_date["d"] > 0 else 1
+        )
+        start_date = DateObject(y=given_date.year, m=given_date.month, d=given_date.day)
+        relative_date = given_date + relativedelta(months=int(context))
+        relative_date = relative_date.replace(day=1) - relativedelta(days=1)
+        end_date = DateObject(y=relative_date.year, m=relative_date.month, d=relative_date.day)
+        return [start_date, end_date]
+
+
+def months_ago(context: str, temp_date: dict) -> List[dict]:
+    ret: List[dict] = []
+
+    today = now()
+    end_date = date(
+        temp_date["y"] if temp_date["y"] > 0 else today.year,
+        temp_date["m"] if temp_date["m"] > 0 else today.month,
+        temp_date["d"] if temp_date["d"] > 0 else 1,
+    )
+    start_date = end_date - relativedelta(months=int(context))
+    ret.append(DateObject(y=start_date.year, m=start_date.month, d=start_date.day))
+
+    if temp_date["d"] == 0:
+        end_date = start_date + relativedelta(months=1) - relativedelta(days=1)
+        ret.append(DateObject(y=end_date.year, m=end_date.month, d=end_date.day))
+
+    return ret
+
+
+def quarter(context: str, temp_date: dict) -> List[dict]:
+    year = temp_date["y"] if temp_date["y"] > 0 else now().year
+
+    try:
+        int_context = int(context)
+        if int_context == 1:
+            start_date = DateObject(y=year, m=1, d=1)
+            end_date = DateObject(y=year, m=3, d=31)
+            return [start_date, end_date]
+        elif int_context == 2:
+            start_date = DateObject(y=year, m=4, d=1)
+            end_date = DateObject(y=year, m=6, d=30)
+            return [start_date, end_date]
+        elif int_context == 3:
+            start_date = DateObject(y=year, m=7, d=1)
+            end_date = DateObject(y=year, m=9, d=30)
+            return [start_date, end_date]
+        elif int_context == 4:
+            start_date = DateObject(y=year, m=10, d=1)
+            end_date = DateObject(y=year, m=12, d=31)
+            return [start_date, end_date]
+
+    except Exception as _:
+        pass
+
+    return []
+
+
+def this_month(context: str, temp_date: dict) -> dict:
+    today = now()
+    return DateObject(y=today.year, m=today.month, d=0)
+
+
+def this_year(context: str, temp_date: dict) -> dict:
+    today = now()
+    return DateObject(y=today.year, m=0, d=0)
+
+
+def today(context: str, temp_date: dict) -> dict:
+    today_date = now()
+    return DateObject(y=today_date.year, m=today_date.month, d=today_date.day)
+
+
+def years(context: str, temp_date: dict) -> List[dict]:
+    today = now()
+
+    if temp_date["y"] == 0 and temp_date["m"] == 0 and temp_date["d"] == 0:
+        _end_date = today.replace(month=1, day=1) - relativedelta(days=1)
+        end_date = DateObject(y=_end_date.year, m=_end_date.month, d=_end_date.day)
+        relative_date = _end_date - relativedelta(years=int(context)) + relativedelta(years=1)
+        start_date = DateObject(y=relative_date.year, m=1, d=1)
+        return [start_date, end_date]
+
+    else:
+        given_date = date(
+            temp_date["y"] if temp_date["y"] > 0 else today.year,
+            temp_date["m"] if temp_date["m"] > 0 else 1,
+            temp_date["d"] if temp_date["d"] > 0 else 1
+        )
+        start_date = DateObject(y=given_date.year, m=given_date.month, d=given_date.day)
+        relative_date = given_date + relativedelta(years=int(context))
+        relative_date = relative_date.replace(day=1) - relativedelta(days=1)
+        end_date = DateObject(y=relative_date.year, m=relative_date.month, d=relative_date.day)
+        return [start_date, end_date]
+
+
+def years_ago(context: str, temp_date: dict) -> List[dict]:
+    ret: List[dict] = []
+
+    today = now()
+    end_date = date(
+        temp_date["y"] if temp_date["y"] > 0 else today.year,
+        temp_date["m"] if temp_date["m"] > 0 else 1,
+        temp_date["d"] if temp_date["d"] > 0 else 1,
+    )
+    start_date = end_date - relativedelta(years=int(context))
+    ret.append(DateObject(y=start_date.year, m=start_date.month, d=start_date.day))
+
+    if temp_date["d"] == 0:
+        end_date = start_date + relativedelta(months=1) - relativedelta(days=1)
+        ret.append(DateObject(y=end_date.year, m=end_date.month, d=end_date.day))
+
+    return ret
+
+
+rel_mapping = {
+    KW_LAST_YEAR: last_year,
+    KW_LAST_YEAR2: last_year,
+    KW_LAST_LAST_YEAR: last_last_year,
+    KW_QUARTER: quarter,
+    KW_FIRST_HALF: first_half,
+    KW_LAST_HALF: last_half,
+    KW_THIS_YEAR: this_year,
+    KW_THIS_YEAR2: this_year,
+    KW_THIS_MONTH: this_month,
+    KW_LAST_MONTH: last_month,
+    KW_LAST_QUARTER: last_quarter,
+    KW_TODAY: today,
+    KW_TODAY2: today,
+    KW_TODAY3: today,
+    KW_THIS_MONTH2: this_month,
+    KW_THIS_MONTH3: this_month,
+    KW_LAST_MONTH2: last_month,
+    KW_MONTHS: months,
+    KW_MONTHS_AGO: months_ago,
+    KW_YEARS: years,
+    KW_YEARS_AGO: years_ago
+}
+
+
+# parse.py
+
+def remove_stopwords(text: str) -> str:
+    cleaned = []
+    for token in text.split(" "):
+        ignore = False
+        for stopword in STOPWORDS:
+            if token.endswith(stopword):
+                cleaned.append(token[:-len(stopword)])
+                ignore = True
+                continue
+
+        if not ignore:
+            cleaned.append(token)
+
+    return " ".join(cleaned)
+
+
+def parse_year(text: str) -> str:
+    parsed = ""
+
+    tokens = list(text)
+    tokens_len = len(tokens)
+
+    skip_count = 0
+    for i, c in enumerate(tokens):
+        if skip_count > 0:
+            skip_count -= 1
+            continue
+
+        if bool(re.match(RE_IS_DIGIT, c)):
+            if i + 3 >= tokens_len:
+                pass
+
+            if (
+                    bool(re.match(RE_IS_DIGIT, tokens[i + 1]))
+                    and
+                    bool(re.match(RE_IS_DIGIT, tokens[i + 2]))
+                    and
+                    bool(re.match(RE_IS_DIGIT, tokens[i + 3]))
+                    and
+                    (i + 4 == tokens_len or not bool(re.match(RE_IS_DIGIT, tokens[i + 4])))
+            ):
+                parsed += f"<{YEAR}>{c + tokens[i + 1] + tokens[i + 2] + tokens[i + 3]}</{YEAR}>"
+                skip_count += 3
+                continue
+
+        parsed += c
+
+    return parsed
+
+
+def wrap_terms(text: str, terms_size: int = 4) -> str:
+    parsed = ""
+
+    terms = [kw for kw in REL_WORDS if len(kw) == terms_size]
+
+    tokens = list(text)
+    tokens_len = len(tokens)
+    skip_count = 0
+    for i, c in enumerate(tokens):
+        if skip_count > 0:
+            skip_count -= 1
+            continue
+
+        if i + 12 < tokens_len:
+            if "".join(tokens[i:i + 6]) == f"<{TERM}>":
+                parsed += f"<{TERM}>"
+                start_pos = i + 6
+                end_pos = i + 6 + 7
+                while True:
+                    if end_pos < tokens_len:
+                        if "".join(tokens[start_pos:end_pos]) == f"</{TERM}>":
+                            parsed += f"</{TERM}>"
+                            skip_count = end_pos - i - 1
+                            break
+
+                        else:
+                            parsed += tokens[start_pos]
+
+                    else:
+                        break
+
+                    start_pos += 1
+                    end_pos += 1
+
+                if skip_count > 0:
+                    continue
+
+        if c == " ":
+            parsed += c
+            continue
+
+        chars = []
+        for keyword in terms:
+            for j, ch in enumerate(tokens[i:]):
+                if "".join(chars).replace(" ", "") == keyword and ch == " ":
+                    break
+
+                if len(chars) > len(list(keyword)):
+                    break
+
+                chars.append(ch)
+
+            if "".join(chars).replace(" ", "") == keyword:
+                break
+            else:
+                chars.clear()
+
+        char_len = len(chars)
+        if char_len > 0:
+            parsed += f"<{TERM}>{''.join(chars)}</{TERM}>"
+            skip_count = char_len - 1
+            continue
+
+        parsed += c
+
+    if terms_size == 2:
+        return parsed
+    else:
+        return wrap_terms(parsed, terms_size - 1)
+
+
+def tag_chars(text: str) -> list:
+    tags = []
+
+    skip_count = 0
+    tokens = list(text)
+    tokens_len = len(tokens)
+
+    for i, c in enumerate(tokens):
+        if skip_count > 0:
+            skip_count -= 1
+            continue
+
+        if c == " ":
+            tags.append(PAD)
+            continue
+
+        if i + 17 < tokens_len:
+            if "".join(tokens[i:i + 6]) == f"<{YEAR}>" and "".join(tokens[i + 10:i + 17]) == f"</{YEAR}>":
+                tags.extend([YEAR for _ in range(6)])
+                tags.extend([NW for _ in range(4)])
+                tags.extend([YEAR for _ in range(7)])
+                skip_count = 16
+                continue
+
+        if i + 12 < tokens_len:
+            if "".join(tokens[i:i + 6]) == f"<{TERM}>":
+                start_pos = i + 6
+                end_pos = i + 6 + 7
+                while True:
+                    if end_pos < tokens_len:
+                        if "".join(tokens[start_pos:end_pos]) == f"</{TERM}>":
+                            tags.extend([TERM for _ in range(6)])
+                            tags.extend([RW for _ in range(start_pos - (i + 6))])
+                            tags.extend([TERM for _ in range(7)])
+                            skip_count = end_pos - i - 1
+                            break
+
+                    else:
+                        break
+
+                    start_pos += 1
+                    end_pos += 1
+
+                if skip_count > 0:
+                    continue
+
+        next_c = "" if i + 1 >= tokens_len else tokens[i + 1]
+        next_2_c = "" if i + 2 >= tokens_len else tokens[i + 2]
+        prev_t = None if i - 1 < 0 else tags[i - 1]
+        prev_2_t = None if i - 2 < 0 else tags[i - 2]
+
+        if (
+                c in ABS_WORDS
+                and
+                (prev_t == NW or prev_t == YEAR)
+        ):
+            tags.append(AW)
+
+        elif (
+                (bool(re.match(RE_IS_DIGIT, c)) or c in NUMB_WORDS)
+                and
+                (prev_t == NW or prev_t == PAD or prev_t is None or prev_t == SYMB)
+                and
+                (bool(re.match(RE_IS_DIGIT,
+                               next_c)) or next_c in NUMB_WORDS or next_c in ABS_WORDS or next_c in ALL_SYMBOLS or next_c == " "
+                 or (i + 7 < tokens_len and "".join(tokens[i + 1:i + 7]) == f"<{TERM}>"))
+                and
+                (
+                        prev_2_t is None or prev_2_t == SYMB or prev_2_t == NW or prev_2_t == AW or prev_2_t == PAD or next_2_c in ALL_SYMBOLS)
+        ):
+            tags.append(NW)
+
+        elif (
+                c in ALL_SYMBOLS
+                and
+                (prev_t == NW or prev_t == YEAR)
+                and
+                bool(re.match(RE_IS_DIGIT, next_c))
+        ):
+            tags.append(SYMB)
+
+        else:
+            tags.append(None)
+
+    return tags
+
+
+def generate_tokens(tags: list, tokens: list) -> list:
+    useful_tokens = []
+
+    counter = 0
+    for i, t in enumerate(tags):
+        if t is None:
+            counter += 1
+            continue
+
+        if t == YEAR or t == TERM:
+            continue
+
+        useful_tokens.append((tokens[i], t, counter))
+        counter += 1
+
+    return useful_tokens
+
+
+def normalize_chars(useful_tokens: list) -> list:
+    normal_tokens = []
+
+    useful_tokens_len = len(useful_tokens)
+    for idx, token in enumerate(useful_tokens):
+        c = token[0]
+        t = token[1]
+        p = token[2]
+
+        prev_token = (None, None, None) if idx - 1 < 0 else useful_tokens[idx - 1]
+        prev_t = prev_token[1]
+
+        next_token = (None, None, None) if idx + 1 >= useful_tokens_len else useful_tokens[idx + 1]
+        next_t = next_token[1]
+
+        if t == NW and not bool(re.match(RE_IS_DIGIT, c)):
+            index = NUMB_WORDS.index(c) + 1
+            if index == 10:
+                if prev_t != NW:
+                    c = "10"
+                elif next_t != NW:
+                    c = "0"
+                else:
+                    c = ""
+            elif index == 11:
+                if prev_t != NW:
+                    c = "100"
+                elif next_t != NW:
+                    c = "00"
+                else:
+                    c = ""
+            elif index == 12:
+                if prev_t != NW:
+                    c = "1000"
+                elif next_t != NW:
+                    c = "000"
+                else:
+                    c = ""
+            else:
+                c = str(index)
+
+        normal_tokens.append((c, t, p))
+
+    return normal_tokens
+
+
+def find_dates(normal_tokens: list) -> list:
+    dates = []
+
+    context = ""
+    temp_date = DateObject(y=0, m=0, d=0)
+    tokens_len = len(normal_tokens)
+    skip_counter = 0
+    for idx, token in enumerate(normal_tokens):
+        if skip_counter > 0:
+            skip_counter -= 1
+            continue
+
+        c = token[0]
+        t = token[1]
+        p = token[2]
+
+        if t == NW:
+            context += c
+            if re.search(RE_HAS_DIGIT_AND_CHAR, context):
+                if idx + 1 < tokens_len:
+                    if normal_tokens[idx + 1][1] != SYMB and normal_tokens[idx + 1][1] != NW:
+                        dates.append(misc_mapping[SYMB](context))
+                        context = ""
+                else:
+                    dates.append(misc_mapping[SYMB](context))
+                    context = ""
+
+        elif t == AW:
+            temp = abs_mapping[c](context, temp_date)
+            if (0 < temp_date["y"] != temp["y"] > 0) or (0 < temp_date["m"] != temp["m"] > 0) or (
+                    0 < temp_date["d"] != temp["d"] > 0):
+                dates.append(temp_date)
+                temp_date = temp
+            else:
+                temp_date["y"] = max(temp_date["y"], temp["y"])
+                temp_date["m"] = max(temp_date["m"], temp["m"])
+                temp_date["d"] = max(temp_date["d"], temp["d"])
+                if temp_date["y"] > 0 and temp_date["m"] > 0 and temp_date["d"] > 0:
+                    dates.append(temp_date)
+                    temp_date = DateObject(y=0, m=0, d=0)
+            context = ""
+
+        elif t == RW:
+            current = c
+            counter = idx + 1
+            while counter < tokens_len:
+                next_token = normal_tokens[counter]
+                if next_token[1] == RW:
+                    current += next_token[0]
+                else:
+                    break
+                counter += 1
+            skip_counter = counter - idx
+
+            temp = rel_mapping[current.replace(" ", "")](context, temp_date)
+            if isinstance(temp, list):
+                for _temp in temp:
+                    if _temp["y"] > 0 and _temp["m"] > 0 and _temp["d"] > 0:
+                        dates.append(_temp)
+                        temp_date = DateObject(y=0, m=0, d=0)
+                    else:
+                        temp_date["y"] = max(temp_date["y"], _temp["y"])
+                        temp_date["m"] = max(temp_date["m"], _temp["m"])
+                        temp_date["d"] = max(temp_date["d"], _temp["d"])
+                        if temp_date["y"] > 0 and temp_date["m"] > 0 and temp_date["d"] > 0:
+                            dates.append(temp_date)
+                            temp_date = DateObject(y=0, m=0, d=0)
+            else:
+                if temp["y"] > 0 and temp["m"] > 0 and temp["d"] > 0:
+                    dates.append(temp)
+                    temp_date = DateObject(y=0, m=0, d=0)
+                else:
+                    temp_date["y"] = max(temp_date["y"], temp["y"])
+                    temp_date["m"] = max(temp_date["m"], temp["m"])
+                    temp_date["d"] = max(temp_date["d"], temp["d"])
+                    if temp_date["y"] > 0 and temp_date["m"] > 0 and temp_date["d"] > 0:
+                        dates.append(temp_date)
+                        temp_date = DateObject(y=0, m=0, d=0)
+            context = ""
+
+        elif t == SYMB:
+            context += c
+
+    if temp_date["y"] > 0 or temp_date["m"] > 0 or temp_date["d"] > 0:
+        dates.append(temp_date)
+
+    return dates
+
+
+def create_full_dates(dates: list) -> list:
+    full_dates = []
+
+    for date_item in dates:
+        if date_item["y"] > 0 and date_item["m"] > 0 and date_item["d"] > 0:
+            full_dates.append(date_item)
+            continue
+
+        if date_item["y"] > 0 and date_item["m"] == 0 and date_item["d"] == 0:
+            full_dates.append(DateObject(y=date_item["y"], m=1, d=1))
+            full_dates.append(DateObject(y=date_item["y"], m=12, d=31))
+            continue
+
+        if date_item["m"] > 0 and date_item["d"] == 0:
+            year = date_item["y"] if date_item["y"] > 0 else now().year
+            relative_date = date(year, date_item["m"], 1)
+            full_dates.append(DateObject(y=relative_date.year, m=relative_date.month, d=relative_date.day))
+            relative_date = relative_date + relativedelta(months=1)
+            relative_date = relative_date.replace(day=1) - relativedelta(days=1)
+            full_dates.append(DateObject(y=relative_date.year, m=relative_date.month, d=relative_date.day))
+            continue
+
+        if date_item["y"] == 0 and date_item["m"] == 0 and date_item["d"] > 0:
+            today = now()
+            full_dates.append(DateObject(y=today.year, m=today.month, d=date_item["d"]))
+            continue
+
+    return full_dates
+
+
+def parse(text: str, today: date) -> List[Tuple[int, int, int]]:
+    """Dates the original ``parse`` finds in ``text`` as ``(y, m, d)`` tuples, on the reference date ``today``."""
+    use_date(today)
+
+    text = " ".join(text.split())
+    text = remove_stopwords(text)
+
+    text = parse_year(text)
+    text = wrap_terms(text)
+    tokens = list(text)
+    tags = tag_chars(text)
+    useful_tokens = generate_tokens(tags, tokens)
+
+    normal_tokens = normalize_chars(useful_tokens)
+    dates = find_dates(normal_tokens)
+    dates = create_full_dates(dates)
+
+    return [(d["y"], d["m"], d["d"]) for d in dates]
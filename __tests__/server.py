@@ -0,0 +1,76 @@
+import asyncio
+import json
+from datetime import date
+
+from dateparser_ko import parse, server as server_module
+from dateparser_ko.server import start
+
+TODAY = date(2024, 7, 1)
+TEXTS = ["지난달 매출", "2024년 3월 5일 보고", "날짜 없는 문장", "2023.01.02 회의", "올해 상반기 실적"]
+BROKEN = "이 문장은 추출에 실패합니다"
+
+
+async def request(port: int, method: str, path: str, payload=None, length=None) -> tuple:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {length or len(body)}\r\n"
+                 f"Connection: close\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def expected(text: str) -> list:
+    return parse(text, now=TODAY)["found_dates"]
+
+
+def failing(func):
+    """``func`` raising for BROKEN, so the error path does not depend on an input the parser cannot handle."""
+    def run(texts, **kwargs):
+        if texts == BROKEN or BROKEN in texts:
+            raise ValueError("forced failure")
+        return func(texts, **kwargs)
+
+    return run
+
+
+async def check_server():
+    server, app = await start(port=0, workers=0, window_ms=5)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        # Concurrent single requests end up in shared batches.
+        responses = await asyncio.gather(*(request(port, "POST", "/parse", {"text": text, "now": TODAY.isoformat()})
+                                           for text in TEXTS * 4))
+        assert [body["found_dates"] for _, body in responses] == [expected(text) for text in TEXTS * 4]
+        assert app.batcher.batches < len(TEXTS) * 4
+
+        status, body = await request(port, "POST", "/parse", {"texts": TEXTS, "now": TODAY.isoformat()})
+        assert status == 200
+        assert [result["found_dates"] for result in body["results"]] == [expected(text) for text in TEXTS]
+
+        assert (await request(port, "POST", "/parse", {"text": 3}))[0] == 400
+        assert (await request(port, "POST", "/parse", "{", length="12x"))[0] == 400
+
+        # Threads share the module, so the workers see the patched functions.
+        original = server_module.parse_many, server_module.parse
+        server_module.parse_many, server_module.parse = failing(original[0]), failing(original[1])
+        try:
+            status, body = await request(port, "POST", "/parse", {"text": BROKEN})
+            assert status == 422 and body == {"error": "ValueError: forced failure"}
+            status, body = await request(port, "POST", "/parse", {"texts": [BROKEN, TEXTS[0]]})
+            assert status == 200 and body["results"][0] == {"error": "ValueError: forced failure"}
+        finally:
+            server_module.parse_many, server_module.parse = original
+        assert (await request(port, "GET", "/parse"))[0] == 405
+        assert (await request(port, "GET", "/nope"))[0] == 404
+
+        status, health = await request(port, "GET", "/health")
+        assert status == 200 and health["requests"] == len(TEXTS) * 4 + 5
+        print(f"{health['batches']} batches for {health['texts']} texts, p99 {health['latency_ms']['p99']} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(check_server())
@@ -0,0 +1,71 @@
+from datetime import date
+
+from dateparser_ko import parse
+
+TODAY = date(2024, 7, 1)
+
+# Outputs of the baseline pipeline with inline <YEAR>/<TERM> markup, at TODAY.
+BASELINE = [
+    ("지난달 매출", [(2024, 6, 1), (2024, 6, 30)]),
+    ("지난 달 매출", [(2024, 6, 1), (2024, 6, 30)]),
+    ("작년 실적 보고", [(2023, 1, 1), (2023, 12, 31)]),
+    ("지난해 영업이익", [(2023, 1, 1), (2023, 12, 31)]),
+    ("재작년 매출 비교", [(2022, 1, 1), (2022, 12, 31)]),
+    ("올해 상반기 실적", [(2024, 1, 1), (2024, 5, 31)]),
+    ("2024년 상반기 매출", [(2024, 1, 1), (2024, 5, 31)]),
+    ("2023년 하반기 요약", [(2023, 6, 1), (2023, 12, 31)]),
+    ("이번연도 현황", [(2024, 1, 1), (2024, 12, 31)]),
+    ("이번달 주문 건수", [(2024, 7, 1), (2024, 7, 31)]),
+    ("금월 방문자 수", [(2024, 7, 1), (2024, 7, 31)]),
+    ("당월 실적", [(2024, 7, 1), (2024, 7, 31)]),
+    ("전월 대비 매출", [(2024, 6, 1), (2024, 6, 30)]),
+    ("지난분기 실적", [(2024, 2, 1), (2024, 5, 31)]),
+    ("3분기 매출", [(2024, 7, 1), (2024, 9, 30)]),
+    ("2024년 1분기 보고", [(2024, 1, 1), (2024, 3, 31)]),
+    ("오늘 주문 건수", [(2024, 7, 1)]),
+    ("금일 재고 현황", [(2024, 7, 1)]),
+    ("당일 고객 문의", [(2024, 7, 1)]),
+    ("3개월 매출", [(2024, 4, 1), (2024, 6, 30)]),
+    ("6개월전 실적", [(2024, 1, 1), (2024, 1, 31)]),
+    ("2개년 추이", [(2022, 1, 1), (2023, 12, 31)]),
+    ("3년전 매출", [(2021, 1, 1), (2021, 1, 31)]),
+    ("2024년 3월 매출", [(2024, 3, 1), (2024, 3, 31)]),
+    ("2024년 3월 15일 보고", [(2024, 3, 15)]),
+    ("2024.06.15 실적", [(2024, 6, 15)]),
+    ("2024-06-15 매출", [(2024, 6, 15)]),
+    ("1999년 실적 요약", [(1999, 1, 1), (1999, 12, 31)]),
+    ("작년 3월 매출", [(2023, 1, 1), (2023, 12, 31)]),
+    ("이번달 15일 보고", [(2024, 7, 5)]),
+    ("물류 센터 이전 안내", []),
+    ("전월작년 매출", [(2023, 1, 1), (2023, 12, 31)]),
+    ("2024년 2개월 매출", [(2024, 7, 1), (2024, 8, 31)]),
+    ("지난달 2024년 매출", [(2024, 6, 1), (2024, 6, 30)]),
+]
+
+
+def dates(text: str) -> list:
+    return [(d["y"], d["m"], d["d"]) for d in parse(text, now=TODAY)["found_dates"]]
+
+
+def check_baseline_outputs():
+    for text, want in BASELINE:
+        assert dates(text) == want, f"{text!r}: {dates(text)} != {want}"
+
+    assert parse("지난 달 매출", now=TODAY)["used_tokens"] == [
+        ("지", "RW", 0), ("난", "RW", 1), (" ", "RW", 2), ("달", "RW", 3), (" ", "<PAD>", 4)]
+    assert parse("2024년 3월 15일 보고", now=TODAY)["used_tokens"] == [
+        ("2", "NW", 0), ("0", "NW", 1), ("2", "NW", 2), ("4", "NW", 3), ("년", "AW", 4), (" ", "<PAD>", 5),
+        ("3", "NW", 6), ("월", "AW", 7), (" ", "<PAD>", 8), ("1", "NW", 9), ("5", "NW", 10), ("일", "AW", 11),
+        (" ", "<PAD>", 12)]
+
+
+def check_keywords_are_looked_up_one_at_a_time():
+    # Keywords next to each other, or with only unread characters between them, are not one unregistered key.
+    assert dates("물류 센터 이전 월안내작년") == [(2024, 6, 1), (2024, 6, 30)]
+    assert dates("이전 월안내작년 매출") == [(2024, 6, 1), (2024, 6, 30)]
+    assert dates("지난 달올해 매출") == dates("지난 달 올해 매출")
+    assert dates("지난 달개월전 매출") == dates("지난 달 개월전 매출")
+
+
+check_baseline_outputs()
+check_keywords_are_looked_up_one_at_a_time()
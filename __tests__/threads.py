@@ -0,0 +1,82 @@
+import os
+import sys
+import threading
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "__benchmarks__"))
+
+from dateparser_ko import parse, parse_many, parse_threaded, Lexicon, ResultCache
+from dateparser_ko.types import DateObject
+
+from corpus import generate
+
+THREADS = 16
+DATES = [date(2024, 7, 1), date(2024, 2, 29), date(2023, 12, 31)]
+TEXTS = generate(3000) + ["지난달 매출", "한두 달 전", "1년 2개월 전", "회계연도 실적", "2024.06월"]
+
+
+def fiscal_year(count, temp_date, today):
+    return DateObject(y=today.year if today.month >= 3 else today.year - 1, m=0, d=0)
+
+
+LEXICONS = [Lexicon(), Lexicon().extend({"회계연도": fiscal_year})]
+
+
+def outcome(text: str, today: date, lexicon: Lexicon, cache=None) -> object:
+    try:
+        return parse(text, lexicon=lexicon, now=today, cache=cache)
+    except Exception as e:
+        return type(e).__name__
+
+
+def worker(n: int, barrier: threading.Barrier, cache: ResultCache, results: dict):
+    barrier.wait()
+    today = DATES[n % len(DATES)]
+    lexicon = LEXICONS[n % len(LEXICONS)]
+    found = []
+    for text in TEXTS[n::3] + TEXTS:
+        result = outcome(text, today, lexicon, cache if n % 2 else None)
+        found.append(result)
+        if isinstance(result, dict):
+            # Callers may change what they get back; no other parse may see it.
+            for d in result["found_dates"]:
+                d["y"] = -n
+    results[n] = found
+
+
+def check_shared_state():
+    # Threads start together before anything has been parsed, so they race on the
+    # lazily loaded closures, the resolution tables and the shared cache.
+    sys.setswitchinterval(1e-6)
+    barrier = threading.Barrier(THREADS)
+    cache = ResultCache(maxsize=256)
+    results = {}
+    threads = [threading.Thread(target=worker, args=(n, barrier, cache, results)) for n in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sys.setswitchinterval(0.005)
+
+    for n in range(THREADS):
+        today = DATES[n % len(DATES)]
+        lexicon = LEXICONS[n % len(LEXICONS)]
+        for text, got in zip(TEXTS[n::3] + TEXTS, results[n]):
+            want = outcome(text, today, lexicon)
+            if isinstance(want, dict):
+                for d in want["found_dates"]:
+                    d["y"] = -n
+            assert got == want, f"thread {n}: {text!r}\n    serial {want}\n    threaded {got}"
+
+
+def check_parse_threaded():
+    texts = [text for text in TEXTS if isinstance(outcome(text, DATES[0], LEXICONS[0]), dict)]
+    assert parse_threaded(texts, workers=8, chunksize=64, now=DATES[0]) == parse_many(texts, now=DATES[0])
+    assert parse_threaded(texts, workers=8, chunksize=1, now=DATES[1], debug=False) == \
+        parse_many(texts, now=DATES[1], debug=False)
+    assert parse_threaded([], workers=4) == []
+
+
+check_shared_state()
+check_parse_threaded()
+print(f"{THREADS} threads x {len(TEXTS)} texts match serial parsing")
@@ -1,9 +1,70 @@
+from importlib import import_module
+
 from .parse import parse
-from .types import ParseResult, DateObject
+from .lexicon import Lexicon
+from .clock import KST
+from .cache import ResultCache
+from .tracing import trace, Trace
+from .types import ParseResult, DateObject, Date, DocumentDate
+
+# Entry points with heavier imports (asyncio, process pools, csv/json, numpy,
+# pandas) are loaded on first access.
+_LAZY = {
+    "parse_many": ".batch",
+    "parse_backfill": ".batch",
+    "parse_parallel": ".parallel",
+    "parse_threaded": ".parallel",
+    "aparse": ".aio",
+    "aparse_many": ".aio",
+    "AsyncParser": ".aio",
+    "parse_document": ".document",
+    "parse_series": ".frame",
+    "parse_array": ".frame",
+    "parse_stream": ".stream",
+    "parse_records": ".stream",
+    "parse_text_file": ".stream",
+    "parse_jsonl": ".stream",
+    "parse_csv": ".stream"
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = globals()[name] = getattr(import_module(module, __name__), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 
 __all__ = [
-    parse,
-    ParseResult,
-    DateObject
-]
\ No newline at end of file
+    "parse",
+    "parse_many",
+    "parse_backfill",
+    "parse_parallel",
+    "parse_threaded",
+    "aparse",
+    "aparse_many",
+    "AsyncParser",
+    "parse_document",
+    "parse_series",
+    "parse_array",
+    "parse_stream",
+    "parse_records",
+    "parse_text_file",
+    "parse_jsonl",
+    "parse_csv",
+    "Lexicon",
+    "KST",
+    "ResultCache",
+    "trace",
+    "Trace",
+    "ParseResult",
+    "DateObject",
+    "Date",
+    "DocumentDate"
+]
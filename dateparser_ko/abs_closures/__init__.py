@@ -1,10 +1,10 @@
-from .day import day
-from .month import month
-from .year import year
 from dateparser_ko.keywords import KW_YEAR, KW_MONTH, KW_DAY
+from dateparser_ko.registry import LazyClosures, lazy_exports
 
-mapping = {
-    KW_YEAR: year,
-    KW_MONTH: month,
-    KW_DAY: day
-}
\ No newline at end of file
+mapping = LazyClosures({
+    KW_YEAR: "year",
+    KW_MONTH: "month",
+    KW_DAY: "day"
+}, __name__)
+
+__getattr__ = lazy_exports(__name__, ["day", "month", "year"])
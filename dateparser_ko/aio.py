@@ -0,0 +1,79 @@
+import asyncio
+from concurrent.futures import Executor
+from datetime import date, timezone, tzinfo
+from typing import Iterable, List, Optional
+from weakref import WeakKeyDictionary
+
+from .batch import parse_many
+from .clock import reference_date, TimeLike
+from .lexicon import Lexicon, DEFAULT_LEXICON
+from .types import ParseResult
+
+INLINE_MAX_LENGTH = 64
+
+_default_parsers = WeakKeyDictionary()
+
+
+class AsyncParser:
+    """Runs parses off the event loop with a bound on in-flight jobs.
+
+    Work goes to ``executor`` (the loop's default thread pool when None; a
+    ProcessPoolExecutor also works). Jobs whose total input is at most
+    ``inline_max_length`` characters are parsed inline, where the executor
+    round trip would cost more than the parse.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, max_in_flight: int = 32,
+                 inline_max_length: int = INLINE_MAX_LENGTH, chunksize: int = 256,
+                 lexicon: Lexicon = DEFAULT_LEXICON, tz: tzinfo = timezone.utc):
+        self.executor = executor
+        self.inline_max_length = inline_max_length
+        self.chunksize = chunksize
+        self.lexicon = lexicon
+        self.tz = tz
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def parse(self, text: str, now: Optional[TimeLike] = None,
+                    timeout: Optional[float] = None) -> ParseResult:
+        results = await asyncio.wait_for(self._run([text], reference_date(now, self.tz)), timeout)
+        return results[0]
+
+    async def parse_many(self, texts: Iterable[str], now: Optional[TimeLike] = None,
+                         timeout: Optional[float] = None) -> List[ParseResult]:
+        texts = list(texts)
+        today = reference_date(now, self.tz)
+        jobs = [self._run(texts[i:i + self.chunksize], today) for i in range(0, len(texts), self.chunksize)]
+        chunks = await asyncio.wait_for(asyncio.gather(*jobs), timeout)
+        return [result for chunk in chunks for result in chunk]
+
+    async def _run(self, texts: List[str], today: date) -> List[ParseResult]:
+        if sum(len(text) for text in texts) <= self.inline_max_length:
+            return parse_many(texts, self.lexicon, today)
+
+        # The default lexicon is not shipped to the executor; process workers use their own copy.
+        lexicon = None if self.lexicon is DEFAULT_LEXICON else self.lexicon
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, _parse_job, texts, today, lexicon)
+
+
+def _parse_job(texts: List[str], today: date, lexicon: Optional[Lexicon]) -> List[ParseResult]:
+    return parse_many(texts, DEFAULT_LEXICON if lexicon is None else lexicon, today)
+
+
+def _default_parser() -> AsyncParser:
+    loop = asyncio.get_running_loop()
+    parser = _default_parsers.get(loop)
+    if parser is None:
+        parser = _default_parsers[loop] = AsyncParser()
+
+    return parser
+
+
+async def aparse(text: str, now: Optional[TimeLike] = None, timeout: Optional[float] = None) -> ParseResult:
+    return await _default_parser().parse(text, now, timeout)
+
+
+async def aparse_many(texts: Iterable[str], now: Optional[TimeLike] = None,
+                      timeout: Optional[float] = None) -> List[ParseResult]:
+    return await _default_parser().parse_many(texts, now, timeout)
@@ -0,0 +1,81 @@
+from datetime import date, timezone, tzinfo
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .cache import ResultCache, copy_result
+from .clock import reference_date, TimeLike
+from .lexicon import Lexicon, DEFAULT_LEXICON
+from .parse import clean_text, parse_cleaned
+from .types import ParseResult, DateTuple
+
+LAZY_MEMO_SIZE = 65536
+
+
+def parse_many(texts: Iterable[str], lexicon: Lexicon = DEFAULT_LEXICON, now: Optional[TimeLike] = None,
+               tz: tzinfo = timezone.utc, cache: Optional[ResultCache] = None, lazy: bool = False,
+               memo_size: int = LAZY_MEMO_SIZE,
+               debug: bool = True) -> Union[List[ParseResult], Iterator[ParseResult], List[DateTuple], Iterator[DateTuple]]:
+    """Parse texts in input order against one reference date.
+
+    Texts that are equal after whitespace collapsing and stopword removal are
+    parsed once; every text still gets its own result. With ``lazy=True`` results are
+    yielded one by one and only the ``memo_size`` most recent distinct inputs are
+    remembered. A ``cache`` is consulted once per distinct input. ``debug=False``
+    gives the same date tuples as ``parse``.
+    """
+    today = reference_date(now, tz)
+    if lazy:
+        return _iter_many(texts, today, lexicon, cache, memo_size, debug)
+
+    memo: Dict[str, Union[ParseResult, DateTuple]] = {}
+    results = []
+    for text in texts:
+        cleaned = clean_text(text, lexicon)
+        result = memo.get(cleaned)
+        if result is None:
+            result = memo[cleaned] = parse_cleaned(cleaned, today, lexicon, cache, debug)
+        elif debug:
+            result = copy_result(result)
+        results.append(result)
+
+    return results
+
+
+def parse_backfill(records: Iterable[Tuple[str, TimeLike]], lexicon: Lexicon = DEFAULT_LEXICON,
+                   tz: tzinfo = timezone.utc, cache: Optional[ResultCache] = None,
+                   debug: bool = True) -> List[Union[ParseResult, DateTuple]]:
+    """Parse ``(text, timestamp)`` records, each against its own reference date.
+
+    Records are grouped by reference date so every date is resolved once and
+    texts repeated on the same date are parsed once. Results are returned in
+    input order.
+    """
+    groups: Dict[date, List[int]] = {}
+    texts = []
+    for i, (text, now) in enumerate(records):
+        texts.append(text)
+        groups.setdefault(reference_date(now, tz), []).append(i)
+
+    results = [None] * len(texts)
+    for today, indices in groups.items():
+        group = parse_many([texts[i] for i in indices], lexicon, today, cache=cache, debug=debug)
+        for i, result in zip(indices, group):
+            results[i] = result
+
+    return results
+
+
+def _iter_many(texts: Iterable[str], today: date, lexicon: Lexicon, cache: Optional[ResultCache],
+               memo_size: int, debug: bool = True) -> Iterator[Union[ParseResult, DateTuple]]:
+    memo: Dict[str, Union[ParseResult, DateTuple]] = {}
+    for text in texts:
+        cleaned = clean_text(text, lexicon)
+        result = memo.get(cleaned)
+        if result is None:
+            result = parse_cleaned(cleaned, today, lexicon, cache, debug)
+            if memo and len(memo) >= memo_size:
+                del memo[next(iter(memo))]
+            # Results are yielded before later duplicates are seen, so the memo keeps its own copy.
+            memo[cleaned] = copy_result(result) if debug else result
+        elif debug:
+            result = copy_result(result)
+        yield result
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from datetime import date
+from threading import Lock
+from typing import Optional
+
+from .types import ParseResult, DateObject
+
+
+def copy_result(result: ParseResult) -> ParseResult:
+    return ParseResult(
+        found_dates=[DateObject(y=d["y"], m=d["m"], d=d["d"]) for d in result["found_dates"]],
+        used_tokens=list(result["used_tokens"]),
+        cleaned=result["cleaned"]
+    )
+
+
+class ResultCache:
+    """Bounded LRU cache of parse results.
+
+    Entries are keyed on the cleaned text, the reference date and the lexicon, so
+    relative terms stop matching old entries once the date moves on. Every lookup
+    hands out a fresh copy of the stored result.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, cleaned: str, today: date, lexicon) -> Optional[ParseResult]:
+        key = (cleaned, today, lexicon)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return copy_result(result)
+
+    def put(self, cleaned: str, today: date, lexicon, result: ParseResult):
+        if self.maxsize <= 0:
+            return
+
+        key = (cleaned, today, lexicon)
+        result = copy_result(result)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
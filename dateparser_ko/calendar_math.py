@@ -0,0 +1,78 @@
+from typing import Tuple
+
+MIN_YEAR = 1
+MAX_YEAR = 9999
+
+# Two-digit years are read the way strptime's %y reads them: 69-99 are 19xx, 00-68 are 20xx.
+CENTURY_PIVOT = 69
+
+# Days per month for common and leap years, indexed by month (index 0 unused).
+MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+LEAP_MONTH_DAYS = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+YearMonth = Tuple[int, int]
+YearMonthDay = Tuple[int, int, int]
+
+
+def is_leap(y: int) -> bool:
+    return y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+
+
+def month_end(y: int, m: int) -> int:
+    """Number of days in month ``m`` of year ``y``."""
+    return LEAP_MONTH_DAYS[m] if is_leap(y) else MONTH_DAYS[m]
+
+
+def check_date(y: int, m: int, d: int) -> YearMonthDay:
+    """Validate a date the way ``datetime.date`` does, raising ValueError."""
+    if not MIN_YEAR <= y <= MAX_YEAR:
+        raise ValueError(f"year {y} is out of range")
+    if not 1 <= m <= 12:
+        raise ValueError("month must be in 1..12")
+    if not 1 <= d <= month_end(y, m):
+        raise ValueError("day is out of range for month")
+
+    return y, m, d
+
+
+def is_valid_date(y: int, m: int, d: int) -> bool:
+    return MIN_YEAR <= y <= MAX_YEAR and 1 <= m <= 12 and 1 <= d <= month_end(y, m)
+
+
+def short_year(yy: int) -> int:
+    return yy + (1900 if yy >= CENTURY_PIVOT else 2000)
+
+
+def can_add_months(y: int, m: int, months: int) -> bool:
+    """Whether ``add_months`` stays within the years ``date`` supports."""
+    return MIN_YEAR <= (y * 12 + m - 1 + months) // 12 <= MAX_YEAR
+
+
+def add_months(y: int, m: int, months: int) -> YearMonth:
+    index = y * 12 + m - 1 + months
+    y, m = divmod(index, 12)
+    if not MIN_YEAR <= y <= MAX_YEAR:
+        raise ValueError(f"year {y} is out of range")
+
+    return y, m + 1
+
+
+def shift_months(y: int, m: int, d: int, months: int) -> YearMonthDay:
+    """Move a date by whole months, clamping the day to the end of the target month."""
+    y, m = add_months(y, m, months)
+    return y, m, min(d, month_end(y, m))
+
+
+def shift_years(y: int, m: int, d: int, years: int) -> YearMonthDay:
+    return shift_months(y, m, d, years * 12)
+
+
+def quarter_of(m: int) -> int:
+    return (m - 1) // 3 + 1
+
+
+def quarter_range(y: int, q: int) -> Tuple[YearMonthDay, YearMonthDay]:
+    """First and last day of quarter ``q`` (1-4) of year ``y``."""
+    first = q * 3 - 2
+    last = q * 3
+    return (y, first, 1), (y, last, month_end(y, last))
@@ -0,0 +1,226 @@
+import argparse
+import csv
+import json
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .batch import parse_many
+from .clock import reference_date, KST
+
+CHUNK_BYTES = 4 << 20
+FORMATS = ("text", "jsonl", "csv")
+
+
+class ExtractOptions(NamedTuple):
+    fmt: str
+    field: Optional[str]
+    column: Optional[int]
+    id_key: Union[str, int, None]
+    today: date
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="dateparser-ko", description="한글에서 날짜 추출하기")
+    parser.add_argument("input", help="UTF-8 text, JSONL or CSV file")
+    parser.add_argument("-o", "--output", help="JSONL output path (default: stdout)")
+    parser.add_argument("-f", "--format", choices=FORMATS, help="input format (default: from the file extension)")
+    parser.add_argument("--field", help="JSONL field to parse")
+    parser.add_argument("--column", help="CSV column to parse, by header name or 0-based index")
+    parser.add_argument("--id", dest="id_key", help="JSONL field or CSV column copied to the output as \"id\"")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES, help="bytes per worker job")
+    parser.add_argument("--now", help="reference date or datetime in ISO format (default: current time)")
+    parser.add_argument("--tz", default="UTC", help="UTC, KST or an offset such as +09:00 (default: UTC)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print throughput statistics")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "serve":
+        from .server import main as serve
+        return serve(argv[1:])
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    fmt = args.format or _guess_format(args.input)
+    if fmt == "jsonl" and not args.field:
+        parser.error("--field is required for JSONL input")
+    if fmt == "csv" and args.column is None:
+        parser.error("--column is required for CSV input")
+
+    today = reference_date(_parse_now(args.now), _parse_tz(args.tz))
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    started = time.perf_counter()
+    try:
+        records, dated, size = extract(args.input, out, fmt, args.field, args.column, args.id_key, today,
+                                       args.workers, args.chunk_bytes)
+    finally:
+        if args.output:
+            out.close()
+        else:
+            out.flush()
+
+    if not args.quiet:
+        seconds = max(time.perf_counter() - started, 1e-9)
+        print(f"{records} records ({dated} with dates), {size / 1e6:.1f} MB in {seconds:.2f}s: "
+              f"{records / seconds:.0f} records/s, {size / 1e6 / seconds:.1f} MB/s", file=sys.stderr)
+
+    return 0
+
+
+def extract(path: str, out, fmt: str, field: Optional[str], column: Optional[str], id_key: Optional[str],
+            today: date, workers: int = 1, chunk_bytes: int = CHUNK_BYTES) -> Tuple[int, int, int]:
+    """Write one JSONL line per input record and return (records, dated records, bytes)."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0, 0, 0
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        if fmt == "csv":
+            header_end = mm.find(b"\n")
+            header_end = size if header_end == -1 else header_end + 1
+            header = next(csv.reader([mm[:header_end].decode("utf-8-sig").rstrip("\r\n")]))
+            column = _column_index(header, column)
+            id_key = None if id_key is None else _column_index(header, id_key)
+            start = header_end
+
+        options = ExtractOptions(fmt, field, column, id_key, today)
+        jobs = ((path, chunk_start, chunk_end, options) for chunk_start, chunk_end in _split(mm, start, size, chunk_bytes))
+
+        records = dated = 0
+        for blob, count, count_dated in _run(jobs, workers):
+            out.write(blob)
+            records += count
+            dated += count_dated
+
+    return records, dated, size
+
+
+def _run(jobs: Iterator[tuple], workers: int) -> Iterator[Tuple[bytes, int, int]]:
+    if workers <= 1:
+        yield from map(_extract_range, jobs)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for job in jobs:
+            pending.append(executor.submit(_extract_range, job))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _split(mm: mmap.mmap, start: int, size: int, chunk_bytes: int) -> Iterator[Tuple[int, int]]:
+    while start < size:
+        end = min(start + chunk_bytes, size)
+        if end < size:
+            newline = mm.find(b"\n", end - 1)
+            end = size if newline == -1 else newline + 1
+        yield start, end
+        start = end
+
+
+def _extract_range(job: tuple) -> Tuple[bytes, int, int]:
+    path, start, end, options = job
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        records = list(_read_records(mm, start, end, options))
+
+    results = parse_many([text for _, _, _, text in records], now=options.today)
+
+    lines = []
+    dated = 0
+    for (offset, length, record_id, _), result in zip(records, results):
+        line = {"offset": offset, "length": length}
+        if options.id_key is not None:
+            line["id"] = record_id
+        line["found_dates"] = result["found_dates"]
+        lines.append(json.dumps(line, ensure_ascii=False))
+        dated += bool(result["found_dates"])
+
+    blob = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+    return blob, len(records), dated
+
+
+def _read_records(mm: mmap.mmap, start: int, end: int, options: ExtractOptions) -> Iterator[tuple]:
+    pos = start
+    while pos < end:
+        newline = mm.find(b"\n", pos, end)
+        stop = end if newline == -1 else newline
+        line = mm[pos:stop]
+        length = len(line)
+        if line.endswith(b"\r"):
+            line = line[:-1]
+
+        if options.fmt == "text":
+            yield pos, length, None, line.decode("utf-8", errors="replace")
+
+        elif line.strip():
+            if options.fmt == "jsonl":
+                record = json.loads(line)
+                record_id = None if options.id_key is None else record.get(options.id_key)
+                yield pos, length, record_id, _as_text(record.get(options.field))
+            else:
+                row = next(csv.reader([line.decode("utf-8", errors="replace")]))
+                record_id = None if options.id_key is None else _cell(row, options.id_key)
+                yield pos, length, record_id, _as_text(_cell(row, options.column))
+
+        pos = stop + 1
+
+
+def _guess_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if ext == ".csv":
+        return "csv"
+    return "text"
+
+
+def _column_index(header: List[str], column: str) -> int:
+    if column in header:
+        return header.index(column)
+    if column.isdigit():
+        return int(column)
+    raise SystemExit(f"dateparser-ko: column {column!r} not found in CSV header")
+
+
+def _cell(row: List[str], index: int) -> Optional[str]:
+    return row[index] if index < len(row) else None
+
+
+def _as_text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def _parse_now(value: Optional[str]) -> Union[date, datetime, None]:
+    if value is None:
+        return None
+    if len(value) == 10:
+        return date.fromisoformat(value)
+    return datetime.fromisoformat(value)
+
+
+def _parse_tz(value: str) -> tzinfo:
+    name = value.upper()
+    if name == "UTC":
+        return timezone.utc
+    if name == "KST":
+        return KST
+
+    sign = -1 if value.startswith("-") else 1
+    hours, _, minutes = value.lstrip("+-").partition(":")
+    return timezone(sign * timedelta(hours=int(hours), minutes=int(minutes or 0)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
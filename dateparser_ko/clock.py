@@ -0,0 +1,23 @@
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Optional, Union
+
+KST = timezone(timedelta(hours=9), "KST")
+
+TimeLike = Union[date, datetime]
+
+
+def reference_date(now: Optional[TimeLike] = None, tz: tzinfo = timezone.utc) -> date:
+    """Return the calendar date relative terms are resolved against.
+
+    ``now`` defaults to the current time. An aware datetime is converted to ``tz``
+    first; a naive datetime or a plain date is taken as already being in ``tz``.
+    """
+    if now is None:
+        return datetime.now(tz=tz).date()
+
+    if isinstance(now, datetime):
+        if now.tzinfo is not None:
+            now = now.astimezone(tz)
+        return now.date()
+
+    return now
@@ -0,0 +1,340 @@
+import re
+from datetime import date
+from typing import Callable, List, Optional
+
+from .keywords import KW_YEAR, KW_MONTHS, KW_MONTHS_AGO, KW_MONTHS_NATIVE, KW_MONTHS_NATIVE_AGO
+from .misc_closures import mapping as misc_mapping
+from .patterns import RE_HAS_DIGIT_AND_CHAR
+from .resolution import resolution_table
+from .tags import AW, NW, PAD, RW, SYMB
+from .tracing import Trace
+from .types import DateObject
+
+# Integer ids of the token tags, used to index the transition table.
+TAG_IDS = {NW: 0, AW: 1, RW: 2, SYMB: 3, PAD: 4}
+
+# States of the token machine.
+EMPTY = 0         # nothing pending
+NUMBER = 1        # digits, kept as an integer
+SYMBOL = 2        # digits and separators that do not end in a digit yet ("2024.")
+SYMBOL_READY = 3  # a separated date that is complete unless more digits follow ("2024.06")
+PAIR = 4          # "1-2" kept across spaces in case a counted keyword follows
+
+STATES = [EMPTY, NUMBER, SYMBOL, SYMBOL_READY, PAIR]
+
+# Composition rules: (states, tag, action). The action names a Composer method
+# that consumes tokens and returns how many it used; 0 means the token is
+# dispatched again in the state the action left. Tags a state does not list
+# are skipped.
+RULES = [
+    ([EMPTY], NW, "start_number"),
+    ([NUMBER], NW, "add_digits"),
+    ([SYMBOL, SYMBOL_READY], NW, "add_symbol_digits"),
+    ([EMPTY, NUMBER, SYMBOL, SYMBOL_READY], SYMB, "add_symbol"),
+    ([EMPTY, NUMBER, SYMBOL], AW, "apply_unit"),
+    ([EMPTY, NUMBER, SYMBOL], RW, "apply_keyword"),
+    ([SYMBOL_READY, PAIR], RW, "apply_pair"),
+    ([SYMBOL_READY], PAD, "hold_pair"),
+    ([SYMBOL_READY], AW, "flush_symbol"),
+    ([PAIR], NW, "flush_symbol"),
+    ([PAIR], SYMB, "flush_symbol"),
+    ([PAIR], AW, "flush_symbol"),
+]
+
+# Counted units that carry into the next counted keyword instead of resolving
+# on their own: "1년 2개월 전" is 14 months ago.
+DURATIONS = {
+    KW_YEAR: (12, frozenset([KW_MONTHS, KW_MONTHS_AGO, KW_MONTHS_NATIVE, KW_MONTHS_NATIVE_AGO])),
+}
+MAX_DURATION = 100
+
+# Count ranges written with a dash before a keyword ("1-2개월"). Both ends are
+# at most 12, so the pair can never be a date on its own.
+RE_PAIR = re.compile(r"(\d{1,2})-(\d{1,2})")
+MAX_PAIR = 12
+
+
+def compile_rules(rules: list) -> List[List[Optional[Callable]]]:
+    """Transition table indexed by ``[state][tag id]``."""
+    table = [[None] * len(TAG_IDS) for _ in STATES]
+    for states, tag, action in rules:
+        for state in states:
+            table[state][TAG_IDS[tag]] = getattr(Composer, action)
+
+    return table
+
+
+def keyword_of(tokens: list, start: int, end: int) -> str:
+    return "".join([token[0] for token in tokens[start:end]]).replace(" ", "")
+
+
+def resolve_range(closure: Callable, low: int, high: int, temp_date: DateObject, today: date) -> List[DateObject]:
+    """Resolve a counted keyword for an approximate count as the range covering both ends."""
+    found = []
+    for count in (low, high):
+        temp = closure(count, temp_date, today)
+        found += temp if isinstance(temp, list) else [temp]
+    if not found:
+        return []
+
+    def key(d: DateObject) -> tuple:
+        return d["y"], d["m"], d["d"]
+
+    return [DateObject(**min(found, key=key)), DateObject(**max(found, key=key))]
+
+
+class Composer:
+    """Token machine that builds dates from normalized tokens, driven by TRANSITIONS.
+
+    The pending date is kept as three integers and only turned into a DateObject
+    when it is emitted or handed to a closure.
+    """
+
+    __slots__ = ("today", "lexicon", "trace", "positions", "dates", "state", "number", "width", "high", "context",
+                 "context_start", "context_end", "carry", "carry_start", "y", "m", "d", "temp_start", "temp_end")
+
+    def __init__(self, today: date, lexicon, trace: Optional[Trace] = None, positions: Optional[list] = None):
+        self.today = today
+        self.lexicon = lexicon
+        self.trace = trace
+        self.positions = positions
+        self.dates: List[DateObject] = []
+        self.state = EMPTY
+        self.number = self.width = self.high = 0
+        self.context = ""
+        self.context_start = self.context_end = 0
+        self.carry = 0
+        self.carry_start = None
+        self.y = self.m = self.d = 0
+        self.temp_start = self.temp_end = None
+
+    def run(self, tokens: list) -> List[DateObject]:
+        table = TRANSITIONS
+        tokens_len = len(tokens)
+        idx = 0
+        while idx < tokens_len:
+            action = table[self.state][TAG_IDS[tokens[idx][1]]]
+            idx += 1 if action is None else action(self, tokens, idx)
+
+        if self.state == SYMBOL_READY or self.state == PAIR:
+            self.emit_symbol()
+        if self.y > 0 or self.m > 0 or self.d > 0:
+            self.push(self.temp_start, self.temp_end)
+
+        return self.dates
+
+    # Numbers and separated dates
+
+    def start_number(self, tokens: list, idx: int) -> int:
+        c, _, p, high = tokens[idx]
+        self.context_start = p
+        if not c.isdecimal():
+            self.context = c
+            self.state = SYMBOL
+            return 1
+
+        self.number = int(c)
+        self.width = len(c)
+        self.high = high
+        self.state = NUMBER
+        return 1
+
+    def add_digits(self, tokens: list, idx: int) -> int:
+        c, _, p, _ = tokens[idx]
+        if not c.isdecimal():
+            self.context = self.digits() + c
+            self.context_end = p
+            self.state = SYMBOL_READY
+            return 1
+
+        self.number = self.number * 10 ** len(c) + int(c)
+        self.width += len(c)
+        self.high = 0
+        return 1
+
+    def add_symbol(self, tokens: list, idx: int) -> int:
+        c, _, p, _ = tokens[idx]
+        if self.state == EMPTY:
+            self.context_start = p
+            self.context = c
+        elif self.state == NUMBER:
+            self.context = self.digits() + c
+        else:
+            self.context += c
+        self.state = SYMBOL
+        return 1
+
+    def add_symbol_digits(self, tokens: list, idx: int) -> int:
+        c, _, p, _ = tokens[idx]
+        self.context += c
+        self.context_end = p
+        if self.state == SYMBOL and re.search(RE_HAS_DIGIT_AND_CHAR, self.context) is not None:
+            self.state = SYMBOL_READY
+        return 1
+
+    def digits(self) -> str:
+        return str(self.number).zfill(self.width)
+
+    def flush_symbol(self, tokens: list, idx: int) -> int:
+        self.emit_symbol()
+        return 0
+
+    def emit_symbol(self):
+        closure = misc_mapping[SYMB]
+        if self.trace is not None:
+            self.trace.closure("misc_closures", closure)
+        self.dates.append(closure(self.context))
+        if self.positions is not None:
+            self.positions.append((self.context_start, self.context_end + 1))
+        self.reset()
+
+    def hold_pair(self, tokens: list, idx: int) -> int:
+        if self.pair() is None:
+            return self.flush_symbol(tokens, idx)
+
+        self.state = PAIR
+        return 1
+
+    def pair(self) -> Optional[tuple]:
+        match = RE_PAIR.fullmatch(self.context)
+        if match is None:
+            return None
+        low, high = int(match.group(1)), int(match.group(2))
+        return (low, high) if low < high <= MAX_PAIR else None
+
+    def apply_pair(self, tokens: list, idx: int) -> int:
+        pair = self.pair()
+        if pair is None:
+            return self.flush_symbol(tokens, idx)
+
+        self.state = NUMBER
+        self.number, self.high = pair
+        return self.apply_keyword(tokens, idx)
+
+    # Units and keywords
+
+    def count(self) -> Optional[int]:
+        return self.number if self.state == NUMBER else None
+
+    def apply_unit(self, tokens: list, idx: int) -> int:
+        c, _, p, _ = tokens[idx]
+        start = p if self.state == EMPTY else self.context_start
+        count = self.count()
+        if count is None:
+            # Nothing to count: the unit follows a separated date ("2024.06.15일", "1-2월").
+            self.reset()
+            return 1
+
+        duration = DURATIONS.get(c)
+        if duration is not None and count < MAX_DURATION \
+                and self.counted_next(tokens, idx + 1, duration[1]):
+            self.carry = count * duration[0]
+            self.carry_start = start
+            self.reset()
+            return 1
+
+        closure = self.lexicon.abs_mapping[c]
+        if self.trace is not None:
+            self.trace.closure("abs_closures", closure)
+        temp = closure(count, DateObject(y=self.y, m=self.m, d=self.d))
+        self.reset()
+
+        if (0 < self.y != temp["y"] > 0) or (0 < self.m != temp["m"] > 0) or (0 < self.d != temp["d"] > 0):
+            self.push(self.temp_start, self.temp_end)
+            self.y, self.m, self.d = temp["y"], temp["m"], temp["d"]
+            self.temp_start, self.temp_end = start, p + 1
+        else:
+            self.merge(temp, start, p + 1)
+        return 1
+
+    def counted_next(self, tokens: list, idx: int, keywords: frozenset) -> bool:
+        """Whether a number and then one of ``keywords`` follow from ``idx`` on, spaces aside."""
+        tokens_len = len(tokens)
+        while idx < tokens_len and tokens[idx][1] == PAD:
+            idx += 1
+        if idx == tokens_len or tokens[idx][1] != NW:
+            return False
+        while idx < tokens_len and tokens[idx][1] == NW:
+            idx += 1
+        while idx < tokens_len and tokens[idx][1] == PAD:
+            idx += 1
+
+        keyword = []
+        while idx < tokens_len and tokens[idx][1] == RW:
+            keyword.append(tokens[idx][0])
+            idx += 1
+        return "".join(keyword).replace(" ", "") in keywords
+
+    def apply_keyword(self, tokens: list, idx: int) -> int:
+        start = tokens[idx][2] if self.state == EMPTY else self.context_start
+        count = self.count()
+        high = self.high if count is not None else 0
+        if self.carry:
+            start = self.carry_start
+            if count is not None:
+                count += self.carry
+                high = high and high + self.carry
+
+        lexicon = self.lexicon
+        counter = idx + 1
+        while counter < len(tokens) and tokens[counter][1] == RW and tokens[counter][2] == tokens[counter - 1][2] + 1:
+            counter += 1
+        # Keywords are resolved one at a time, longest registered key first, whether
+        # unread characters sit between them ("전 월안내작년") or not ("지난 달올해").
+        keyword = keyword_of(tokens, idx, counter)
+        while keyword not in lexicon.rel_mapping and counter > idx + 1:
+            counter -= 1
+            keyword = keyword_of(tokens, idx, counter)
+        end = tokens[counter - 1][2] + 1
+
+        closure = lexicon.rel_mapping[keyword]
+        if self.trace is not None:
+            self.trace.closure("rel_closures", closure)
+        temp_date = DateObject(y=self.y, m=self.m, d=self.d)
+        if keyword in lexicon.date_only:
+            temp = resolution_table(lexicon, self.today).resolve(keyword, closure)
+        elif high:
+            temp = resolve_range(closure, count, high, temp_date, self.today)
+        else:
+            temp = closure(count, temp_date, self.today)
+        self.reset()
+        self.carry = 0
+
+        for _temp in (temp if isinstance(temp, list) else [temp]):
+            if _temp["y"] > 0 and _temp["m"] > 0 and _temp["d"] > 0:
+                self.dates.append(_temp)
+                if self.positions is not None:
+                    self.positions.append((start, end))
+                self.y = self.m = self.d = 0
+                self.temp_start = None
+            else:
+                self.merge(_temp, start, end)
+
+        return counter - idx
+
+    # Pending date
+
+    def merge(self, temp: DateObject, start: int, end: int):
+        self.y = max(self.y, temp["y"])
+        self.m = max(self.m, temp["m"])
+        self.d = max(self.d, temp["d"])
+        if self.temp_start is None:
+            self.temp_start = start
+        self.temp_end = end
+        if self.y > 0 and self.m > 0 and self.d > 0:
+            self.push(self.temp_start, self.temp_end)
+            self.y = self.m = self.d = 0
+            self.temp_start = None
+
+    def push(self, start: Optional[int], end: Optional[int]):
+        self.dates.append(DateObject(y=self.y, m=self.m, d=self.d))
+        if self.positions is not None:
+            self.positions.append((start, end))
+
+    def reset(self):
+        self.state = EMPTY
+        self.number = self.width = self.high = 0
+        self.context = ""
+
+
+TRANSITIONS = compile_rules(RULES)
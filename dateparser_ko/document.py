@@ -0,0 +1,114 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timezone, tzinfo
+from typing import Iterator, List, Optional, Tuple
+
+from .clock import reference_date, TimeLike
+from .lexicon import Lexicon, DEFAULT_LEXICON
+from .parse import strip_stopword, parse_year, wrap_terms, tag_chars, generate_tokens, normalize_chars, find_dates, \
+    create_full_dates
+from .types import DateObject, DocumentDate
+
+MAX_SEGMENT_LENGTH = 1000
+
+# Line breaks, and whitespace after sentence-ending punctuation. "2024.06.15" is
+# left alone because its dots are not followed by whitespace.
+RE_SEGMENT_BREAK = re.compile(r"\n|(?<=[.!?。])\s+")
+RE_TOKEN = re.compile(r"\S+")
+
+
+def parse_document(text: str, lexicon: Lexicon = DEFAULT_LEXICON, now: Optional[TimeLike] = None,
+                   tz: tzinfo = timezone.utc, workers: int = 1, chunksize: int = 256) -> List[DocumentDate]:
+    """Extract dates from a long text, with offsets into ``text``.
+
+    The text is split into sentences and lines of at most ``MAX_SEGMENT_LENGTH``
+    characters, which are parsed independently (across ``workers`` processes when
+    more than one). A month without a year takes the year of the latest date in
+    an earlier segment, so "2024년 실적 보고. 3월 매출은 ..." still resolves to March 2024.
+    ``start`` and ``end`` cover the characters the date was read from.
+    """
+    today = reference_date(now, tz)
+    segments = [(start, text[start:end]) for start, end in split_segments(text)]
+
+    if workers > 1 and len(segments) > chunksize:
+        # The default lexicon is not shipped to the workers; they use their own copy.
+        job_lexicon = None if lexicon is DEFAULT_LEXICON else lexicon
+        chunks = [segments[i:i + chunksize] for i in range(0, len(segments), chunksize)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            jobs = executor.map(_resolve_chunk, chunks, [today] * len(chunks), [job_lexicon] * len(chunks))
+            resolved = [segment_dates for chunk in jobs for segment_dates in chunk]
+    else:
+        resolved = _resolve_chunk(segments, today, lexicon)
+
+    found_dates = []
+    year = 0
+    for segment_dates in resolved:
+        segment_year = year
+        for y, m, d, start, end in segment_dates:
+            if y == 0 and m > 0:
+                y = year
+            elif isinstance(y, int) and y > 0:
+                segment_year = y
+
+            for full_date in create_full_dates([DateObject(y=y, m=m, d=d)], today):
+                found_dates.append(DocumentDate(full_date["y"], full_date["m"], full_date["d"], start, end))
+        year = segment_year
+
+    return found_dates
+
+
+def split_segments(text: str, max_length: int = MAX_SEGMENT_LENGTH) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, end)`` offsets of the non-blank sentences and lines of ``text``."""
+    start = 0
+    for match in RE_SEGMENT_BREAK.finditer(text):
+        yield from _bounded(text, start, match.start(), max_length)
+        start = match.end()
+
+    yield from _bounded(text, start, len(text), max_length)
+
+
+def clean_segment(text: str, offset: int = 0, lexicon: Lexicon = DEFAULT_LEXICON) -> Tuple[str, List[int]]:
+    """Same result as ``clean_text``, plus the original offset of every cleaned character."""
+    parts = []
+    offsets = []
+    for match in RE_TOKEN.finditer(text):
+        if parts:
+            parts.append(" ")
+            offsets.append(offset + match.start() - 1)
+
+        token = strip_stopword(match.group(), lexicon)
+        parts.append(token)
+        offsets.extend(range(offset + match.start(), offset + match.start() + len(token)))
+
+    return "".join(parts), offsets
+
+
+def _bounded(text: str, start: int, end: int, max_length: int) -> Iterator[Tuple[int, int]]:
+    while end - start > max_length:
+        cut = text.rfind(" ", start + 1, start + max_length)
+        if cut == -1:
+            cut = start + max_length
+        yield start, cut
+        start = cut
+
+    if not text[start:end].isspace() and start < end:
+        yield start, end
+
+
+def _resolve_chunk(segments: List[Tuple[int, str]], today: date, lexicon: Optional[Lexicon]) -> List[List[tuple]]:
+    lexicon = DEFAULT_LEXICON if lexicon is None else lexicon
+    resolved = []
+    for offset, segment in segments:
+        cleaned, offsets = clean_segment(segment, offset, lexicon)
+        if not lexicon.may_contain_dates(cleaned):
+            resolved.append([])
+            continue
+
+        spans = sorted(parse_year(cleaned) + wrap_terms(cleaned, lexicon))
+        tokens = generate_tokens(tag_chars(cleaned, spans, lexicon), cleaned)
+        positions = []
+        dates = find_dates(normalize_chars(tokens, lexicon), today, lexicon, positions=positions)
+        resolved.append([(found["y"], found["m"], found["d"], offsets[start], offsets[end - 1] + 1)
+                         for found, (start, end) in zip(dates, positions)])
+
+    return resolved
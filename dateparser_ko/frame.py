@@ -0,0 +1,142 @@
+from datetime import date, timezone, tzinfo
+from importlib import import_module
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .batch import parse_many
+from .clock import reference_date, TimeLike
+from .lexicon import Lexicon, DEFAULT_LEXICON
+
+# numpy and pandas are optional and imported by the first call that needs them.
+np = None
+pd = None
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+NAT = -(1 << 63)
+
+
+class ArrayResult(NamedTuple):
+    start: Any
+    end: Any
+    count: Any
+    exploded: Optional[Dict[str, Any]] = None
+
+
+def parse_array(values: Iterable, lexicon: Lexicon = DEFAULT_LEXICON, now: Optional[TimeLike] = None,
+                tz: tzinfo = timezone.utc, explode: bool = False) -> ArrayResult:
+    """Parse a column of texts into ``datetime64[D]`` arrays.
+
+    Every distinct value is parsed once. ``start`` and ``end`` hold the earliest
+    and latest date found in each row (NaT when there is none) and ``count`` the
+    number of dates. With ``explode=True``, ``exploded`` holds one entry per found
+    date: the row number, ``y``/``m``/``d`` and the ``date`` (NaT when invalid).
+    """
+    _load_numpy()
+    codes, uniques = _factorize(values)
+    return _parse_codes(codes, uniques, lexicon, reference_date(now, tz), explode)
+
+
+def parse_series(series, lexicon: Lexicon = DEFAULT_LEXICON, now: Optional[TimeLike] = None,
+                 tz: tzinfo = timezone.utc, explode: bool = False):
+    """Parse a pandas Series into a frame with ``start``, ``end`` and ``count`` columns.
+
+    The frame keeps the index of ``series``. With ``explode=True`` a second frame
+    is returned with one row per found date, indexed by the row it came from.
+    """
+    _load_numpy()
+    _load_pandas()
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    result = _parse_codes(codes, list(uniques), lexicon, reference_date(now, tz), explode)
+
+    frame = pd.DataFrame({"start": result.start, "end": result.end, "count": result.count}, index=series.index)
+    if not explode:
+        return frame
+
+    exploded = dict(result.exploded)
+    rows = exploded.pop("row")
+    return frame, pd.DataFrame(exploded, index=series.index[rows])
+
+
+def _parse_codes(codes, uniques: List, lexicon: Lexicon, today: date, explode: bool) -> ArrayResult:
+    results = parse_many([_as_text(value) for value in uniques], lexicon, today, debug=False)
+
+    # One extra entry at the end for missing values, which factorize codes as -1.
+    start = np.full(len(results) + 1, NAT, dtype=np.int64)
+    end = np.full(len(results) + 1, NAT, dtype=np.int64)
+    count = np.zeros(len(results) + 1, dtype=np.int64)
+    days = []
+    for i, found_dates in enumerate(results):
+        found_days = [_epoch_days(*found) for found in found_dates]
+        days.append(found_days)
+        count[i] = len(found_dates)
+        valid = [day for day in found_days if day != NAT]
+        if valid:
+            start[i] = min(valid)
+            end[i] = max(valid)
+
+    codes = np.asarray(codes, dtype=np.int64)
+    counts = count[codes]
+    result = ArrayResult(start[codes].view("datetime64[D]"), end[codes].view("datetime64[D]"), counts)
+    if not explode:
+        return result
+
+    return result._replace(exploded=_explode(codes, counts, results, days))
+
+
+def _explode(codes, counts, results: List[tuple], days: List[List[int]]) -> Dict[str, Any]:
+    rows = np.flatnonzero(counts)
+    picked = codes[rows]
+    found = [d for code in picked for d in results[code]]
+    found_days = [day for code in picked for day in days[code]]
+    return {
+        "row": np.repeat(rows, counts[rows]),
+        "y": np.fromiter((d.y for d in found), dtype=np.int64, count=len(found)),
+        "m": np.fromiter((d.m for d in found), dtype=np.int64, count=len(found)),
+        "d": np.fromiter((d.d for d in found), dtype=np.int64, count=len(found)),
+        "date": np.array(found_days, dtype=np.int64).view("datetime64[D]")
+    }
+
+
+def _factorize(values: Iterable) -> Tuple[Any, List]:
+    index = {}
+    uniques = []
+    codes = []
+    for value in values:
+        if value is None or value != value:
+            codes.append(-1)
+            continue
+
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(uniques)
+            uniques.append(value)
+        codes.append(code)
+
+    return np.array(codes, dtype=np.int64), uniques
+
+
+def _epoch_days(y: int, m: int, d: int) -> int:
+    try:
+        return date(y, m, d).toordinal() - EPOCH_ORDINAL
+    except (TypeError, ValueError):
+        return NAT
+
+
+def _as_text(value) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _load_numpy():
+    global np
+    np = np or _require("numpy")
+
+
+def _load_pandas():
+    global pd
+    pd = pd or _require("pandas")
+
+
+def _require(name: str):
+    try:
+        return import_module(name)
+    except ImportError:
+        raise ImportError(f"{name} is required for this function: pip install dateparser_ko[{name}]") from None
@@ -22,12 +22,17 @@ KW_MONTHS_AGO = "개월전"
 KW_MONTHS = "개월"
 KW_YEARS = "개년"
 KW_YEARS_AGO = "년전"
+# Counters read with native counts as well as digits (한 달, 석 달, 3달).
+KW_MONTHS_NATIVE = "달"
+KW_MONTHS_NATIVE_AGO = "달전"
 
 ABS_WORDS = [KW_YEAR, KW_MONTH, KW_DAY]
 
 REL_WORDS = [KW_LAST_YEAR, KW_LAST_LAST_YEAR, KW_QUARTER, KW_FIRST_HALF, KW_LAST_HALF,
     KW_THIS_YEAR, KW_THIS_YEAR2, KW_THIS_MONTH, KW_LAST_YEAR2, KW_LAST_MONTH, KW_LAST_QUARTER,
     KW_TODAY, KW_TODAY2, KW_TODAY3, KW_THIS_MONTH2, KW_THIS_MONTH3, KW_LAST_MONTH2, KW_MONTHS, KW_MONTHS_AGO,
-    KW_YEARS, KW_YEARS_AGO]
+    KW_YEARS, KW_YEARS_AGO, KW_MONTHS_NATIVE, KW_MONTHS_NATIVE_AGO]
+
+COUNTER_WORDS = [KW_MONTHS_NATIVE, KW_MONTHS_NATIVE_AGO]
 
 NUMB_WORDS = ["일", "이", "삼", "사", "오", "육", "칠", "팔", "구", "십", "백", "천"]
\ No newline at end of file
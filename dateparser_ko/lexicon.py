@@ -0,0 +1,69 @@
+import re
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, Optional
+
+from .keywords import ABS_WORDS, COUNTER_WORDS, NUMB_WORDS
+from .numerals import DEFAULT_GRAMMAR
+from .stopwords import STOPWORDS
+from .symbols import ALL_SYMBOLS
+from .terms import compile_terms
+from .abs_closures import mapping as abs_mapping
+from .rel_closures import mapping as rel_mapping, date_only
+from .registry import LazyClosures, closure_specs
+
+
+class Lexicon:
+    """Keywords, numerals, stopwords and closures compiled into lookup tables.
+
+    A lexicon is immutable once built. ``extend`` returns a new lexicon, so
+    separate vocabularies can be kept side by side and shared between threads.
+    """
+
+    __slots__ = ("rel_mapping", "abs_mapping", "abs_words", "numerals", "symbols", "stopwords", "term_trie",
+                 "date_hint", "date_only", "counters", "numeral_grammar", "numeric_terms")
+
+    def __init__(self, rel_closures: Optional[Mapping[str, Callable]] = None, stopwords: Optional[Iterable[str]] = None):
+        rel_closures = rel_mapping if rel_closures is None else rel_closures
+        stopwords = STOPWORDS if stopwords is None else stopwords
+
+        self.rel_mapping = LazyClosures({kw.replace(" ", ""): spec for kw, spec in closure_specs(rel_closures).items()})
+        self.date_only = frozenset(kw for kw, spec in closure_specs(self.rel_mapping).items() if spec in date_only)
+        self.abs_mapping = abs_mapping
+        self.abs_words = frozenset(ABS_WORDS)
+        self.numerals = MappingProxyType({c: i + 1 for i, c in enumerate(NUMB_WORDS)})
+        self.numeral_grammar = DEFAULT_GRAMMAR
+        self.counters = frozenset(kw for kw in COUNTER_WORDS if kw in self.rel_mapping)
+        self.symbols = frozenset(ALL_SYMBOLS)
+        self.stopwords = tuple(sorted(set(stopwords), key=len, reverse=True))
+        self.term_trie = compile_terms(self.rel_mapping)
+        self.date_hint = compile_date_hint(self.rel_mapping, self.numerals, self.abs_words)
+        # Keywords with digits or separators could overlap a numeric date, which rules out its fast path.
+        self.numeric_terms = any(c.isdecimal() or c in self.symbols for kw in self.rel_mapping for c in kw)
+
+    def may_contain_dates(self, text: str) -> bool:
+        """Cheap check that is False only when the pipeline cannot find a date in ``text``."""
+        return self.date_hint.search(text.replace(" ", "")) is not None
+
+    def extend(self, rel_closures: Optional[Mapping[str, Callable]] = None,
+               stopwords: Iterable[str] = ()) -> "Lexicon":
+        """Return a new lexicon with extra relative keywords and stopwords.
+
+        Keywords may be written with spaces ("이번 주"); they are matched with or
+        without them, like the built-in ones.
+        """
+        return Lexicon({**closure_specs(self.rel_mapping), **(rel_closures or {})}, self.stopwords + tuple(stopwords))
+
+    def __reduce__(self):
+        # Rebuilt from its sources, so worker processes compile their own tables.
+        return Lexicon, (closure_specs(self.rel_mapping), self.stopwords)
+
+
+def compile_date_hint(keywords: Iterable[str], numerals: Iterable[str], abs_words: Iterable[str]) -> re.Pattern:
+    # Every date comes from a digit, a numeral directly before 년/월/일, or a keyword
+    # (matched here with spaces removed, since terms may contain one).
+    alternatives = [r"\d", f"[{''.join(map(re.escape, numerals))}][{''.join(map(re.escape, abs_words))}]"]
+    alternatives += [re.escape(kw) for kw in sorted(keywords, key=len, reverse=True) if kw]
+    return re.compile("|".join(alternatives))
+
+
+DEFAULT_LEXICON = Lexicon()
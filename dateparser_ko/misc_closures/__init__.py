@@ -1,7 +1,9 @@
 from dateparser_ko.tags import SYMB
-from .symbol import symbol
+from dateparser_ko.registry import LazyClosures, lazy_exports
 
 
-mapping = {
-    SYMB: symbol
-}
\ No newline at end of file
+mapping = LazyClosures({
+    SYMB: "symbol"
+}, __name__)
+
+__getattr__ = lazy_exports(__name__, ["symbol"])
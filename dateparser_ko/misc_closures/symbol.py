@@ -1,3 +1,4 @@
+from dateparser_ko.calendar_math import is_valid_date, short_year
 from dateparser_ko.types import DateObject
 
 
@@ -6,7 +7,7 @@ def symbol(context: str) -> DateObject:
 
     sep = next((c for c in context if not c.isdigit()), None)
     numbers = context.split(sep)
-    max_len = 3
+    max_len = min(len(numbers), 3)
 
     year_i = 0
     while year_i < max_len:
@@ -16,6 +17,16 @@ def symbol(context: str) -> DateObject:
 
         year_i += 1
 
+    # Without a four-digit year only "24.06.15" is read, as year, month and day when
+    # that is a valid date; "6.0" or "9/3" is more likely a number than a date.
+    if year_i == max_len < 3:
+        return custom_date
+
+    if year_i == max_len == 3 and len(numbers[0]) == 2 and len(numbers[1]) <= 2 and len(numbers[2]) <= 2:
+        y, m, d = short_year(int(numbers[0])), int(numbers[1]), int(numbers[2])
+        if is_valid_date(y, m, d):
+            return DateObject(y=y, m=m, d=d)
+
     month_i = 0
     while month_i < max_len:
         if month_i == year_i:
@@ -38,4 +49,9 @@ def symbol(context: str) -> DateObject:
         custom_date["d"] = int(numbers[day_i])
         break
 
+    # A full date must exist: 2024-06-45 or 2023-02-29 is no date at all.
+    if custom_date["y"] > 0 and custom_date["m"] > 0 and custom_date["d"] > 0 \
+            and not is_valid_date(custom_date["y"], custom_date["m"], custom_date["d"]):
+        return DateObject(y=0, m=0, d=0)
+
     return custom_date
@@ -0,0 +1,148 @@
+from typing import Callable, Dict, Mapping, NamedTuple, Optional
+
+# Morpheme kinds.
+DIGIT = 0   # Sino-Korean 일..구 and 0..9, as in "3천"
+UNIT = 1    # 십, 백, 천
+TEN = 2     # native tens: 열, 스물
+ONE = 3     # native ones: 한, 두, 석 ...
+RANGE = 4   # native approximate pairs: 한두, 서너 ...
+
+NATIVE_KINDS = frozenset([TEN, ONE, RANGE])
+
+ARABIC_DIGITS = {str(i): i for i in range(10)}
+SINO_DIGITS = {"일": 1, "이": 2, "삼": 3, "사": 4, "오": 5, "육": 6, "칠": 7, "팔": 8, "구": 9}
+SINO_UNITS = {"십": 10, "백": 100, "천": 1000}
+NATIVE_TENS = {"열": 10, "스무": 20, "스물": 20}
+NATIVE_ONES = {"한": 1, "두": 2, "세": 3, "석": 3, "네": 4, "넉": 4, "다섯": 5, "여섯": 6, "일곱": 7, "여덟": 8,
+               "아홉": 9}
+NATIVE_RANGES = {"한두": (1, 2), "두세": (2, 3), "서너": (3, 4), "너덧": (4, 5), "네댓": (4, 5), "대여섯": (5, 6),
+                 "예닐곱": (6, 7)}
+
+# Automaton states.
+START = 0
+LEAD = 1     # first Sino digit: a multiplier ("이십") or the start of a digit string ("이삼")
+SEQ = 2      # Sino digits read one by one, the way "일이삼" is written for 123
+PENDING = 3  # Sino digit after a unit ("십오")
+AFTER_UNIT = 4
+AFTER_TEN = 5
+NATIVE = 6
+
+TRANSITIONS = {
+    (START, DIGIT): LEAD,
+    (START, UNIT): AFTER_UNIT,
+    (LEAD, DIGIT): SEQ,
+    (LEAD, UNIT): AFTER_UNIT,
+    (SEQ, DIGIT): SEQ,
+    (SEQ, UNIT): AFTER_UNIT,
+    (AFTER_UNIT, DIGIT): PENDING,
+    (AFTER_UNIT, UNIT): AFTER_UNIT,
+    (PENDING, UNIT): AFTER_UNIT,
+    (START, TEN): AFTER_TEN,
+    (START, ONE): NATIVE,
+    (START, RANGE): NATIVE,
+    (AFTER_TEN, ONE): NATIVE,
+    (AFTER_TEN, RANGE): NATIVE,
+}
+
+
+class Morpheme(NamedTuple):
+    kind: int
+    low: int
+    high: int
+
+
+class Numeral(NamedTuple):
+    value: int
+    high: int  # upper end of an approximate count such as 한두 (1-2), 0 for exact numbers
+    end: int
+
+
+def default_morphemes() -> Dict[str, Morpheme]:
+    morphemes = {}
+    for table, kind in ((ARABIC_DIGITS, DIGIT), (SINO_DIGITS, DIGIT), (SINO_UNITS, UNIT), (NATIVE_TENS, TEN), (NATIVE_ONES, ONE)):
+        morphemes.update({word: Morpheme(kind, value, value) for word, value in table.items()})
+    morphemes.update({word: Morpheme(RANGE, low, high) for word, (low, high) in NATIVE_RANGES.items()})
+    return morphemes
+
+
+class NumeralGrammar:
+    """Numeral morphemes compiled into an automaton that reads Korean numerals as integers.
+
+    Sino-Korean numerals are read with their units (이천이십사 is 2024, 십오 is 15);
+    digits without units are read one by one (일이삼 is 123). Native counts only
+    appear before counters such as 달 and may be approximate (한두 is 1 to 2).
+    """
+
+    __slots__ = ("morphemes", "max_length", "native_initials")
+
+    def __init__(self, morphemes: Optional[Mapping[str, Morpheme]] = None):
+        self.morphemes = dict(default_morphemes() if morphemes is None else morphemes)
+        self.max_length = max(map(len, self.morphemes))
+        self.native_initials = frozenset(word[0] for word, m in self.morphemes.items() if m.kind in NATIVE_KINDS)
+
+    def read(self, text: str, start: int = 0, native: bool = False,
+             ends: Optional[Callable[[int], bool]] = None) -> Optional[Numeral]:
+        """Longest numeral starting at ``start``, or None; with ``native`` only native counts are read.
+
+        With ``ends``, only numerals whose end position it accepts are read: a
+        unit after the numeral decides between 십 일 and 십일 in 십일월.
+        """
+        morphemes = self.morphemes
+        text_len = len(text)
+        state = START
+        total = pending = high = 0
+        last_unit = 10000
+        found = None
+
+        i = start
+        while i < text_len:
+            for size in range(min(self.max_length, text_len - i), 0, -1):
+                morpheme = morphemes.get(text[i:i + size])
+                if morpheme is None or (native and morpheme.kind not in NATIVE_KINDS):
+                    continue
+                next_state = TRANSITIONS.get((state, morpheme.kind))
+                if next_state is not None and (morpheme.kind != UNIT or morpheme.low < last_unit):
+                    break
+            else:
+                break
+
+            kind, low, top = morpheme
+            if kind == UNIT:
+                # A unit without a digit before it counts once: 십오 is 15, 이십 is 20.
+                total += (pending if state in (LEAD, SEQ, PENDING) else 1) * low
+                pending = 0
+                last_unit = low
+            elif next_state == SEQ:
+                pending = pending * 10 + low
+            elif kind == DIGIT:
+                pending = low
+            elif kind == RANGE:
+                high = total + top
+                total += low
+            else:
+                total += low
+
+            state = next_state
+            i += size
+            if ends is None or ends(i):
+                found = Numeral(total + pending, high, i)
+
+        return found
+
+    def digit(self, c: str) -> Optional[str]:
+        """``c`` as a digit when it is one on its own (3, 삼), else None."""
+        morpheme = self.morphemes.get(c)
+        return str(morpheme.low) if morpheme is not None and morpheme.kind == DIGIT else None
+
+    def ends_at(self, text: str, end: int) -> bool:
+        """Whether a native count that starts a word ends right before ``end``."""
+        for start in range(max(end - 2 * self.max_length, 0), end):
+            if start == 0 or text[start - 1] == " ":
+                numeral = self.read(text, start, native=True)
+                if numeral is not None and numeral.end == end:
+                    return True
+
+        return False
+
+
+DEFAULT_GRAMMAR = NumeralGrammar()
@@ -0,0 +1,32 @@
+import re
+from typing import Optional
+
+from .calendar_math import is_valid_date, short_year
+from .types import Date, DateTuple
+
+# A whole word of year, month and day with one separator: 2024-06-15, 2024.06.15, 24/06/15.
+RE_NUMERIC_DATE = re.compile(r"(?<![^ ])([0-9]{4}|[0-9]{2})([./-])([0-9]{2})\2([0-9]{2})(?![^ ])")
+
+
+def numeric_date(text: str, lexicon) -> Optional[DateTuple]:
+    """Dates in cleaned ``text`` when it holds one valid numeric date and nothing else that could be a date.
+
+    Returns None whenever the pipeline has to decide: no or several numeric
+    dates, an out of range month or day, other digits or keywords, or a
+    numeral in front of the date that the pipeline would read into it.
+    """
+    match = RE_NUMERIC_DATE.search(text)
+    if match is None or lexicon.numeric_terms:
+        return None
+
+    before, after = text[:match.start()], text[match.end():]
+    if lexicon.may_contain_dates(before + after) or any(c in lexicon.numerals for c in before):
+        return None
+
+    year, _, month, day = match.groups()
+    y = int(year) if len(year) == 4 else short_year(int(year))
+    m, d = int(month), int(day)
+    if not is_valid_date(y, m, d):
+        return None
+
+    return (Date(y, m, d),)
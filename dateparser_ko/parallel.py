@@ -0,0 +1,117 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import date, timezone, tzinfo
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from .batch import parse_many
+from .clock import reference_date, TimeLike
+from .lexicon import Lexicon, DEFAULT_LEXICON
+from .tags import AW, NW, RW, SYMB, PAD
+from .cache import ResultCache
+from .types import ParseResult, DateObject, DateTuple
+
+TAGS = (AW, NW, RW, SYMB, PAD)
+TAG_CODES = {t: i for i, t in enumerate(TAGS)}
+
+_worker_lexicon: Optional[Lexicon] = None
+_worker_today: Optional[date] = None
+
+
+def parse_parallel(texts: Iterable[str], workers: Optional[int] = None, chunksize: int = 512, ordered: bool = True,
+                   lexicon: Lexicon = DEFAULT_LEXICON, now: Optional[TimeLike] = None,
+                   tz: tzinfo = timezone.utc) -> Iterator[Union[ParseResult, Tuple[int, ParseResult]]]:
+    """Parse texts across a pool of worker processes.
+
+    Inputs are sent in chunks of ``chunksize`` and every worker compiles the
+    lexicon once at start-up. Results are yielded in input order, or as
+    ``(index, result)`` pairs in completion order with ``ordered=False``. At most
+    two chunks per worker are in flight, so arbitrarily long iterables can be
+    streamed through.
+    """
+    workers = workers or os.cpu_count() or 1
+    today = reference_date(now, tz)
+    return _parse_parallel(iter(texts), workers, chunksize, ordered, lexicon, today)
+
+
+def parse_threaded(texts: Iterable[str], workers: Optional[int] = None, chunksize: int = 256,
+                   lexicon: Lexicon = DEFAULT_LEXICON, now: Optional[TimeLike] = None, tz: tzinfo = timezone.utc,
+                   cache: Optional[ResultCache] = None, debug: bool = True) -> List[Union[ParseResult, DateTuple]]:
+    """Parse texts on a pool of threads and return the results in input order.
+
+    Lexicons and a ``cache`` can be shared by all threads. The only shared state
+    a parse writes is filled on first use with the same value whichever thread
+    fills it: the closures a lexicon has imported, and the keyword results for a
+    reference date, whose tables are created and looked up under a lock. Threads
+    only run in parallel on free-threaded builds; with the GIL this is no faster
+    than ``parse_many``. ``trace()`` does not see parses run on the pool.
+    """
+    workers = workers or os.cpu_count() or 1
+    today = reference_date(now, tz)
+    texts = list(texts)
+    chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        done = executor.map(lambda chunk: parse_many(chunk, lexicon, today, cache=cache, debug=debug), chunks)
+        return [result for results in done for result in results]
+
+
+def _parse_parallel(texts: Iterator[str], workers: int, chunksize: int, ordered: bool, lexicon: Lexicon,
+                    today: date) -> Iterator:
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(lexicon, today))
+    try:
+        pending = deque() if ordered else {}
+        offset = 0
+        while True:
+            chunk = list(islice(texts, chunksize))
+            if chunk:
+                future = executor.submit(_parse_chunk, chunk)
+                if ordered:
+                    pending.append(future)
+                else:
+                    pending[future] = offset
+                offset += len(chunk)
+
+            if not pending:
+                break
+
+            if chunk and len(pending) < workers * 2:
+                continue
+
+            if ordered:
+                for encoded in pending.popleft().result():
+                    yield _decode(encoded)
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start = pending.pop(future)
+                    for i, encoded in enumerate(future.result()):
+                        yield start + i, _decode(encoded)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _init_worker(lexicon: Lexicon, today: date):
+    global _worker_lexicon, _worker_today
+    _worker_lexicon = lexicon
+    _worker_today = today
+
+
+def _parse_chunk(chunk: List[str]) -> list:
+    return [_encode(result) for result in parse_many(chunk, lexicon=_worker_lexicon, now=_worker_today)]
+
+
+def _encode(result: ParseResult) -> tuple:
+    dates = tuple(v for d in result["found_dates"] for v in (d["y"], d["m"], d["d"]))
+    positions = tuple(p for _, _, p in result["used_tokens"])
+    tags = bytes(TAG_CODES[t] for _, t, _ in result["used_tokens"])
+    return dates, positions, tags, result["cleaned"]
+
+
+def _decode(encoded: tuple) -> ParseResult:
+    dates, positions, tags, cleaned = encoded
+    return ParseResult(
+        found_dates=[DateObject(y=dates[i], m=dates[i + 1], d=dates[i + 2]) for i in range(0, len(dates), 3)],
+        used_tokens=[(cleaned[p], TAGS[code], p) for p, code in zip(positions, tags)],
+        cleaned=cleaned
+    )
@@ -1,433 +1,385 @@
-from dateutil.relativedelta import relativedelta
-
-from .keywords import NUMB_WORDS, ABS_WORDS, REL_WORDS
-from .stopwords import STOPWORDS
-from .symbols import ALL_SYMBOLS
-from .types import ParseResult, DateObject
-from .tags import AW, NW, PAD, SYMB, YEAR, RW, TERM
-from .patterns import RE_IS_DIGIT, RE_HAS_DIGIT_AND_CHAR
-from .abs_closures import mapping as abs_mapping
-from .misc_closures import mapping as misc_mapping
-from .rel_closures import mapping as rel_mapping
+from .types import ParseResult, DateObject, Span, Date, DateTuple
+from .tags import AW, NW, PAD, SYMB, YEAR, RW, TERM, COUNTER
+from .patterns import RE_YEAR
+from .terms import find_terms
+from .lexicon import Lexicon, DEFAULT_LEXICON
+from .clock import reference_date, TimeLike
+from .cache import ResultCache
+from .calendar_math import is_valid_date, month_end
+from .tracing import Trace, current_trace
+from .composition import Composer, DURATIONS
+from .numeric_dates import numeric_date
 import re
-from datetime import datetime, timezone, date
+from datetime import date, timezone, tzinfo
+from typing import List, Optional, Union
 
 
-def remove_stopwords(text: str) -> str:
-    cleaned = []
-    for token in text.split(" "):
-        ignore = False
-        for stopword in STOPWORDS:
+def strip_stopword(token: str, lexicon: Lexicon = DEFAULT_LEXICON) -> str:
+    if token.endswith(lexicon.stopwords):
+        for stopword in lexicon.stopwords:
             if token.endswith(stopword):
-                cleaned.append(token[:-len(stopword)])
-                ignore = True
-                continue
-
-        if not ignore:
-            cleaned.append(token)
-
-    return " ".join(cleaned)
-
-
-def parse_year(text: str) -> str:
-    parsed = ""
-
-    tokens = list(text)
-    tokens_len = len(tokens)
-
-    skip_count = 0
-    for i, c in enumerate(tokens):
-        if skip_count > 0:
-            skip_count -= 1
-            continue
-
-        if bool(re.match(RE_IS_DIGIT, c)):
-            if i + 3 >= tokens_len:
-                pass
-
-            if (
-                    bool(re.match(RE_IS_DIGIT, tokens[i + 1]))
-                    and
-                    bool(re.match(RE_IS_DIGIT, tokens[i + 2]))
-                    and
-                    bool(re.match(RE_IS_DIGIT, tokens[i + 3]))
-                    and
-                    (i + 4 == tokens_len or not bool(re.match(RE_IS_DIGIT, tokens[i + 4])))
-            ):
-                parsed += f"<{YEAR}>{c + tokens[i + 1] + tokens[i + 2] + tokens[i + 3]}</{YEAR}>"
-                skip_count += 3
-                continue
-
-        parsed += c
-
-    return parsed
+                return token[:-len(stopword)]
 
+    return token
 
-def wrap_terms(text: str, terms_size: int = 4) -> str:
-    parsed = ""
 
-    terms = [kw for kw in REL_WORDS if len(kw) == terms_size]
-
-    tokens = list(text)
-    tokens_len = len(tokens)
-    skip_count = 0
-    for i, c in enumerate(tokens):
-        if skip_count > 0:
-            skip_count -= 1
-            continue
+def remove_stopwords(text: str, lexicon: Lexicon = DEFAULT_LEXICON) -> str:
+    return " ".join([strip_stopword(token, lexicon) for token in text.split(" ")])
 
-        if i + 12 < tokens_len:
-            if "".join(tokens[i:i + 6]) == f"<{TERM}>":
-                parsed += f"<{TERM}>"
-                start_pos = i + 6
-                end_pos = i + 6 + 7
-                while True:
-                    if end_pos < tokens_len:
-                        if "".join(tokens[start_pos:end_pos]) == f"</{TERM}>":
-                            parsed += f"</{TERM}>"
-                            skip_count = end_pos - i - 1
-                            break
 
-                        else:
-                            parsed += tokens[start_pos]
-
-                    else:
-                        break
-
-                    start_pos += 1
-                    end_pos += 1
-
-                if skip_count > 0:
-                    continue
+def parse_year(text: str) -> List[Span]:
+    return [Span(match.start(), match.end(), YEAR) for match in re.finditer(RE_YEAR, text)]
 
-        if c == " ":
-            parsed += c
-            continue
 
-        chars = []
-        for keyword in terms:
-            for j, ch in enumerate(tokens[i:]):
-                if "".join(chars).replace(" ", "") == keyword and ch == " ":
-                    break
+def wrap_terms(text: str, lexicon: Lexicon = DEFAULT_LEXICON) -> List[Span]:
+    counters = lexicon.counters
 
-                if len(chars) > len(list(keyword)):
-                    break
+    # Counters such as 달 are only keywords after a count ("3달", "석 달"), so
+    # "이달" or "보름달" leave the text untouched.
+    def accept(start: int, end: int) -> bool:
+        return text[start:end].replace(" ", "") not in counters or follows_count(text, start, lexicon)
 
-                chars.append(ch)
+    return [Span(start, end, COUNTER if text[start:end].replace(" ", "") in counters else TERM)
+            for start, end in find_terms(text, lexicon.term_trie, accept)]
 
-            if "".join(chars).replace(" ", "") == keyword:
-                break
-            else:
-                chars.clear()
 
-        char_len = len(chars)
-        if char_len > 0:
-            parsed += f"<{TERM}>{"".join(chars)}</{TERM}>"
-            skip_count = char_len - 1
-            continue
+def follows_count(text: str, start: int, lexicon: Lexicon = DEFAULT_LEXICON) -> bool:
+    end = start - 1 if start > 0 and text[start - 1] == " " else start
+    if end == 0:
+        return False
 
-        parsed += c
+    if text[end - 1].isdecimal():
+        # Four digits or more end in a year, which is not a count.
+        digits = 1
+        while digits < end and text[end - 1 - digits].isdecimal():
+            digits += 1
+        return digits < 4
 
-    if terms_size == 2:
-        return parsed
-    else:
-        return wrap_terms(parsed, terms_size - 1)
+    return lexicon.numeral_grammar.ends_at(text, end)
 
 
-def tag_chars(text: str) -> list:
+def tag_chars(text: str, spans: List[Span], lexicon: Lexicon = DEFAULT_LEXICON) -> list:
     tags = []
 
-    skip_count = 0
-    tokens = list(text)
-    tokens_len = len(tokens)
-
-    for i, c in enumerate(tokens):
-        if skip_count > 0:
-            skip_count -= 1
+    abs_words = lexicon.abs_words
+    numerals = lexicon.numerals
+    symbols = lexicon.symbols
+    grammar = lexicon.numeral_grammar
+    native_initials = grammar.native_initials
+
+    text_len = len(text)
+    span_starts = {span.start: span for span in spans}
+    span_ends = {span.end: span.kind for span in spans}
+
+    i = 0
+    while i < text_len:
+        span = span_starts.get(i)
+        if span is not None:
+            tags.extend([NW if span.kind == YEAR else RW] * (span.end - span.start))
+            i = span.end
             continue
 
+        c = text[i]
         if c == " ":
             tags.append(PAD)
+            i += 1
             continue
 
-        if i + 17 < tokens_len:
-            if "".join(tokens[i:i + 6]) == f"<{YEAR}>" and "".join(tokens[i + 10:i + 17]) == f"</{YEAR}>":
-                tags.extend([YEAR for _ in range(6)])
-                tags.extend([NW for _ in range(4)])
-                tags.extend([YEAR for _ in range(7)])
-                skip_count = 16
-                continue
-
-        if i + 12 < tokens_len:
-            if "".join(tokens[i:i + 6]) == f"<{TERM}>":
-                start_pos = i + 6
-                end_pos = i + 6 + 7
-                while True:
-                    if end_pos < tokens_len:
-                        if "".join(tokens[start_pos:end_pos]) == f"</{TERM}>":
-                            tags.extend([TERM for _ in range(6)])
-                            tags.extend([RW for _ in range(start_pos - (i + 6))])
-                            tags.extend([TERM for _ in range(7)])
-                            skip_count = end_pos - i - 1
-                            break
-
-                    else:
-                        break
-
-                    start_pos += 1
-                    end_pos += 1
-
-                if skip_count > 0:
+        # A span is read by its neighbours as a closed unit: the characters before it
+        # see something that is neither a digit nor a symbol, and the characters after
+        # it see the span kind as the previous tag.
+        next_span = span_starts.get(i + 1)
+        next_c = "" if i + 1 >= text_len or next_span is not None else text[i + 1]
+        next_2_c = "" if i + 2 >= text_len or next_span is not None or i + 2 in span_starts else text[i + 2]
+        if i in span_ends:
+            prev_t = prev_2_t = span_ends[i]
+        else:
+            prev_t = None if i - 1 < 0 else tags[i - 1]
+            prev_2_t = span_ends.get(i - 1, None if i - 2 < 0 else tags[i - 2])
+
+        # A native count ("한두", "석") is a number only right before a counter.
+        if c in native_initials and (prev_t == PAD or prev_t is None):
+            numeral = grammar.read(text, i, native=True)
+            if numeral is not None:
+                end = numeral.end
+                counter = span_starts.get(end + 1 if end < text_len and text[end] == " " else end)
+                if counter is not None and counter.kind == COUNTER:
+                    tags.extend([NW] * (end - i))
+                    i = end
                     continue
 
-        next_c = "" if i + 1 >= tokens_len else tokens[i + 1]
-        next_2_c = "" if i + 2 >= tokens_len else tokens[i + 2]
-        prev_t = None if i - 1 < 0 else tags[i - 1]
-        prev_2_t = None if i - 2 < 0 else tags[i - 2]
+        # A Korean numeral that a unit follows is read whole, so 십일월 is November
+        # and 삼십일일 the 31st rather than 십 or 삼십 before 일월 and 일일.
+        if (
+                c in numerals
+                and
+                (prev_t == PAD or prev_t is None or prev_t == SYMB)
+                and
+                (prev_2_t is None or prev_2_t == SYMB or prev_2_t == NW or prev_2_t == AW or prev_2_t == PAD or next_2_c in symbols)
+        ):
+            end = numeral_before_unit(text, i, span_starts, lexicon)
+            if end is not None:
+                tags.extend([NW] * (end - i))
+                i = end
+                continue
 
         if (
-                c in ABS_WORDS
+                c in abs_words
                 and
-                (prev_t == NW or prev_t == YEAR)
+                (prev_t == NW or prev_t == YEAR
+                 or prev_t == PAD and prev_2_t == NW and spaced_duration(text, i, span_starts, lexicon))
         ):
             tags.append(AW)
 
         elif (
-                (bool(re.match(RE_IS_DIGIT, c)) or c in NUMB_WORDS)
+                (c.isdecimal() or c in numerals)
                 and
                 (prev_t == NW or prev_t == PAD or prev_t is None or prev_t == SYMB)
                 and
-                (bool(re.match(RE_IS_DIGIT,
-                               next_c)) or next_c in NUMB_WORDS or next_c in ABS_WORDS or next_c in ALL_SYMBOLS or next_c == " "
-                 or (i + 7 < tokens_len and "".join(tokens[i + 1:i + 7]) == f"<{TERM}>"))
+                (next_c.isdecimal() or next_c in numerals or next_c in abs_words or next_c in symbols or next_c == " "
+                 or i + 1 == text_len or (next_span is not None and (next_span.kind == TERM or next_span.kind == COUNTER and c.isdecimal())))
                 and
                 (
-                        prev_2_t is None or prev_2_t == SYMB or prev_2_t == NW or prev_2_t == AW or prev_2_t == PAD or next_2_c in ALL_SYMBOLS)
+                        prev_2_t is None or prev_2_t == SYMB or prev_2_t == NW or prev_2_t == AW or prev_2_t == PAD or next_2_c in symbols)
         ):
             tags.append(NW)
 
         elif (
-                c in ALL_SYMBOLS
+                c in symbols
                 and
                 (prev_t == NW or prev_t == YEAR)
                 and
-                bool(re.match(RE_IS_DIGIT, next_c))
+                next_c.isdecimal()
         ):
             tags.append(SYMB)
 
         else:
             tags.append(None)
 
+        i += 1
+
     return tags
 
 
-def generate_tokens(tags: list, tokens: list) -> list:
-    useful_tokens = []
+def numeral_before_unit(text: str, start: int, span_starts: dict, lexicon: Lexicon = DEFAULT_LEXICON) -> Optional[int]:
+    """End of the longest numeral of digits and Korean numerals at ``start`` that a unit (년, 월, 일) follows, or None."""
+    numerals = lexicon.numerals
+    abs_words = lexicon.abs_words
 
-    counter = 0
-    for i, t in enumerate(tags):
-        if t is None:
-            counter += 1
-            continue
+    text_len = len(text)
+    run_end = start + 1
+    while run_end < text_len and run_end not in span_starts and (text[run_end] in numerals or text[run_end].isdecimal()):
+        run_end += 1
+
+    def before_unit(end: int) -> bool:
+        return end <= run_end and end < text_len and text[end] in abs_words and end not in span_starts
+
+    numeral = lexicon.numeral_grammar.read(text, start, ends=before_unit)
+    return None if numeral is None else numeral.end
 
-        if t == YEAR or t == TERM:
-            continue
 
-        useful_tokens.append((tokens[i], t, counter))
-        counter += 1
+def spaced_duration(text: str, i: int, span_starts: dict, lexicon: Lexicon = DEFAULT_LEXICON) -> bool:
+    """Whether the unit at ``i`` starts a duration, a count and then a keyword it carries into ("1 년 2 개월 전")."""
+    duration = DURATIONS.get(text[i])
+    if duration is None:
+        return False
 
-    return useful_tokens
+    end = i + 2 if text[i + 1:i + 2] == " " else i + 1
+    numeral = lexicon.numeral_grammar.read(text, end)
+    if numeral is None or any(start in span_starts for start in range(end, numeral.end)):
+        return False
 
+    end = numeral.end + 1 if text[numeral.end:numeral.end + 1] == " " else numeral.end
+    keyword = span_starts.get(end)
+    return keyword is not None and text[keyword.start:keyword.end].replace(" ", "") in duration[1]
 
-def normalize_chars(useful_tokens: list) -> list:
+
+def generate_tokens(tags: list, text: str) -> list:
+    return [(text[i], t, i) for i, t in enumerate(tags) if t is not None]
+
+
+def normalize_chars(useful_tokens: list, lexicon: Lexicon = DEFAULT_LEXICON) -> list:
+    """Read each run of adjacent number tokens that contains Korean numerals with the numeral grammar.
+
+    Tokens become ``(c, t, p, high)``. Such a run is replaced by one token per
+    number, with its value as digits and ``high`` set to the upper end of an
+    approximate count (한두 달); every other token is kept with ``high`` 0.
+    """
     normal_tokens = []
 
+    grammar = lexicon.numeral_grammar
+
     useful_tokens_len = len(useful_tokens)
-    for idx, token in enumerate(useful_tokens):
-        c = token[0]
-        t = token[1]
-        p = token[2]
-
-        prev_token = (None, None, None) if idx - 1 < 0 else useful_tokens[idx - 1]
-        prev_t = prev_token[1]
-
-        next_token = (None, None, None) if idx + 1 >= useful_tokens_len else useful_tokens[idx + 1]
-        next_t = next_token[1]
-
-        if t == NW and not bool(re.match(RE_IS_DIGIT, c)):
-            index = NUMB_WORDS.index(c) + 1
-            if index == 10:
-                if prev_t != NW:
-                    c = "10"
-                elif next_t != NW:
-                    c = "0"
-                else:
-                    c = ""
-            elif index == 11:
-                if prev_t != NW:
-                    c = "100"
-                elif next_t != NW:
-                    c = "00"
-                else:
-                    c = ""
-            elif index == 12:
-                if prev_t != NW:
-                    c = "1000"
-                elif next_t != NW:
-                    c = "000"
-                else:
-                    c = ""
-            else:
-                c = str(index)
-
-        normal_tokens.append((c, t, p))
+    idx = 0
+    while idx < useful_tokens_len:
+        c, t, p = useful_tokens[idx]
+        if t != NW:
+            normal_tokens.append((c, t, p, 0))
+            idx += 1
+            continue
+
+        end = idx + 1
+        while end < useful_tokens_len and useful_tokens[end][1] == NW and useful_tokens[end][2] == p + end - idx:
+            end += 1
+
+        # Digits without units are read one by one, keeping leading zeros ("2024.06.01", "일이삼").
+        digits = [c if c.isdecimal() else grammar.digit(c) for c, _, _ in useful_tokens[idx:end]]
+        if None not in digits:
+            normal_tokens.extend([(digit, NW, p, 0) for digit, (_, _, p) in zip(digits, useful_tokens[idx:end])])
+            idx = end
+            continue
+
+        word = "".join([token[0] for token in useful_tokens[idx:end]])
+
+        i = 0
+        while i < len(word):
+            numeral = grammar.read(word, i)
+            if numeral is None:
+                normal_tokens.append((word[i], NW, p + i, 0))
+                i += 1
+                continue
+            normal_tokens.append((str(numeral.value), NW, p + i, numeral.high))
+            i = numeral.end
+        idx = end
 
     return normal_tokens
 
 
-def find_dates(normal_tokens: list) -> list:
-    dates = []
+def find_dates(normal_tokens: list, today: date, lexicon: Lexicon = DEFAULT_LEXICON,
+               trace: Optional[Trace] = None, positions: Optional[list] = None) -> list:
+    """Resolve tokens into dates with the composition rules in ``composition.RULES``.
+
+    When ``positions`` is a list, a ``(start, end)`` range of text positions is
+    appended to it for every date, covering the tokens the date was built from.
+    """
+    return Composer(today, lexicon, trace, positions).run(normal_tokens)
 
-    context = ""
-    temp_date = DateObject(y=0, m=0, d=0)
-    tokens_len = len(normal_tokens)
-    skip_counter = 0
-    for idx, token in enumerate(normal_tokens):
-        if skip_counter > 0:
-            skip_counter -= 1
-            continue
 
-        c = token[0]
-        t = token[1]
-        p = token[2]
-
-        if t == NW:
-            context += c
-            if re.search(RE_HAS_DIGIT_AND_CHAR, context):
-                if idx + 1 < tokens_len:
-                    if normal_tokens[idx + 1][1] != SYMB and normal_tokens[idx + 1][1] != NW:
-                        dates.append(misc_mapping[SYMB](context))
-                        context = ""
-                else:
-                    dates.append(misc_mapping[SYMB](context))
-                    context = ""
-
-        elif t == AW:
-            temp = abs_mapping[c](context, temp_date)
-            if (0 < temp_date["y"] != temp["y"] > 0) or (0 < temp_date["m"] != temp["m"] > 0) or (
-                    0 < temp_date["d"] != temp["d"] > 0):
-                dates.append(temp_date)
-                temp_date = temp
-            else:
-                temp_date["y"] = max(temp_date["y"], temp["y"])
-                temp_date["m"] = max(temp_date["m"], temp["m"])
-                temp_date["d"] = max(temp_date["d"], temp["d"])
-                if temp_date["y"] > 0 and temp_date["m"] > 0 and temp_date["d"] > 0:
-                    dates.append(temp_date)
-                    temp_date = DateObject(y=0, m=0, d=0)
-            context = ""
-
-        elif t == RW:
-            current = c
-            counter = idx + 1
-            while counter < tokens_len:
-                next_token = normal_tokens[counter]
-                if next_token[1] == RW:
-                    current += next_token[0]
-                else:
-                    break
-                counter += 1
-            skip_counter = counter - idx
-
-            temp = rel_mapping[current.replace(" ", "")](context, temp_date)
-            if isinstance(temp, list):
-                for _temp in temp:
-                    if _temp["y"] > 0 and _temp["m"] > 0 and _temp["d"] > 0:
-                        dates.append(_temp)
-                        temp_date = DateObject(y=0, m=0, d=0)
-                    else:
-                        temp_date["y"] = max(temp_date["y"], _temp["y"])
-                        temp_date["m"] = max(temp_date["m"], _temp["m"])
-                        temp_date["d"] = max(temp_date["d"], _temp["d"])
-                        if temp_date["y"] > 0 and temp_date["m"] > 0 and temp_date["d"] > 0:
-                            dates.append(temp_date)
-                            temp_date = DateObject(y=0, m=0, d=0)
-            else:
-                if temp["y"] > 0 and temp["m"] > 0 and temp["d"] > 0:
-                    dates.append(temp)
-                    temp_date = DateObject(y=0, m=0, d=0)
-                else:
-                    temp_date["y"] = max(temp_date["y"], temp["y"])
-                    temp_date["m"] = max(temp_date["m"], temp["m"])
-                    temp_date["d"] = max(temp_date["d"], temp["d"])
-                    if temp_date["y"] > 0 and temp_date["m"] > 0 and temp_date["d"] > 0:
-                        dates.append(temp_date)
-                        temp_date = DateObject(y=0, m=0, d=0)
-            context = ""
-
-        elif t == SYMB:
-            context += c
-
-    if temp_date["y"] > 0 or temp_date["m"] > 0 or temp_date["d"] > 0:
-        dates.append(temp_date)
-
-    return dates
-
-
-def create_full_dates(dates: list) -> list:
+def create_full_dates(dates: list, today: date) -> list:
     full_dates = []
 
+    # Only dates that exist are returned: 2023년 2월 29일, 13월 or 45일 is no date at all.
     for date_item in dates:
         if date_item["y"] > 0 and date_item["m"] > 0 and date_item["d"] > 0:
-            full_dates.append(date_item)
+            if is_valid_date(date_item["y"], date_item["m"], date_item["d"]):
+                full_dates.append(date_item)
             continue
 
         if date_item["y"] > 0 and date_item["m"] == 0 and date_item["d"] == 0:
-            full_dates.append(DateObject(y=date_item["y"], m=1, d=1))
-            full_dates.append(DateObject(y=date_item["y"], m=12, d=31))
+            if is_valid_date(date_item["y"], 1, 1):
+                full_dates.append(DateObject(y=date_item["y"], m=1, d=1))
+                full_dates.append(DateObject(y=date_item["y"], m=12, d=31))
             continue
 
         if date_item["m"] > 0 and date_item["d"] == 0:
-            year = date_item["y"] if date_item["y"] > 0 else datetime.now(tz=timezone.utc).year
-            relative_date = date(year, date_item["m"], 1)
-            full_dates.append(DateObject(y=relative_date.year, m=relative_date.month, d=relative_date.day))
-            relative_date = relative_date + relativedelta(months=1)
-            relative_date = relative_date.replace(day=1) - relativedelta(days=1)
-            full_dates.append(DateObject(y=relative_date.year, m=relative_date.month, d=relative_date.day))
+            year, month = date_item["y"] if date_item["y"] > 0 else today.year, date_item["m"]
+            if is_valid_date(year, month, 1):
+                full_dates.append(DateObject(y=year, m=month, d=1))
+                full_dates.append(DateObject(y=year, m=month, d=month_end(year, month)))
             continue
 
         if date_item["y"] == 0 and date_item["m"] == 0 and date_item["d"] > 0:
-            today = datetime.now(tz=timezone.utc)
-            full_dates.append(DateObject(y=today.year, m=today.month, d=date_item["d"]))
+            if is_valid_date(today.year, today.month, date_item["d"]):
+                full_dates.append(DateObject(y=today.year, m=today.month, d=date_item["d"]))
             continue
 
     return full_dates
 
 
-def parse(text: str) -> ParseResult:
-    response: ParseResult = {
-        "found_dates": [],
-        "used_tokens": [],
-        "cleaned": ""
-    }
+def collapse_whitespace(text: str) -> str:
+    return " ".join(text.split())
+
+
+def clean_text(text: str, lexicon: Lexicon = DEFAULT_LEXICON) -> str:
+    trace = current_trace()
+    if trace is not None:
+        text = trace.run("collapse_whitespace", collapse_whitespace, text)
+        return trace.run("remove_stopwords", remove_stopwords, text, lexicon)
+
+    return remove_stopwords(collapse_whitespace(text), lexicon)
+
+
+def lean_dates(dates: List[DateObject]) -> DateTuple:
+    return tuple(Date(d["y"], d["m"], d["d"]) for d in dates)
+
+
+def run_pipeline(text: str, today: date, lexicon: Lexicon = DEFAULT_LEXICON,
+                 debug: bool = True) -> Union[ParseResult, DateTuple]:
+    trace = current_trace()
+    if trace is not None:
+        return run_traced_pipeline(text, today, lexicon, trace, debug)
+
+    if not debug:
+        dates = numeric_date(text, lexicon)
+        if dates is not None:
+            return dates
+
+    if not lexicon.may_contain_dates(text):
+        return skip_pipeline(text, lexicon, debug)
+
+    spans = sorted(parse_year(text) + wrap_terms(text, lexicon))
+    tags = tag_chars(text, spans, lexicon)
+    useful_tokens = generate_tokens(tags, text)
+
+    normal_tokens = normalize_chars(useful_tokens, lexicon)
+    dates = find_dates(normal_tokens, today, lexicon)
+    dates = create_full_dates(dates, today)
+
+    if not debug:
+        return lean_dates(dates)
+
+    return ParseResult(found_dates=dates, used_tokens=useful_tokens, cleaned=text)
+
+
+def skip_pipeline(text: str, lexicon: Lexicon = DEFAULT_LEXICON, debug: bool = True) -> Union[ParseResult, DateTuple]:
+    if not debug:
+        return ()
+
+    # With no digit or keyword there are no spans, but the characters are still
+    # tagged so the debug output matches a full run.
+    useful_tokens = generate_tokens(tag_chars(text, [], lexicon), text)
+    return ParseResult(found_dates=[], used_tokens=useful_tokens, cleaned=text)
+
+
+def run_traced_pipeline(text: str, today: date, lexicon: Lexicon, trace: Trace,
+                        debug: bool = True) -> Union[ParseResult, DateTuple]:
+    trace.parses += 1
+    if not lexicon.may_contain_dates(text):
+        trace.skipped += 1
+        return skip_pipeline(text, lexicon, debug)
+
+    spans = sorted(trace.run("parse_year", parse_year, text) + trace.run("wrap_terms", wrap_terms, text, lexicon))
+    tags = trace.run("tag_chars", tag_chars, text, spans, lexicon)
+    useful_tokens = trace.run("generate_tokens", generate_tokens, tags, text)
+    normal_tokens = trace.run("normalize_chars", normalize_chars, useful_tokens, lexicon)
+    dates = trace.run("find_dates", find_dates, normal_tokens, today, lexicon, trace)
+    dates = trace.run("create_full_dates", create_full_dates, dates, today)
+
+    if not debug:
+        return lean_dates(dates)
+
+    return ParseResult(found_dates=dates, used_tokens=useful_tokens, cleaned=text)
 
-    text = " ".join(text.split())
-    text = remove_stopwords(text)
 
-    response["cleaned"] = text
+def parse_cleaned(text: str, today: date, lexicon: Lexicon = DEFAULT_LEXICON,
+                  cache: Optional[ResultCache] = None, debug: bool = True) -> Union[ParseResult, DateTuple]:
+    if cache is None:
+        return run_pipeline(text, today, lexicon, debug)
 
-    text = parse_year(text)
-    text = wrap_terms(text)
-    tokens = list(text)
-    tags = tag_chars(text)
-    useful_tokens = generate_tokens(tags, tokens)
+    result = cache.get(text, today, lexicon)
+    if result is None:
+        result = run_pipeline(text, today, lexicon)
+        cache.put(text, today, lexicon, result)
 
-    response["used_tokens"] = useful_tokens
+    return result if debug else lean_dates(result["found_dates"])
 
-    normal_tokens = normalize_chars(useful_tokens)
-    dates = find_dates(normal_tokens)
-    dates = create_full_dates(dates)
 
-    response["found_dates"] = dates
+def parse(text: str, lexicon: Lexicon = DEFAULT_LEXICON, now: Optional[TimeLike] = None,
+          tz: tzinfo = timezone.utc, cache: Optional[ResultCache] = None,
+          debug: bool = True) -> Union[ParseResult, DateTuple]:
+    """Extract dates from ``text``.
 
-    return response
+    With ``debug=False`` only the dates are returned, as a tuple of immutable
+    ``Date(y, m, d)`` values, without the tagged tokens and cleaned text.
+    """
+    return parse_cleaned(clean_text(text, lexicon), reference_date(now, tz), lexicon, cache, debug)
@@ -1,2 +1,3 @@
 RE_IS_DIGIT = r'^-?\d+$'
-RE_HAS_DIGIT_AND_CHAR = r'(?=.*\d)(?=.*\D)'
\ No newline at end of file
+RE_HAS_DIGIT_AND_CHAR = r'(?=.*\d)(?=.*\D)'
+RE_YEAR = r'\d{4}(?!\d)'
@@ -0,0 +1,86 @@
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Union
+
+ClosureSpec = Union[str, Callable]
+
+
+class LazyClosures(Mapping):
+    """Read-only mapping of keywords to closures that imports each closure on first lookup.
+
+    Values are callables or ``"package:name"`` strings; a bare ``"name"`` is
+    looked up in ``package``. Resolving an entry does not change what the mapping
+    holds, only how fast later lookups are; threads resolving the same key at once
+    store the same closure.
+    """
+
+    __slots__ = ("_specs", "_closures")
+
+    def __init__(self, specs: Mapping[str, ClosureSpec], package: Optional[str] = None):
+        self._specs: Dict[str, ClosureSpec] = {
+            key: f"{package}:{spec}" if isinstance(spec, str) and ":" not in spec else spec
+            for key, spec in specs.items()
+        }
+        self._closures: Dict[str, Callable] = {}
+
+    def __getitem__(self, key: str) -> Callable:
+        try:
+            return self._closures[key]
+        except KeyError:
+            return self._resolve(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, key) -> bool:
+        return key in self._specs
+
+    def specs(self) -> Dict[str, ClosureSpec]:
+        """The entries as given, without importing anything."""
+        return dict(self._specs)
+
+    def _resolve(self, key: str) -> Callable:
+        spec = self._specs[key]
+        if isinstance(spec, str):
+            package, _, name = spec.partition(":")
+            closure = getattr(import_module(package), name)
+            if isinstance(closure, ModuleType):
+                # The submodule of an exported function, bound by a direct import of it.
+                closure = export(package, name)
+        else:
+            closure = spec
+
+        self._closures[key] = closure
+        return closure
+
+
+def closure_specs(closures: Mapping[str, ClosureSpec]) -> Dict[str, ClosureSpec]:
+    return closures.specs() if isinstance(closures, LazyClosures) else dict(closures)
+
+
+def export(package: str, name: str) -> Callable:
+    """Function ``name`` of the submodule ``package.name``, bound on the package in place of the submodule."""
+    closure = getattr(import_module(f"{package}.{name}"), name)
+    setattr(sys.modules[package], name, closure)
+    return closure
+
+
+def lazy_exports(package: str, exports: Iterable[str]) -> Callable[[str], Any]:
+    """Module ``__getattr__`` for ``package`` exporting one function per submodule of the same name.
+
+    The submodule is imported on first access; its function is then bound on the
+    package, so later accesses do not go through ``__getattr__``.
+    """
+    exports = frozenset(exports)
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        return export(package, name)
+
+    return __getattr__
@@ -1,16 +1,12 @@
 from dateparser_ko.types import DateObject
-from typing import List
-from datetime import datetime, timezone
+from typing import List, Optional
+from datetime import date
 
 
-def first_half(context: str, temp_date: DateObject) -> List[DateObject]:
-    year = temp_date["y"] if temp_date["y"] > 0 else datetime.now(tz=timezone.utc)
-    try:
-        int_context = int(context)
-        if int_context > 1000:
-            year = int_context
-    except Exception as _:
-        pass
+def first_half(count: Optional[int], temp_date: DateObject, today: date) -> List[DateObject]:
+    year = temp_date["y"] if temp_date["y"] > 0 else today.year
+    if count is not None and count > 1000:
+        year = count
 
     start_date = DateObject(y=year, m=1, d=1)
     end_date = DateObject(y=year, m=5, d=31)
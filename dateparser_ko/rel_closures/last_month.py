@@ -1,10 +1,11 @@
-from dateutil.relativedelta import relativedelta
-from datetime import datetime, timezone
+from dateparser_ko.calendar_math import add_months
+from datetime import date
 from dateparser_ko.types import DateObject
+from typing import Optional
 
 
-def last_month(context: str, temp_date: DateObject) -> DateObject:
-    temp = (datetime.now(tz=timezone.utc) - relativedelta(months=1))
+def last_month(count: Optional[int], temp_date: DateObject, today: date) -> DateObject:
+    y, m = add_months(today.year, today.month, -1)
 
-    date_obj = DateObject(y=temp.year, m=temp.month, d=0)
+    date_obj = DateObject(y=y, m=m, d=0)
     return date_obj
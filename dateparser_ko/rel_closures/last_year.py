@@ -1,6 +1,7 @@
 from dateparser_ko.types import DateObject
-from datetime import datetime, timezone
+from datetime import date
+from typing import Optional
 
 
-def last_year(context: str, temp_date: DateObject) -> DateObject:
-    return DateObject(y=datetime.now(tz=timezone.utc).year - 1, m=0, d=0)
+def last_year(count: Optional[int], temp_date: DateObject, today: date) -> DateObject:
+    return DateObject(y=today.year - 1, m=0, d=0)
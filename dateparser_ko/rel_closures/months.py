@@ -1,27 +1,32 @@
-from dateutil.relativedelta import relativedelta
+from dateparser_ko.calendar_math import add_months, can_add_months, is_valid_date, month_end
 from dateparser_ko.types import DateObject
-from datetime import datetime, timezone, date
-from typing import List
+from datetime import date
+from typing import List, Optional
 
 
-def months(context: str, temp_date: DateObject) -> List[DateObject]:
-    today = datetime.now(tz=timezone.utc)
+def months(count: Optional[int], temp_date: DateObject, today: date) -> List[DateObject]:
+    if count is None:
+        return []
 
+    # Counts that leave the calendar ("20240615개월") give no date.
     if temp_date["y"] == 0 and temp_date["m"] == 0 and temp_date["d"] == 0:
-        _end_date = today.replace(day=1) - relativedelta(days=1)
-        end_date = DateObject(y=_end_date.year, m=_end_date.month, d=_end_date.day)
-        relative_date = _end_date - relativedelta(months=int(context)) + relativedelta(months=1)
-        start_date = DateObject(y=relative_date.year, m=relative_date.month, d=1)
+        if not can_add_months(today.year, today.month, -count):
+            return []
+        end_y, end_m = add_months(today.year, today.month, -1)
+        end_date = DateObject(y=end_y, m=end_m, d=month_end(end_y, end_m))
+        start_y, start_m = add_months(today.year, today.month, -count)
+        start_date = DateObject(y=start_y, m=start_m, d=1)
         return [start_date, end_date]
 
     else:
-        given_date = date(
+        y, m, d = (
             temp_date["y"] if temp_date["y"] > 0 else today.year,
             temp_date["m"] if temp_date["m"] > 0 else today.month,
             temp_date["d"] if temp_date["d"] > 0 else 1
         )
-        start_date = DateObject(y=given_date.year, m=given_date.month, d=given_date.day)
-        relative_date = given_date + relativedelta(months=int(context))
-        relative_date = relative_date.replace(day=1) - relativedelta(days=1)
-        end_date = DateObject(y=relative_date.year, m=relative_date.month, d=relative_date.day)
+        if not is_valid_date(y, m, d) or not can_add_months(y, m, count - 1):
+            return []
+        start_date = DateObject(y=y, m=m, d=d)
+        end_y, end_m = add_months(y, m, count - 1)
+        end_date = DateObject(y=end_y, m=end_m, d=month_end(end_y, end_m))
         return [start_date, end_date]
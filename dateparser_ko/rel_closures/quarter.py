@@ -1,31 +1,16 @@
+from dateparser_ko.calendar_math import quarter_range
 from dateparser_ko.types import DateObject
-from typing import List
-from datetime import datetime, timezone
+from typing import List, Optional
+from datetime import date
 
 
-def quarter(context: str, temp_date: DateObject) -> List[DateObject]:
-    year = temp_date["y"] if temp_date["y"] > 0 else datetime.now(tz=timezone.utc).year
+def quarter(count: Optional[int], temp_date: DateObject, today: date) -> List[DateObject]:
+    year = temp_date["y"] if temp_date["y"] > 0 else today.year
 
-    try:
-        int_context = int(context)
-        if int_context == 1:
-            start_date = DateObject(y=year, m=1, d=1)
-            end_date = DateObject(y=year, m=3, d=31)
-            return [start_date, end_date]
-        elif int_context == 2:
-            start_date = DateObject(y=year, m=4, d=1)
-            end_date = DateObject(y=year, m=6, d=30)
-            return [start_date, end_date]
-        elif int_context == 3:
-            start_date = DateObject(y=year, m=7, d=1)
-            end_date = DateObject(y=year, m=9, d=30)
-            return [start_date, end_date]
-        elif int_context == 4:
-            start_date = DateObject(y=year, m=10, d=1)
-            end_date = DateObject(y=year, m=12, d=31)
-            return [start_date, end_date]
+    if count is None or not 1 <= count <= 4:
+        return []
 
-    except Exception as _:
-        pass
-
-    return []
+    (start_y, start_m, start_d), (end_y, end_m, end_d) = quarter_range(year, count)
+    start_date = DateObject(y=start_y, m=start_m, d=start_d)
+    end_date = DateObject(y=end_y, m=end_m, d=end_d)
+    return [start_date, end_date]
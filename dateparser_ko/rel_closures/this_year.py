@@ -1,7 +1,7 @@
 from dateparser_ko.types import DateObject
-from datetime import datetime, timezone
+from datetime import date
+from typing import Optional
 
 
-def this_year(context: str, temp_date: DateObject) -> DateObject:
-    today = datetime.now(tz=timezone.utc)
+def this_year(count: Optional[int], temp_date: DateObject, today: date) -> DateObject:
     return DateObject(y=today.year, m=0, d=0)
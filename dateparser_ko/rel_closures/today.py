@@ -1,7 +1,7 @@
 from dateparser_ko.types import DateObject
-from datetime import datetime, timezone
+from datetime import date
+from typing import Optional
 
 
-def today(context: str, temp_date: DateObject) -> DateObject:
-    today_date = datetime.now(tz=timezone.utc)
-    return DateObject(y=today_date.year, m=today_date.month, d=today_date.day)
+def today(count: Optional[int], temp_date: DateObject, today: date) -> DateObject:
+    return DateObject(y=today.year, m=today.month, d=today.day)
@@ -1,27 +1,30 @@
-from dateutil.relativedelta import relativedelta
+from dateparser_ko.calendar_math import add_months, can_add_months, is_valid_date, month_end
 from dateparser_ko.types import DateObject
-from datetime import datetime, timezone, date
-from typing import List
+from datetime import date
+from typing import List, Optional
 
 
-def years(context: str, temp_date: DateObject) -> List[DateObject]:
-    today = datetime.now(tz=timezone.utc)
+def years(count: Optional[int], temp_date: DateObject, today: date) -> List[DateObject]:
+    if count is None:
+        return []
 
+    # Counts that leave the calendar ("199992024개년") give no date.
     if temp_date["y"] == 0 and temp_date["m"] == 0 and temp_date["d"] == 0:
-        _end_date = today.replace(month=1, day=1) - relativedelta(days=1)
-        end_date = DateObject(y=_end_date.year, m=_end_date.month, d=_end_date.day)
-        relative_date = _end_date - relativedelta(years=int(context)) + relativedelta(years=1)
-        start_date = DateObject(y=relative_date.year, m=1, d=1)
+        if not is_valid_date(today.year - count, 1, 1):
+            return []
+        end_date = DateObject(y=today.year - 1, m=12, d=31)
+        start_date = DateObject(y=today.year - count, m=1, d=1)
         return [start_date, end_date]
 
     else:
-        given_date = date(
+        y, m, d = (
             temp_date["y"] if temp_date["y"] > 0 else today.year,
             temp_date["m"] if temp_date["m"] > 0 else 1,
             temp_date["d"] if temp_date["d"] > 0 else 1
         )
-        start_date = DateObject(y=given_date.year, m=given_date.month, d=given_date.day)
-        relative_date = given_date + relativedelta(years=int(context))
-        relative_date = relative_date.replace(day=1) - relativedelta(days=1)
-        end_date = DateObject(y=relative_date.year, m=relative_date.month, d=relative_date.day)
+        if not is_valid_date(y, m, d) or not can_add_months(y, m, count * 12 - 1):
+            return []
+        start_date = DateObject(y=y, m=m, d=d)
+        end_y, end_m = add_months(y, m, count * 12 - 1)
+        end_date = DateObject(y=end_y, m=end_m, d=month_end(end_y, end_m))
         return [start_date, end_date]
@@ -1,23 +1,27 @@
-from dateutil.relativedelta import relativedelta
+from dateparser_ko.calendar_math import can_add_months, is_valid_date, month_end, shift_years
 from dateparser_ko.types import DateObject
-from datetime import datetime, timezone, date
-from typing import List
+from datetime import date
+from typing import List, Optional
 
 
-def years_ago(context: str, temp_date: DateObject) -> List[DateObject]:
+def years_ago(count: Optional[int], temp_date: DateObject, today: date) -> List[DateObject]:
+    if count is None:
+        return []
+
     ret: List[DateObject] = []
 
-    today = datetime.now(tz=timezone.utc)
-    end_date = date(
+    y, m, d = (
         temp_date["y"] if temp_date["y"] > 0 else today.year,
         temp_date["m"] if temp_date["m"] > 0 else 1,
         temp_date["d"] if temp_date["d"] > 0 else 1,
     )
-    start_date = end_date - relativedelta(years=int(context))
-    ret.append(DateObject(y=start_date.year, m=start_date.month, d=start_date.day))
+    # Counts that leave the calendar ("199992024년전") give no date.
+    if not is_valid_date(y, m, d) or not can_add_months(y, m, -count * 12):
+        return []
+    y, m, d = shift_years(y, m, d, -count)
+    ret.append(DateObject(y=y, m=m, d=d))
 
     if temp_date["d"] == 0:
-        end_date = start_date + relativedelta(months=1) - relativedelta(days=1)
-        ret.append(DateObject(y=end_date.year, m=end_date.month, d=end_date.day))
+        ret.append(DateObject(y=y, m=m, d=month_end(y, m)))
 
     return ret
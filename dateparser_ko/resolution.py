@@ -0,0 +1,55 @@
+from datetime import date
+from threading import Lock
+from typing import Callable, Dict, Union, List
+
+from .types import DateObject
+
+MAX_TABLES = 64
+
+_tables: Dict[tuple, "ResolutionTable"] = {}
+_lock = Lock()
+
+
+class ResolutionTable:
+    """Results of the keywords that depend only on the reference date, for one date.
+
+    Each keyword is resolved once and stored as plain tuples; every lookup hands
+    out fresh DateObject dicts, since find_dates and callers may modify them.
+    Threads missing the same keyword at once both resolve it and store equal entries.
+    """
+
+    __slots__ = ("today", "_entries")
+
+    def __init__(self, today: date):
+        self.today = today
+        self._entries: Dict[str, tuple] = {}
+
+    def resolve(self, keyword: str, closure: Callable) -> Union[DateObject, List[DateObject]]:
+        entry = self._entries.get(keyword)
+        if entry is None:
+            result = closure(None, DateObject(y=0, m=0, d=0), self.today)
+            if isinstance(result, list):
+                entry = (True, tuple((d["y"], d["m"], d["d"]) for d in result))
+            else:
+                entry = (False, ((result["y"], result["m"], result["d"]),))
+            self._entries[keyword] = entry
+
+        is_list, values = entry
+        if is_list:
+            return [DateObject(y=y, m=m, d=d) for y, m, d in values]
+
+        y, m, d = values[0]
+        return DateObject(y=y, m=m, d=d)
+
+
+def resolution_table(lexicon, today: date) -> ResolutionTable:
+    """Shared table for ``lexicon`` on ``today``; tables of the least recently created dates are dropped."""
+    key = (lexicon, today)
+    with _lock:
+        table = _tables.get(key)
+        if table is None:
+            while len(_tables) >= MAX_TABLES:
+                del _tables[next(iter(_tables))]
+            table = _tables[key] = ResolutionTable(today)
+
+    return table
@@ -0,0 +1,271 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date, timezone, tzinfo
+from typing import Dict, List, Optional, Tuple
+
+from .batch import parse_many
+from .cli import _parse_now, _parse_tz
+from .clock import reference_date
+from .parse import parse
+
+WINDOW_MS = 2.0
+MAX_BATCH = 512
+MAX_BODY_BYTES = 8 << 20
+LATENCY_SAMPLES = 10000
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+
+class MicroBatcher:
+    """Collects texts from concurrent requests and parses them together.
+
+    A batch is sent to the executor when ``window`` seconds have passed since its
+    first text arrived or when it holds ``max_batch`` texts, whichever is first.
+    """
+
+    def __init__(self, executor: Optional[Executor], window: float = WINDOW_MS / 1000, max_batch: int = MAX_BATCH):
+        self.executor = executor
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.texts = 0
+        self._pending: List[Tuple[List[str], date, asyncio.Future]] = []
+        self._size = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, texts: List[str], today: date) -> list:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((texts, today, future))
+        self._size += len(texts)
+        if self._size >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        groups: Dict[date, list] = {}
+        for item in self._pending:
+            groups.setdefault(item[1], []).append(item)
+        self._pending = []
+        self._size = 0
+
+        for today, items in groups.items():
+            asyncio.ensure_future(self._run(today, items))
+
+    async def _run(self, today: date, items: list):
+        texts = [text for item_texts, _, _ in items for text in item_texts]
+        self.batches += 1
+        self.texts += len(texts)
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, parse_batch, texts, today)
+        except Exception as e:
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        start = 0
+        for item_texts, _, future in items:
+            if not future.done():
+                future.set_result(results[start:start + len(item_texts)])
+            start += len(item_texts)
+
+
+def parse_batch(texts: List[str], today: date) -> list:
+    """Dates of every text as ``[y, m, d]`` lists, or an error message string for texts that fail."""
+    try:
+        results = parse_many(texts, now=today, debug=False)
+    except Exception:
+        results = []
+        for text in texts:
+            try:
+                results.append(parse(text, now=today, debug=False))
+            except Exception as e:
+                results.append(f"{type(e).__name__}: {e}")
+
+    return [result if isinstance(result, str) else [list(d) for d in result] for result in results]
+
+
+class DateServer:
+    """HTTP/1.1 front end: ``POST /parse`` with ``{"text": ...}`` or ``{"texts": [...]}``, ``GET /health``."""
+
+    def __init__(self, batcher: MicroBatcher, tz: tzinfo, workers: int):
+        self.batcher = batcher
+        self.tz = tz
+        self.workers = workers
+        self.requests = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.started = time.monotonic()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "malformed request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "malformed Content-Length"}, False)
+                    break
+                if length < 0:
+                    await self._respond(writer, 400, {"error": "negative Content-Length"}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": f"body exceeds {MAX_BODY_BYTES} bytes"}, False)
+                    break
+
+                body = await reader.readexactly(length) if length else b""
+                started = time.perf_counter()
+                status, payload = await self.route(method, path.split("?", 1)[0], body)
+                if path.startswith("/parse"):
+                    self.requests += 1
+                    self.errors += status != 200
+                    self.latencies.append(time.perf_counter() - started)
+
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, method: str, path: str, body: bytes) -> Tuple[int, dict]:
+        if path == "/health":
+            return (200, self.metrics()) if method == "GET" else (405, {"error": "use GET"})
+        if path != "/parse":
+            return 404, {"error": f"no route for {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+
+        try:
+            request = json.loads(body)
+            today = reference_date(_parse_now(request.get("now")),
+                                   _parse_tz(request["tz"]) if "tz" in request else self.tz)
+            texts = request["texts"] if "texts" in request else [request["text"]]
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                raise TypeError("text and texts must be strings")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return 400, {"error": f"invalid request: {e}"}
+
+        try:
+            results = await self.batcher.submit(texts, today)
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+        if "texts" in request:
+            return 200, {"results": [_as_json(result) for result in results]}
+
+        result = _as_json(results[0])
+        return (422 if "error" in result else 200), result
+
+    def metrics(self) -> dict:
+        samples = sorted(self.latencies)
+
+        def percentile(q: float) -> float:
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))] * 1000, 3) if samples else 0.0
+
+        return {
+            "status": "ok",
+            "uptime_s": round(time.monotonic() - self.started, 1),
+            "workers": self.workers,
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": self.batcher.batches,
+            "texts": self.batcher.texts,
+            "mean_batch_size": round(self.batcher.texts / self.batcher.batches, 2) if self.batcher.batches else 0.0,
+            "latency_ms": {"p50": percentile(0.5), "p90": percentile(0.9), "p99": percentile(0.99),
+                           "max": percentile(1.0)}
+        }
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+def _as_json(result) -> dict:
+    if isinstance(result, str):
+        return {"error": result}
+    return {"found_dates": [{"y": y, "m": m, "d": d} for y, m, d in result]}
+
+
+async def start(host: str = "127.0.0.1", port: int = 8080, workers: int = 1, window_ms: float = WINDOW_MS,
+                max_batch: int = MAX_BATCH, tz: Optional[tzinfo] = None) -> Tuple[asyncio.AbstractServer, DateServer]:
+    """Start serving on ``host:port``; ``workers=0`` parses on the loop's default thread pool."""
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    batcher = MicroBatcher(executor, window_ms / 1000, max_batch)
+    app = DateServer(batcher, tz or timezone.utc, workers)
+
+    # Start the workers and load the parser in each before taking traffic.
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(executor, parse_batch, ["2024년 3월 지난달"], date.today())
+                           for _ in range(max(workers, 1))))
+
+    server = await asyncio.start_server(app.handle, host, port)
+    return server, app
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="dateparser-ko serve", description="한글 날짜 추출 HTTP 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="port to bind (default: 8080)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="worker processes; 0 parses in threads of the server process (default: 1)")
+    parser.add_argument("--window-ms", type=float, default=WINDOW_MS,
+                        help=f"how long to collect requests into one batch (default: {WINDOW_MS})")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH,
+                        help=f"texts that flush a batch early (default: {MAX_BATCH})")
+    parser.add_argument("--tz", default="UTC", help="timezone of requests without one (default: UTC)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    async def run():
+        server, _ = await start(args.host, args.port, args.workers, args.window_ms, args.max_batch,
+                                _parse_tz(args.tz))
+        print(f"listening on http://{args.host}:{server.sockets[0].getsockname()[1]}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+    return 0
@@ -0,0 +1,89 @@
+import csv
+import json
+from datetime import timezone, tzinfo
+from itertools import tee
+from typing import Iterable, Iterator, Optional, Tuple, Any, Union
+
+from .batch import parse_many
+from .cache import ResultCache
+from .clock import TimeLike
+from .lexicon import Lexicon, DEFAULT_LEXICON
+from .types import StreamResult
+
+
+def parse_stream(texts: Iterable[str], lexicon: Lexicon = DEFAULT_LEXICON, now: Optional[TimeLike] = None,
+                 tz: tzinfo = timezone.utc, cache: Optional[ResultCache] = None) -> Iterator[StreamResult]:
+    """Yield ``StreamResult(index, result)`` for each text, one at a time."""
+    return parse_records(enumerate(texts), lexicon, now, tz, cache)
+
+
+def parse_records(records: Iterable[Tuple[Any, str]], lexicon: Lexicon = DEFAULT_LEXICON,
+                  now: Optional[TimeLike] = None, tz: tzinfo = timezone.utc,
+                  cache: Optional[ResultCache] = None) -> Iterator[StreamResult]:
+    """Yield ``StreamResult(record_id, result)`` for ``(record_id, text)`` pairs.
+
+    The whole stream is parsed against one reference date and memory use does
+    not grow with the number of records. Every record gets its own result, even
+    when its text repeats an earlier one.
+    """
+    id_records, text_records = tee(records)
+    results = parse_many((text for _, text in text_records), lexicon, now, tz, cache, lazy=True)
+    for (record_id, _), result in zip(id_records, results):
+        yield StreamResult(record_id, result)
+
+
+def parse_text_file(path: str, encoding: str = "utf-8", **kwargs) -> Iterator[StreamResult]:
+    """Parse a text file line by line; record ids are 1-based line numbers."""
+    with open(path, encoding=encoding) as f:
+        yield from parse_records(((i, line.rstrip("\r\n")) for i, line in enumerate(f, 1)), **kwargs)
+
+
+def parse_jsonl(path: str, field: str, id_field: Optional[str] = None, encoding: str = "utf-8",
+                **kwargs) -> Iterator[StreamResult]:
+    """Parse ``field`` of every JSON Lines record.
+
+    Record ids are taken from ``id_field`` when given, otherwise they are line
+    numbers. Blank lines are skipped and a missing field is parsed as "".
+    """
+    def records(f):
+        for i, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield record.get(id_field) if id_field is not None else i, _as_text(record.get(field))
+
+    with open(path, encoding=encoding) as f:
+        yield from parse_records(records(f), **kwargs)
+
+
+def parse_csv(path: str, column: Union[str, int], id_column: Union[str, int, None] = None, encoding: str = "utf-8",
+              csv_options: Optional[dict] = None, **kwargs) -> Iterator[StreamResult]:
+    """Parse one column of a CSV file.
+
+    Columns given by name are read through the header row, columns given by
+    index are read from every row. Record ids are taken from ``id_column`` when
+    given, otherwise they are the row's line number in the file.
+    """
+    def records(f):
+        if isinstance(column, int):
+            reader = csv.reader(f, **(csv_options or {}))
+        else:
+            reader = csv.DictReader(f, **(csv_options or {}))
+
+        for row in reader:
+            record_id = reader.line_num if id_column is None else _cell(row, id_column)
+            yield record_id, _as_text(_cell(row, column))
+
+    with open(path, encoding=encoding, newline="") as f:
+        yield from parse_records(records(f), **kwargs)
+
+
+def _cell(row: Union[list, dict], column: Union[str, int]) -> Any:
+    if isinstance(row, dict):
+        return row.get(column)
+
+    return row[column] if column < len(row) else None
+
+
+def _as_text(value: Any) -> str:
+    return "" if value is None else str(value)
@@ -4,4 +4,5 @@ RW = "RW"
 SYMB = "SYMB"
 PAD = "<PAD>"
 YEAR = "YEAR"
-TERM = "TERM"
\ No newline at end of file
+TERM = "TERM"
+COUNTER = "COUNTER"
\ No newline at end of file
@@ -0,0 +1,65 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+END = None
+
+
+def compile_terms(keywords: Iterable[str]) -> Dict:
+    trie = {}
+    for keyword in keywords:
+        chars = keyword.replace(" ", "")
+        node = trie
+        for c in chars:
+            node = node.setdefault(c, {})
+        node[END] = len(chars)
+
+    return trie
+
+
+def find_terms(text: str, trie: Dict, accept: Optional[Callable[[int, int], bool]] = None) -> List[Tuple[int, int]]:
+    """Keyword occurrences as (start, end) pairs; ``accept`` can veto a match before it claims its characters."""
+    text_len = len(text)
+
+    # A keyword may be split by one space ("지난 달"). Without the space it must be
+    # followed by a space or the end of the text to count as a term.
+    candidates: Dict[int, List[Tuple[int, int]]] = {}
+    for i, c in enumerate(text):
+        node = trie.get(c)
+        if node is None:
+            continue
+
+        j = i + 1
+        spaced = False
+        while True:
+            size = node.get(END)
+            if size is not None and (spaced or j == text_len or text[j] == " "):
+                candidates.setdefault(size, []).append((i, j))
+
+            if j == text_len:
+                break
+
+            ch = text[j]
+            if ch == " ":
+                if spaced or j + 1 == text_len:
+                    break
+                spaced = True
+                j += 1
+                ch = text[j]
+
+            node = node.get(ch)
+            if node is None:
+                break
+            j += 1
+
+    # Longer keywords claim their characters first, then shorter ones fill the gaps
+    # from left to right.
+    taken = bytearray(text_len)
+    spans = []
+    for size in sorted(candidates, reverse=True):
+        for start, end in candidates[size]:
+            if any(taken[start:end]) or (accept is not None and not accept(start, end)):
+                continue
+            taken[start:end] = b"\x01" * (end - start)
+            spans.append((start, end))
+
+    spans.sort()
+    return spans
@@ -0,0 +1,62 @@
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Callable, Optional
+
+_current: ContextVar[Optional["Trace"]] = ContextVar("dateparser_ko_trace", default=None)
+
+
+class Trace:
+    """Per-stage wall time, sizes and call counts for the parses run inside it.
+
+    Used as a context manager; parses outside any trace only pay for one
+    context variable lookup.
+    """
+
+    def __init__(self):
+        self.parses = 0
+        self.skipped = 0
+        self.stages = defaultdict(lambda: {"calls": 0, "seconds": 0.0, "input_size": 0, "output_size": 0})
+        self.closures = defaultdict(Counter)
+        self._token = None
+
+    def __enter__(self) -> "Trace":
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _current.reset(self._token)
+        self._token = None
+
+    def run(self, stage: str, func: Callable, *args):
+        """Call ``func(*args)`` and record it under ``stage``; sizes are the lengths of the first argument and result."""
+        start = perf_counter()
+        result = func(*args)
+        seconds = perf_counter() - start
+
+        stats = self.stages[stage]
+        stats["calls"] += 1
+        stats["seconds"] += seconds
+        stats["input_size"] += len(args[0])
+        stats["output_size"] += len(result)
+        return result
+
+    def closure(self, group: str, closure: Callable):
+        self.closures[group][closure.__name__] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "parses": self.parses,
+            "skipped": self.skipped,
+            "skip_fraction": self.skipped / self.parses if self.parses else 0.0,
+            "stages": {stage: dict(stats) for stage, stats in self.stages.items()},
+            "closures": {group: dict(counts) for group, counts in self.closures.items()}
+        }
+
+
+def trace() -> Trace:
+    return Trace()
+
+
+def current_trace() -> Optional[Trace]:
+    return _current.get()
@@ -1,4 +1,10 @@
-from typing import TypedDict, List
+from typing import TypedDict, List, NamedTuple, Any, Tuple
+
+
+class DateObject(TypedDict):
+    y: int
+    m: int
+    d: int
 
 
 class ParseResult(TypedDict):
@@ -7,7 +13,29 @@ class ParseResult(TypedDict):
     cleaned: str
 
 
-class DateObject(TypedDict):
+class Date(NamedTuple):
+    y: int
+    m: int
+    d: int
+
+
+DateTuple = Tuple[Date, ...]
+
+
+class DocumentDate(NamedTuple):
     y: int
     m: int
     d: int
+    start: int
+    end: int
+
+
+class Span(NamedTuple):
+    start: int
+    end: int
+    kind: str
+
+
+class StreamResult(NamedTuple):
+    record_id: Any
+    result: ParseResult
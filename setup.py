@@ -7,4 +7,11 @@ setup(
     packages=find_packages(),
     python_requires=">=3.10",
     install_requires=[],
+    extras_require={
+        "numpy": ["numpy"],
+        "pandas": ["pandas"]
+    },
+    entry_points={
+        "console_scripts": ["dateparser-ko=dateparser_ko.cli:main"]
+    },
 )